@@ -3,78 +3,29 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from config import Config
+from app.utils.db_routing import RoutingSession
 import logging
-import sys
-from sqlalchemy import inspect
+import os
 from flask_cors import CORS
-import logging
 import mimetypes
 
-mimetypes.init()
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize extensions
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 migrate = Migrate()
 jwt = JWTManager()
 
-
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-def check_db_initialized(db_instance):
+def create_app(config_class=None):
     """
-    Check if the database has been initialized with basic data.
-    
-    Args:
-        db_instance: SQLAlchemy instance
-        
-    Returns:
-        bool: True if database is initialized, False otherwise
+    Create and configure the Flask application.
+
+    Importing this package has no side effects; process-wide setup (logging,
+    mimetypes, the upload folder) happens here. Entry points such as run.py
+    create the module-level app.
     """
-    try:
-        # First check if tables exist
-        inspector = inspect(db_instance.engine)
-        required_tables = ['roles', 'users', 'permissions', 'environments']
-        existing_tables = inspector.get_table_names()
-        
-        if not all(table in existing_tables for table in required_tables):
-            logger.info("Not all required tables exist")
-            return False
-        
-        # Import models here to avoid circular imports
-        from app.models.user import User
-        from app.models.role import Role
-        
-        # Check if admin role exists
-        admin_role = Role.query.filter_by(is_super_user=True).first()
-        if not admin_role:
-            logger.info("Admin role does not exist")
-            return False
-        
-        # Check if admin user exists
-        admin_user = User.query.filter_by(role_id=admin_role.id).first()
-        if not admin_user:
-            logger.info("Admin user does not exist")
-            return False
-        
-        logger.info("Database is properly initialized")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error checking database initialization: {str(e)}")
-        return False
+    mimetypes.init()
 
-def create_app(config_class=None):
-    """Create and configure the Flask application."""
     app = Flask(__name__)
     CORS(app, resources={
         r"/api/*": {
@@ -87,7 +38,7 @@ def create_app(config_class=None):
             "Access-Control-Allow-Credentials"
         ],
         "supports_credentials": True,
-        "expose_headers": ["Content-Type", "Authorization"]
+        "expose_headers": ["Content-Type", "Authorization", "X-Last-Write"]
         }
     })
     
@@ -98,12 +49,45 @@ def create_app(config_class=None):
         
         # Load configuration
         app.config.from_object(config_class)
+
+        from app.utils.logging_config import setup_logging
+        setup_logging(app.config)
+
+        from app.utils.json_provider import init_json_provider
+        init_json_provider(app)
+
+        upload_folder = app.config.get('UPLOAD_FOLDER')
+        if upload_folder:
+            os.makedirs(upload_folder, exist_ok=True)
+
+        # Time pool checkouts for the admin pool metrics endpoint
+        from app.utils.db_pool import instrument_engine_options
+        instrument_engine_options(app.config)
         
         # Initialize extensions
         db.init_app(app)
         migrate.init_app(app, db)
         jwt.init_app(app)
 
+        # Registered first so its after_request hook runs last
+        from app.utils.compression import init_compression
+        init_compression(app)
+
+        from app.utils.db_routing import init_replica_routing
+        init_replica_routing(app, db)
+
+        from app.utils.query_stats import init_query_stats
+        init_query_stats(app)
+
+        from app.utils.metrics import init_metrics
+        init_metrics(app)
+
+        from app.utils.slow_query_log import init_slow_query_log
+        init_slow_query_log(app, db)
+
+        from app.utils.profiler import init_profiler
+        init_profiler(app)
+
         with app.app_context():
             # Import models
             from app.models import (
@@ -120,34 +104,15 @@ def create_app(config_class=None):
             from management.commands import register_commands
             register_commands(app)
 
-            # Initialize database if needed
-            if not check_db_initialized(db):
-                logger.info("Database not initialized. Starting initial setup...")
-                db.create_all()
-                
-                from management.db_init import DatabaseInitializer
-                initializer = DatabaseInitializer(app)
-                success, error = initializer.init_db()
-                    
-                if not success:
-                    logger.error(f"Failed to initialize admin user: {error}")
-                    print("❌ Failed to initialize admin user. Please run 'flask database init'")
-                    
-            else:
-                logger.info("Database already initialized")
-                
+            # Spans for views, controllers, services and SQL (TRACING_ENABLED)
+            from app.utils.tracing import init_tracing
+            init_tracing(app, db)
+
+            # Schema and seed data are created by 'flask db upgrade' and
+            # 'flask database init'; booting a worker runs no queries.
         logger.info("✅ Application initialized successfully")
         return app
         
     except Exception as e:
         logger.error(f"❌ Application initialization failed: {str(e)}")
         raise
-
-# Optional: Create the application instance
-app = create_app()
-
-# Register CLI commands with the application instance
-if app is not None:
-    with app.app_context():
-        from management.commands import register_commands
-        register_commands(app)
\ No newline at end of file
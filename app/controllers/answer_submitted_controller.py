@@ -121,7 +121,7 @@ class AnswerSubmittedController:
                     filters['environment_id'] = user.environment_id
                 else:
                     # Regular users can only see their own submissions
-                    filters['submitted_by'] = user.username
+                    filters['submitted_by_id'] = user.id
 
             answers = AnswerSubmittedService.get_all_answers_submitted(filters)
             return [answer.to_dict() for answer in answers if answer]
@@ -147,7 +147,7 @@ class AnswerSubmittedController:
             # Access control
             if current_user and user_role != RoleType.ADMIN:
                 if user_role in [RoleType.SITE_MANAGER, RoleType.SUPERVISOR]:
-                    if answer.form_submission.form.creator.environment_id != user.environment_id:
+                    if answer.form_submission.environment_id != user.environment_id:
                         return None, "Unauthorized access"
                 elif answer.form_submission.submitted_by != current_user:
                     return None, "Unauthorized access"
@@ -184,7 +184,7 @@ class AnswerSubmittedController:
             # Access control
             if current_user and user_role != RoleType.ADMIN:
                 if user_role in [RoleType.SITE_MANAGER, RoleType.SUPERVISOR]:
-                    if submission.form.creator.environment_id != user.environment_id:
+                    if submission.environment_id != user.environment_id:
                         return [], "Unauthorized access"
                 elif submission.submitted_by != current_user:
                     return [], "Unauthorized access"
@@ -227,7 +227,7 @@ class AnswerSubmittedController:
             # Access control
             if current_user and user_role != RoleType.ADMIN:
                 if user_role in [RoleType.SITE_MANAGER, RoleType.SUPERVISOR]:
-                    if current_answer.form_submission.form.creator.environment_id != user.environment_id:
+                    if current_answer.form_submission.environment_id != user.environment_id:
                         return None, "Unauthorized access"
                 elif current_answer.form_submission.submitted_by != current_user:
                     return None, "Unauthorized access"
@@ -278,7 +278,7 @@ class AnswerSubmittedController:
             # Access control
             if current_user and user_role != RoleType.ADMIN:
                 if user_role in [RoleType.SITE_MANAGER, RoleType.SUPERVISOR]:
-                    if answer.form_submission.form.creator.environment_id != user.environment_id:
+                    if answer.form_submission.environment_id != user.environment_id:
                         return False, "Unauthorized access"
                 elif answer.form_submission.submitted_by != current_user:
                     return False, "Unauthorized access"
@@ -33,7 +33,7 @@ class AttachmentController:
             # Access control
             if user_role != RoleType.ADMIN:
                 if user_role in [RoleType.SITE_MANAGER, RoleType.SUPERVISOR]:
-                    if submission.form.creator.environment_id != current_user.environment_id:
+                    if submission.environment_id != current_user.environment_id:
                         return None, "Unauthorized access"
                 elif submission.submitted_by != current_user:
                     return None, "Can only add attachments to own submissions"
@@ -82,7 +82,7 @@ class AttachmentController:
             # Access control
             if user_role != RoleType.ADMIN:
                 if user_role in [RoleType.SITE_MANAGER, RoleType.SUPERVISOR]:
-                    if submission.form.creator.environment_id != current_user.environment_id:
+                    if submission.environment_id != current_user.environment_id:
                         return None, "Unauthorized access"
                 elif submission.submitted_by != current_user:
                     return None, "Can only add attachments to own submissions"
@@ -180,7 +180,7 @@ class AttachmentController:
             # Access control
             if user_role != RoleType.ADMIN:
                 if user_role in [RoleType.SITE_MANAGER, RoleType.SUPERVISOR]:
-                    if attachment.form_submission.form.creator.environment_id != current_user.environment_id:
+                    if attachment.form_submission.environment_id != current_user.environment_id:
                         return None, "Unauthorized access"
                 elif attachment.form_submission.submitted_by != current_user:
                     return None, "Unauthorized access"
@@ -201,7 +201,7 @@ class AttachmentController:
         Get attachment with file data and authorization check
         """
         try:
-            logger.info(f"Fetching attachment {attachment_id} from upload folder: {current_app.config['UPLOAD_FOLDER']}")
+            logger.debug(f"Fetching attachment {attachment_id} from upload folder: {current_app.config['UPLOAD_FOLDER']}")
             
             attachment_data, error = AttachmentService.get_attachment_with_file(
                 attachment_id=attachment_id,
@@ -215,7 +215,7 @@ class AttachmentController:
             # Access control
             if user_role != RoleType.ADMIN:
                 if user_role in [RoleType.SITE_MANAGER, RoleType.SUPERVISOR]:
-                    if attachment_data['record'].form_submission.form.creator.environment_id != current_user.environment_id:
+                    if attachment_data['record'].form_submission.environment_id != current_user.environment_id:
                         return None, "Unauthorized access"
                 elif attachment_data['record'].form_submission.submitted_by != current_user:
                     return None, "Unauthorized access"
@@ -243,7 +243,7 @@ class AttachmentController:
             # Access control
             if user_role != RoleType.ADMIN:
                 if user_role in [RoleType.SITE_MANAGER, RoleType.SUPERVISOR]:
-                    if submission.form.creator.environment_id != current_user.environment_id:
+                    if submission.environment_id != current_user.environment_id:
                         return [], "Unauthorized access"
                 elif submission.submitted_by != current_user:
                     return [], "Unauthorized access"
@@ -285,7 +285,7 @@ class AttachmentController:
             # Check ownership/permissions
             if user_role != RoleType.ADMIN:
                 if user_role in [RoleType.SITE_MANAGER, RoleType.SUPERVISOR]:
-                    if attachment.form_submission.form.creator.environment_id != current_user.environment_id:
+                    if attachment.form_submission.environment_id != current_user.environment_id:
                         return False, "Unauthorized access"
                 elif attachment.form_submission.submitted_by != current_user:
                     return False, "Can only delete own attachments"
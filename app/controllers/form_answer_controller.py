@@ -55,7 +55,7 @@ class FormAnswerController:
 
             # Check authorization
             if not current_user.role.is_super_user:
-                if form_answer.form_question.form.creator.environment_id != current_user.environment_id:
+                if form_answer.form_question.form.environment_id != current_user.environment_id:
                     return None, "Unauthorized access"
 
             # Check if answer is submitted
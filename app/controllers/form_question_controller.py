@@ -100,7 +100,7 @@ class FormQuestionController:
                 "creator": {
                     "id": form.creator.id,
                     "username": form.creator.username,
-                    "environment_id": form.creator.environment_id
+                    "environment_id": form.environment_id
                 } if form.creator else None
             }
             
@@ -30,7 +30,7 @@ class FormSubmissionController:
             if user.role.name in [RoleType.SITE_MANAGER, RoleType.SUPERVISOR]:
                 filters['environment_id'] = user.environment_id
             else:
-                filters['submitted_by'] = user.username
+                filters['submitted_by_id'] = user.id
                 
         return FormSubmissionService.get_all_submissions(filters)
 
@@ -28,4 +28,8 @@ __all__ = [
     'FormSubmission',
     'AnswerSubmitted',
     'Attachment'
-]
\ No newline at end of file
+]
+from .archive import ARCHIVE_TABLES, register_archive_tables
+
+# Archive mirrors are built once every soft-delete model above is mapped
+register_archive_tables()
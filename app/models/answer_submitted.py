@@ -1,5 +1,5 @@
 from app import db
-from app.models.soft_delete_mixin import SoftDeleteMixin
+from app.models.soft_delete_mixin import SoftDeleteMixin, active_index
 from app.models.timestamp_mixin import TimestampMixin
 import logging
 
@@ -13,6 +13,11 @@ class AnswerSubmitted(TimestampMixin, SoftDeleteMixin, db.Model):
     form_submission_id = db.Column(db.Integer, db.ForeignKey('form_submissions.id'), nullable=False)  # Changed from form_submissions_id
     text_answered = db.Column(db.Text)
 
+    __table_args__ = (
+        active_index('ix_answers_submitted_submission_active', 'form_submission_id'),
+        active_index('ix_answers_submitted_form_answer_active', 'form_answer_id'),
+    )
+
     # Relationships
     form_answer = db.relationship('FormAnswer', back_populates='submissions')
     form_submission = db.relationship('FormSubmission', back_populates='answers_submitted')
@@ -0,0 +1,31 @@
+from app import db
+from app.models.soft_delete_mixin import SoftDeleteMixin
+
+# hot table name -> archive Table
+ARCHIVE_TABLES = {}
+
+
+def _build_archive_table(table):
+    """
+    Mirror of a soft-delete table without foreign keys or defaults, so rows
+    can be moved in any order and copied back verbatim.
+    """
+    columns = [
+        db.Column(column.name, column.type, primary_key=column.primary_key, autoincrement=False)
+        for column in table.columns
+    ]
+    return db.Table(
+        f'{table.name}_archive', db.metadata,
+        *columns,
+        db.Column('archived_at', db.DateTime, nullable=False),
+        db.Index(f'ix_{table.name}_archive_archived_at', 'archived_at')
+    )
+
+
+def register_archive_tables():
+    """Create archive Table objects for every SoftDeleteMixin model"""
+    for mapper in db.Model.registry.mappers:
+        model = mapper.class_
+        if issubclass(model, SoftDeleteMixin) and model.__tablename__ not in ARCHIVE_TABLES:
+            ARCHIVE_TABLES[model.__tablename__] = _build_archive_table(model.__table__)
+    return ARCHIVE_TABLES
@@ -1,6 +1,6 @@
 from typing import Optional, Tuple
 from app import db
-from app.models.soft_delete_mixin import SoftDeleteMixin
+from app.models.soft_delete_mixin import SoftDeleteMixin, active_index
 from app.models.timestamp_mixin import TimestampMixin
 import os
 from werkzeug.utils import secure_filename
@@ -18,6 +18,10 @@ class Attachment(TimestampMixin, SoftDeleteMixin, db.Model):
     file_path = db.Column(db.String(255), nullable=False)
     is_signature = db.Column(db.Boolean, nullable=False, default=False)
 
+    __table_args__ = (
+        active_index('ix_attachments_submission_active', 'form_submission_id'),
+    )
+
     # Relationships
     form_submission = db.relationship('FormSubmission', back_populates='attachments')
     
@@ -53,8 +53,8 @@ class Environment(TimestampMixin, SoftDeleteMixin, db.Model):
 
         # Include additional details if requested
         if include_details:
-            # Get active users (not deleted)
-            active_users = [user for user in self.users if not user.is_deleted] if self.users else []
+            # Deleted users are excluded when the relationship loads
+            active_users = self.users or []
             
             details_dict = {
                 'users_count': len(active_users),
@@ -1,9 +1,9 @@
 from app import db
 from app.models.answer import Answer
 from app.models.form_answer import FormAnswer
-from app.models.soft_delete_mixin import SoftDeleteMixin
+from app.models.soft_delete_mixin import SoftDeleteMixin, active_index
 from app.models.timestamp_mixin import TimestampMixin
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, query_expression
 from sqlalchemy import select, func
 from typing import List, Dict, Any
 import logging
@@ -17,16 +17,28 @@ class Form(TimestampMixin, SoftDeleteMixin, db.Model):
     title = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    # Denormalized from the creator so environment listings avoid the users join
+    environment_id = db.Column(db.Integer, db.ForeignKey('environments.id'), nullable=True)
     is_public = db.Column(db.Boolean, nullable=False, default=False)
 
+    __table_args__ = (
+        db.Index('ix_forms_environment_deleted_created', 'environment_id', 'is_deleted', 'created_at'),
+        active_index('ix_forms_user_active', 'user_id', 'created_at'),
+    )
+
     # Relationships
     creator = db.relationship('User', back_populates='created_forms')
+    environment = db.relationship('Environment')
     form_questions = db.relationship('FormQuestion', back_populates='form', 
                                    cascade='all, delete-orphan',
                                    order_by='FormQuestion.order_number')
     submissions = db.relationship('FormSubmission', back_populates='form',
                                 cascade='all, delete-orphan')
 
+    # Filled in by list queries with with_expression(Form.submissions_count,
+    # Form.submissions_count_expression()); None when the query did not ask
+    submissions_count = query_expression()
+
     def __repr__(self) -> str:
         return f'<Form {self.title}>'
 
@@ -43,15 +55,26 @@ class Form(TimestampMixin, SoftDeleteMixin, db.Model):
             'email': self.creator.email,
             'fullname': self.creator.first_name+" "+self.creator.last_name,
             'environment': {
-                            "id": self.creator.environment_id,
-                            "name": self.creator.environment.name if self.creator.environment else None
+                            "id": self.environment_id,
+                            "name": self.environment.name if self.environment else None
                             }
         }
 
+    @classmethod
+    def submissions_count_expression(cls):
+        """Correlated count of active submissions, for with_expression()"""
+        from app.models.form_submission import FormSubmission
+        return (select(func.count(FormSubmission.id))
+                .where(FormSubmission.form_id == cls.id, FormSubmission.is_deleted == False)
+                .correlate_except(FormSubmission)
+                .scalar_subquery())
+
     def _get_submissions_count(self) -> int:
         """Get count of submissions for this form."""
+        if self.submissions_count is not None:
+            return self.submissions_count
         from app.models.form_submission import FormSubmission
-        return FormSubmission.query.filter_by(form_id=str(self.id), is_deleted=False).count()
+        return FormSubmission.query.filter_by(form_id=self.id, is_deleted=False).count()
 
 
     # app/models/form.py
@@ -67,17 +90,12 @@ class Form(TimestampMixin, SoftDeleteMixin, db.Model):
             List of dictionaries containing answer data
         """
         try:
-            # Get all form_answers for this form_question using eager loading
-            form_answers = FormAnswer.query.options(
-                joinedload(FormAnswer.answer)
-            ).filter_by(
-                form_question_id=form_question.id,
-                is_deleted=False  # Add soft delete filter
-            ).all()
-
-            # Create a dictionary of unique answers based on answer_id
+            # Deleted form answers are excluded when the relationship loads;
+            # FormService list queries load it for all forms up front
             unique_answers = {}
-            for form_answer in form_answers:
+            for form_answer in form_question.form_answers:
+                if form_answer.is_deleted:
+                    continue
                 if form_answer.answer and form_answer.answer_id not in unique_answers:
                     unique_answers[form_answer.answer_id] = {
                         'id': form_answer.answer.id,
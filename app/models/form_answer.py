@@ -1,5 +1,5 @@
 from app import db
-from app.models.soft_delete_mixin import SoftDeleteMixin
+from app.models.soft_delete_mixin import SoftDeleteMixin, active_index
 from app.models.timestamp_mixin import TimestampMixin
 
 class FormAnswer(TimestampMixin, SoftDeleteMixin, db.Model):
@@ -9,6 +9,10 @@ class FormAnswer(TimestampMixin, SoftDeleteMixin, db.Model):
     form_question_id = db.Column(db.Integer, db.ForeignKey('form_questions.id'), nullable=False)
     answer_id = db.Column(db.Integer, db.ForeignKey('answers.id'), nullable=False)
 
+    __table_args__ = (
+        active_index('ix_form_answers_form_question_active', 'form_question_id'),
+    )
+
     # Relationships
     form_question = db.relationship('FormQuestion', back_populates='form_answers')
     answer = db.relationship('Answer', back_populates='form_answers')
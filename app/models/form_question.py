@@ -1,6 +1,6 @@
 from app import db
 from app.models.question import Question
-from app.models.soft_delete_mixin import SoftDeleteMixin
+from app.models.soft_delete_mixin import SoftDeleteMixin, active_index
 from app.models.timestamp_mixin import TimestampMixin
 import logging
 
@@ -14,6 +14,10 @@ class FormQuestion(TimestampMixin, SoftDeleteMixin, db.Model):
     question_id = db.Column(db.Integer, db.ForeignKey('questions.id'), nullable=False)
     order_number = db.Column(db.Integer)
 
+    __table_args__ = (
+        active_index('ix_form_questions_form_active', 'form_id', 'order_number'),
+    )
+
     # Relationships
     form = db.relationship('Form', back_populates='form_questions')
     question = db.relationship('Question', back_populates='form_questions')
@@ -29,7 +33,7 @@ class FormQuestion(TimestampMixin, SoftDeleteMixin, db.Model):
             form_answers_data = []
             if self.form_answers:
                 for form_answer in self.form_answers:
-                    if not form_answer.is_deleted and form_answer.answer and not form_answer.answer.is_deleted:
+                    if form_answer.answer and not form_answer.answer.is_deleted:
                         form_answers_data.append({
                             'id': form_answer.answer.id,
                             'form_answer_id': form_answer.id,
@@ -1,7 +1,8 @@
 from typing import Any, Dict, List
 from app import db
-from app.models.soft_delete_mixin import SoftDeleteMixin
+from app.models.soft_delete_mixin import SoftDeleteMixin, active_index
 from app.models.timestamp_mixin import TimestampMixin
+from app.models.user import User
 from datetime import datetime
 
 class FormSubmission(TimestampMixin, SoftDeleteMixin, db.Model):
@@ -9,11 +10,22 @@ class FormSubmission(TimestampMixin, SoftDeleteMixin, db.Model):
     
     id = db.Column(db.Integer, primary_key=True)
     form_id = db.Column(db.Integer, db.ForeignKey('forms.id'), nullable=False)
+    # Copied from the form on creation so environment filters stay on this table
+    environment_id = db.Column(db.Integer, db.ForeignKey('environments.id'), nullable=True)
+    # Username kept for API compatibility; queries go through submitted_by_id
     submitted_by = db.Column(db.String(50), nullable=False)
+    submitted_by_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('ix_form_submissions_environment_deleted_submitted', 'environment_id', 'is_deleted', 'submitted_at'),
+        db.Index('ix_form_submissions_submitter_deleted_submitted', 'submitted_by_id', 'is_deleted', 'submitted_at'),
+        active_index('ix_form_submissions_form_active', 'form_id', 'submitted_at'),
+    )
+
     # Relationships
     form = db.relationship('Form', back_populates='submissions')
+    submitter = db.relationship('User')
     answers_submitted = db.relationship(
         'AnswerSubmitted',
         back_populates='form_submission',
@@ -25,6 +37,18 @@ class FormSubmission(TimestampMixin, SoftDeleteMixin, db.Model):
         cascade='all, delete-orphan'
     )
 
+    @classmethod
+    def submitted_by_user(cls, username: str):
+        """
+        Filter criterion matching a username through the indexed submitted_by_id.
+        Submissions whose username matched no user keep submitted_by_id NULL,
+        so those fall back to the username column.
+        """
+        return db.or_(
+            cls.submitted_by_id == db.select(User.id).where(User.username == username).scalar_subquery(),
+            db.and_(cls.submitted_by_id.is_(None), cls.submitted_by == username)
+        )
+
     def __repr__(self):
         return f'<FormSubmission {self.id} by {self.submitted_by}>'
 
@@ -32,7 +56,9 @@ class FormSubmission(TimestampMixin, SoftDeleteMixin, db.Model):
         return {
             'id': self.id,
             'form_id': self.form_id,
+            'environment_id': self.environment_id,
             'submitted_by': self.submitted_by,
+            'submitted_by_id': self.submitted_by_id,
             'submitted_at': self.submitted_at.isoformat() if self.submitted_at else None,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
@@ -1,4 +1,6 @@
 from app import db
+from sqlalchemy import event
+from sqlalchemy.orm import Session, with_loader_criteria
 from sqlalchemy.sql import func
 from datetime import datetime
 
@@ -20,8 +22,51 @@ class SoftDeleteMixin:
 
     @classmethod
     def get_deleted(cls):
-        return cls.query.filter_by(is_deleted=True)
+        return cls.get_all_with_deleted().filter_by(is_deleted=True)
 
     @classmethod
     def get_all_with_deleted(cls):
-        return cls.query
\ No newline at end of file
+        return cls.query.execution_options(include_deleted=True)
+
+
+def active_index(name, *columns):
+    """Partial index over rows that are not soft-deleted (PostgreSQL/SQLite)"""
+    return db.Index(
+        name, *columns,
+        postgresql_where=db.text('is_deleted = false'),
+        sqlite_where=db.text('is_deleted = 0')
+    )
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _exclude_soft_deleted(execute_state):
+    """
+    Add ``is_deleted = false`` to every ORM SELECT touching a SoftDeleteMixin
+    model, including joins and relationship loads.
+
+    Opt out per statement with ``.execution_options(include_deleted=True)``.
+    Column loads (refreshing an expired instance) are left alone so a row
+    soft-deleted in this session can still be read back.
+    """
+    if (
+        not execute_state.is_select
+        or execute_state.is_column_load
+        or execute_state.execution_options.get('include_deleted', False)
+    ):
+        return
+
+    execute_state.statement = execute_state.statement.options(soft_delete_criteria())
+
+
+def soft_delete_criteria():
+    """The loader option _exclude_soft_deleted adds to ORM SELECTs"""
+    # propagate_to_loaders covers joinedload's aliased joins. Lazy and
+    # selectin loads run their own SELECT and get the criteria in
+    # _exclude_soft_deleted, so collections stay filtered even on parents
+    # loaded with include_deleted
+    return with_loader_criteria(
+        SoftDeleteMixin,
+        lambda cls: cls.is_deleted == False,
+        include_aliases=True,
+        propagate_to_loaders=True
+    )
@@ -2,6 +2,7 @@ from app import db
 from app.models.role_permission import RolePermission
 from app.models.soft_delete_mixin import SoftDeleteMixin
 from app.models.timestamp_mixin import TimestampMixin
+from sqlalchemy.orm import query_expression
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
 
@@ -23,6 +24,19 @@ class User(TimestampMixin, SoftDeleteMixin, db.Model):
     environment = db.relationship('Environment', back_populates='users')
     created_forms = db.relationship('Form', back_populates='creator')
 
+    # Filled in by list queries with with_expression(User.created_forms_count,
+    # User.created_forms_count_expression()); None when the query did not ask
+    created_forms_count = query_expression()
+
+    @classmethod
+    def created_forms_count_expression(cls):
+        """Correlated count of active forms created by the user, for with_expression()"""
+        from app.models.form import Form
+        return (db.select(db.func.count(Form.id))
+                .where(Form.user_id == cls.id, Form.is_deleted == False)
+                .correlate_except(Form)
+                .scalar_subquery())
+
     def set_password(self, password):
         self.password_hash = generate_password_hash(password)
         self.updated_at = datetime.utcnow()
@@ -82,24 +96,21 @@ class User(TimestampMixin, SoftDeleteMixin, db.Model):
             })
         
         if include_details:
-            # Get active forms (not deleted)
-            active_forms = [form for form in self.created_forms if not form.is_deleted] if self.created_forms else []
+            # Deleted forms and role-permission mappings are excluded when loaded
+            forms_count = self.created_forms_count
+            if forms_count is None:
+                forms_count = len(self.created_forms or [])
             
             # Get active permissions from active role
             active_permissions = []
             if active_role:
                 active_permissions = [
                                         {
-                                            'id': p.id,
-                                            'name': p.name
+                                            'id': rp.permission.id,
+                                            'name': rp.permission.name
                                         }
-                                        for p in active_role.permissions 
-                                        if not p.is_deleted  # Check permission is not deleted
-                                        and not RolePermission.query.filter_by(  # Check role-permission mapping is not deleted
-                                            role_id=active_role.id,
-                                            permission_id=p.id,
-                                            is_deleted=True
-                                        ).first()
+                                        for rp in active_role.role_permissions
+                                        if rp.permission and not rp.permission.is_deleted
                                     ]
 
             details_dict = {
@@ -116,7 +127,7 @@ class User(TimestampMixin, SoftDeleteMixin, db.Model):
                     'description': active_environment.description
                 } if active_environment else None,
                 
-                'created_forms_count': len(active_forms),
+                'created_forms_count': forms_count,
                 'full_name': f"{self.first_name} {self.last_name}",
                 'email': self.email,
                 'contact_number': self.contact_number,
@@ -58,8 +58,8 @@ class AnswerService:
         """Get all answers with optional inclusion of deleted records"""
         query = Answer.query
         
-        if not include_deleted:
-            query = query.filter(Answer.is_deleted == False)
+        if include_deleted:
+            query = query.execution_options(include_deleted=True)
             
         return query.order_by(Answer.id).all()
 
@@ -134,25 +134,24 @@ class AnswerService:
                 'answers_submitted': 0
             }
 
-            # 1. Find all form answers using this answer (including deleted forms)
+            # 1. Find the active form answers using this answer, whatever the
+            # state of their forms (deleted form answers are already done)
             form_answers = FormAnswer.query.filter_by(
                 answer_id=answer_id
             ).all()
 
             for fa in form_answers:
-                if not fa.is_deleted:
-                    fa.soft_delete()
-                    deletion_stats['form_answers'] += 1
-
-                    # 2. Find and delete submitted answers
-                    submitted_answers = AnswerSubmitted.query.filter_by(
-                        form_answers_id=fa.id,
-                        is_deleted=False
-                    ).all()
-
-                    for submitted in submitted_answers:
-                        submitted.soft_delete()
-                        deletion_stats['answers_submitted'] += 1
+                fa.soft_delete()
+                deletion_stats['form_answers'] += 1
+
+                # 2. Find and delete submitted answers
+                submitted_answers = AnswerSubmitted.query.filter_by(
+                    form_answer_id=fa.id
+                ).all()
+
+                for submitted in submitted_answers:
+                    submitted.soft_delete()
+                    deletion_stats['answers_submitted'] += 1
 
             # Finally soft delete the answer
             answer.soft_delete()
@@ -13,6 +13,8 @@ from sqlalchemy.orm import joinedload
 import logging
 
 from app.models.form_submission import FormSubmission
+from app.models.form_question import FormQuestion
+from app.models.question import Question
 
 logger = logging.getLogger(__name__)
 
@@ -171,28 +173,56 @@ class AnswerSubmittedService:
             logger.error(f"Error getting answer submitted {answer_submitted_id}: {str(e)}")
             return None
 
+    @staticmethod
+    def _serialization_options():
+        """Loader options for everything AnswerSubmitted.to_dict reads"""
+        form_answer = joinedload(AnswerSubmitted.form_answer)
+        return (
+            joinedload(AnswerSubmitted.form_submission),
+            form_answer.joinedload(FormAnswer.answer),
+            form_answer.joinedload(FormAnswer.form_question)
+                .joinedload(FormQuestion.question)
+                .joinedload(Question.question_type),
+        )
+
     @staticmethod
     def get_all_answers_submitted(filters: Dict = None) -> List[AnswerSubmitted]:
-        query = AnswerSubmitted.query.filter_by(is_deleted=False)
+        query = (AnswerSubmitted.query
+            .filter_by(is_deleted=False)
+            .options(*AnswerSubmittedService._serialization_options()))
         if filters:
             if 'form_submission_id' in filters:
                 query = query.filter_by(form_submission_id=filters['form_submission_id'])
+            if filters.get('submitted_by_id'):
+                query = query.join(AnswerSubmitted.form_submission).filter(
+                    FormSubmission.submitted_by_id == filters['submitted_by_id']
+                )
+            elif filters.get('environment_id'):
+                query = query.join(AnswerSubmitted.form_submission).filter(
+                    FormSubmission.environment_id == filters['environment_id']
+                )
+            if filters.get('date_range'):
+                query = query.filter(
+                    AnswerSubmitted.created_at >= filters['date_range']['start'],
+                    AnswerSubmitted.created_at < filters['date_range']['end']
+                )
         return query.all()
 
+    @staticmethod
+    def answers_by_submission_query(submission_id: int):
+        """Query behind get_answers_by_submission"""
+        return (AnswerSubmitted.query
+            .filter_by(
+                form_submission_id=submission_id,
+                is_deleted=False
+            )
+            .options(*AnswerSubmittedService._serialization_options()))
+
     @staticmethod
     def get_answers_by_submission(submission_id: int) -> Tuple[List[AnswerSubmitted], Optional[str]]:
         """Get all submitted answers for a form submission"""
         try:
-            answers = (AnswerSubmitted.query
-                .filter_by(
-                    form_submission_id=submission_id,
-                    is_deleted=False
-                )
-                .options(
-                    joinedload(AnswerSubmitted.form_answer),
-                    joinedload(AnswerSubmitted.form_submission)
-                )
-                .all())
+            answers = AnswerSubmittedService.answers_by_submission_query(submission_id).all()
             return answers, None
         except Exception as e:
             logger.error(f"Error getting answers by submission: {str(e)}")
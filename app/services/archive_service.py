@@ -0,0 +1,171 @@
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+import time
+
+from sqlalchemy import exists, literal, select
+from app import db
+from app.models.archive import ARCHIVE_TABLES
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveService:
+    @staticmethod
+    def archive_order() -> List[str]:
+        """Soft-delete tables ordered children first, so parents are freed last"""
+        return [
+            table.name for table in reversed(db.metadata.sorted_tables)
+            if table.name in ARCHIVE_TABLES
+        ]
+
+    @staticmethod
+    def _referenced_by_hot_rows(table):
+        """Criteria excluding rows still referenced from any live table"""
+        criteria = []
+        for other in db.metadata.sorted_tables:
+            if other.name.endswith('_archive'):
+                continue
+            for fk in other.foreign_keys:
+                if fk.column.table is table:
+                    criteria.append(~exists().where(other.c[fk.parent.name] == table.c[fk.column.name]))
+        return criteria
+
+    @staticmethod
+    def archive_table(
+        table_name: str,
+        older_than_days: int = 90,
+        batch_size: int = 1000,
+        sleep_seconds: float = 0,
+        dry_run: bool = False,
+        progress: Optional[Callable[[str, int, int], None]] = None
+    ) -> Tuple[int, Optional[str]]:
+        """
+        Move rows soft-deleted more than older_than_days ago into the archive
+        table, walking the primary key in batches of batch_size.
+
+        Each batch is copied and deleted in its own transaction, so the job
+        can be interrupted and rerun; already moved rows are gone from the
+        hot table. Rows still referenced by live rows are skipped.
+
+        Returns:
+            tuple: (Number of rows moved, Error message or None)
+        """
+        if table_name not in ARCHIVE_TABLES:
+            return 0, f"No archive table for '{table_name}'"
+
+        table = db.metadata.tables[table_name]
+        archive = ARCHIVE_TABLES[table_name]
+        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+        eligible = [
+            table.c.is_deleted == True,
+            table.c.deleted_at.isnot(None),
+            table.c.deleted_at < cutoff,
+            *ArchiveService._referenced_by_hot_rows(table)
+        ]
+        moved, last_id = 0, 0
+
+        try:
+            while True:
+                ids = db.session.execute(
+                    select(table.c.id)
+                    .where(table.c.id > last_id, *eligible)
+                    .order_by(table.c.id)
+                    .limit(batch_size)
+                    .execution_options(include_deleted=True)
+                ).scalars().all()
+
+                if not ids:
+                    break
+
+                if not dry_run:
+                    db.session.execute(archive.insert().from_select(
+                        [column.name for column in table.columns] + ['archived_at'],
+                        select(*table.columns, literal(datetime.utcnow()))
+                        .where(table.c.id.in_(ids))
+                    ))
+                    db.session.execute(table.delete().where(table.c.id.in_(ids)))
+                    db.session.commit()
+
+                moved += len(ids)
+                last_id = ids[-1]
+                if progress:
+                    progress(table_name, moved, last_id)
+                if sleep_seconds:
+                    time.sleep(sleep_seconds)
+
+            return moved, None
+
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error archiving {table_name} after {moved} rows: {str(e)}")
+            return moved, str(e)
+
+    @staticmethod
+    def archive_all(older_than_days: int = 90, **kwargs) -> Tuple[Dict[str, int], Optional[str]]:
+        """Archive every soft-delete table, children before parents"""
+        results = {}
+        for table_name in ArchiveService.archive_order():
+            moved, error = ArchiveService.archive_table(table_name, older_than_days, **kwargs)
+            results[table_name] = moved
+            if error:
+                return results, error
+        return results, None
+
+    @staticmethod
+    def _unarchive(table_name: str, row_id: int, undelete: bool) -> bool:
+        """Copy one row back to its hot table, restoring archived parents first"""
+        table = db.metadata.tables[table_name]
+        archive = ARCHIVE_TABLES[table_name]
+        row = db.session.execute(
+            select(archive).where(archive.c.id == row_id)
+        ).mappings().first()
+        if not row:
+            return False
+
+        # Parents keep their deleted state; they only need to exist for the FK
+        for fk in table.foreign_keys:
+            parent_id = row[fk.parent.name]
+            parent = fk.column.table
+            if parent_id is None or parent.name not in ARCHIVE_TABLES:
+                continue
+            in_hot_table = db.session.execute(
+                select(parent.c.id).where(parent.c.id == parent_id)
+                .execution_options(include_deleted=True)
+            ).first()
+            if not in_hot_table:
+                ArchiveService._unarchive(parent.name, parent_id, undelete=False)
+
+        values = {column.name: row[column.name] for column in table.columns}
+        if undelete:
+            values.update(is_deleted=False, deleted_at=None)
+        db.session.execute(table.insert().values(**values))
+        db.session.execute(archive.delete().where(archive.c.id == row_id))
+        return True
+
+    @staticmethod
+    def restore(model, row_id: int):
+        """
+        Bring an archived row back into its hot table as active.
+
+        Returns:
+            tuple: (Restored instance or None, Error message or None)
+        """
+        if model.__tablename__ not in ARCHIVE_TABLES:
+            return None, f"{model.__name__} is not archived"
+        try:
+            if not ArchiveService._unarchive(model.__tablename__, row_id, undelete=True):
+                return None, f"{model.__name__} {row_id} not found in archive"
+            db.session.commit()
+            return db.session.get(model, row_id), None
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error restoring {model.__name__} {row_id} from archive: {str(e)}")
+            return None, str(e)
+
+    @staticmethod
+    def archived_counts() -> Dict[str, int]:
+        return {
+            table_name: db.session.scalar(select(db.func.count()).select_from(archive))
+            for table_name, archive in ARCHIVE_TABLES.items()
+        }
@@ -3,11 +3,13 @@ from datetime import datetime
 import os
 import shutil
 import logging
+from flask import current_app
 from werkzeug.utils import secure_filename
 from app import db
 from app.models.attachment import Attachment
 from app.models.form import Form
 from app.models.form_submission import FormSubmission
+from app.utils.metrics import ATTACHMENT_BYTES
 from sqlalchemy.orm import joinedload
 
 logger = logging.getLogger(__name__)
@@ -155,6 +157,7 @@ class AttachmentService:
             os.makedirs(os.path.dirname(full_path), exist_ok=True)
             
             file.save(full_path)
+            ATTACHMENT_BYTES.inc('in', amount=os.path.getsize(full_path))
             return True, None
             
         except Exception as e:
@@ -296,32 +299,41 @@ class AttachmentService:
                 - form_submission_id: Filter by form submission
                 - is_signature: Filter by signature type
                 - file_type: Filter by file type
+                - submitted_by: Filter by submitter username
                 
         Returns:
             List[Attachment]: List of attachment objects
         """
         try:
-            query = Attachment.query.filter_by(is_deleted=False)
-            
-            if filters:
-                if 'form_submission_id' in filters:
-                    query = query.filter_by(form_submission_id=filters['form_submission_id'])
-                    
-                if 'is_signature' in filters:
-                    query = query.filter_by(is_signature=filters['is_signature'])
-                    
-                if 'file_type' in filters:
-                    query = query.filter_by(file_type=filters['file_type'])
-            
-            # Join with form_submission to get additional details
-            query = (query.join(FormSubmission)
-                    .options(joinedload(Attachment.form_submission)))
-                    
-            return query.order_by(Attachment.created_at.desc()).all()
+            return AttachmentService.attachments_query(filters).all()
             
         except Exception as e:
             logger.error(f"Error getting attachments: {str(e)}")
             raise
+
+    @staticmethod
+    def attachments_query(filters: Dict = None):
+        """Query behind get_all_attachments; takes the same filters"""
+        query = Attachment.query.filter_by(is_deleted=False)
+        
+        if filters:
+            if 'form_submission_id' in filters:
+                query = query.filter_by(form_submission_id=filters['form_submission_id'])
+                
+            if 'is_signature' in filters:
+                query = query.filter_by(is_signature=filters['is_signature'])
+                
+            if 'file_type' in filters:
+                query = query.filter_by(file_type=filters['file_type'])
+        
+        # Join with form_submission to get additional details
+        query = (query.join(FormSubmission)
+                .options(joinedload(Attachment.form_submission)))
+
+        if filters and filters.get('submitted_by'):
+            query = query.filter(FormSubmission.submitted_by_user(filters['submitted_by']))
+                
+        return query.order_by(Attachment.created_at.desc())
         
     @staticmethod
     def get_attachment(attachment_id: int) -> Optional[Attachment]:
@@ -347,13 +359,22 @@ class AttachmentService:
             logger.error(f"Error getting attachment {attachment_id}: {str(e)}")
             return None
         
+    @staticmethod
+    def _log_directory_contents(dir_path: str) -> None:
+        """Diagnostics for missing files; only runs with ATTACHMENT_DEBUG enabled"""
+        if not os.path.exists(dir_path):
+            logger.info(f"Directory does not exist: {dir_path}")
+            return
+        logger.info(f"Directory contents of {dir_path}: {', '.join(sorted(os.listdir(dir_path)))}")
+
     @staticmethod
     def get_attachment_with_file(
         attachment_id: int,
         base_path: str
     ) -> Tuple[Optional[Dict], Optional[str]]:
         """
-        Get attachment with file data with enhanced logging
+        Get attachment with file data. Set ATTACHMENT_DEBUG to log the
+        directory contents when the file is missing.
         """
         try:
             # Get attachment record
@@ -366,30 +387,17 @@ class AttachmentService:
                 logger.error(f"Attachment {attachment_id} not found in database")
                 return None, "Attachment not found"
 
-            # Log attachment details
-            logger.info(f"Found attachment record: {attachment.id}")
-            logger.info(f"Stored file path: {attachment.file_path}")
-            logger.info(f"Base path: {base_path}")
-            
             # Construct full file path
             full_path = os.path.normpath(os.path.join(base_path, attachment.file_path))
-            logger.info(f"Attempting to access file at: {full_path}")
-                
-            # Log directory contents
-            dir_path = os.path.dirname(full_path)
-            if os.path.exists(dir_path):
-                logger.info(f"Directory contents of {dir_path}:")
-                for file in os.listdir(dir_path):
-                    logger.info(f" - {file}")
-            else:
-                logger.error(f"Directory does not exist: {dir_path}")
-                
+            logger.debug(f"Attachment {attachment.id}: stored path {attachment.file_path}, resolved to {full_path}")
+
             # Check if file exists
             if not os.path.exists(full_path):
                 logger.error(f"File not found at path: {full_path}")
+                if current_app.config.get('ATTACHMENT_DEBUG'):
+                    AttachmentService._log_directory_contents(os.path.dirname(full_path))
                 return None, "File not found"
-                    
-            logger.info(f"Successfully found file at: {full_path}")
+
             return {
                 'record': attachment,
                 'file_path': full_path,
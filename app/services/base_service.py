@@ -6,11 +6,11 @@ class BaseService:
         self.model = model
 
     def get_all_sorted(self, include_deleted=False):
-        query = self.model.query if include_deleted else self.model.get_active()
+        query = self.model.get_all_with_deleted() if include_deleted else self.model.get_active()
         return query.order_by(asc(self.model.id)).all()
 
     def get_by_id(self, id, include_deleted=False):
-        query = self.model.query if include_deleted else self.model.get_active()
+        query = self.model.get_all_with_deleted() if include_deleted else self.model.get_active()
         return query.get(id)
 
     def create(self, **kwargs):
@@ -43,4 +43,9 @@ class BaseService:
         if instance:
             instance.restore()
             db.session.commit()
+            return instance
+
+        # Rows deleted long ago may have been moved to the archive table
+        from app.services.archive_service import ArchiveService
+        instance, _ = ArchiveService.restore(self.model, id)
         return instance
\ No newline at end of file
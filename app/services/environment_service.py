@@ -62,8 +62,8 @@ class EnvironmentService(BaseService):
                 joinedload(Environment.users)   # Assuming there's a forms relationship
             )
             
-            if not include_deleted:
-                query = query.filter(Environment.is_deleted == False)
+            if include_deleted:
+                query = query.execution_options(include_deleted=True)
                 
             return query.order_by(Environment.id).all()
         except Exception as e:
@@ -197,11 +197,9 @@ class EnvironmentService(BaseService):
         """Get all non-deleted forms in an environment"""
         try:
             return (Form.query
-                .join(User)
                 .filter(
-                    User.environment_id == environment_id,
-                    Form.is_deleted == False,
-                    User.is_deleted == False
+                    Form.environment_id == environment_id,
+                    Form.is_deleted == False
                 )
                 .all())
         except Exception as e:
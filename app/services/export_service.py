@@ -1,22 +1,18 @@
 # app/services/export_service.py
 
-from PIL import Image
 from io import BytesIO
 import os
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
-from docx.enum.style import WD_STYLE_TYPE
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4, LETTER, LEGAL
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image as RLImage
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
 from werkzeug.exceptions import BadRequest
 
+if TYPE_CHECKING:
+    from docx.document import Document
+
+# reportlab, python-docx and PIL are imported inside the export methods:
+# together they add ~230 ms and several MB to every worker, and exports are rare.
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_EXPORT_PARAMS = {
@@ -51,7 +47,11 @@ DEFAULT_EXPORT_PARAMS = {
 class ExportService:
     def __init__(self):
         self.supported_formats = ['PDF', 'DOCX']
-        self.page_sizes = {
+
+    @property
+    def page_sizes(self) -> Dict[str, tuple]:
+        from reportlab.lib.pagesizes import A4, LETTER, LEGAL
+        return {
             'A4': A4,
             'LETTER': LETTER,
             'LEGAL': LEGAL
@@ -73,6 +73,8 @@ class ExportService:
 
     def _add_signatures_pdf(self, story: List, signatures: List[Dict], styles: Dict, spacing_params: Dict) -> None:
         """Add signature section to PDF document with customizable spacing"""
+        from reportlab.platypus import Paragraph, Spacer, Table
+
         # Space before signatures section
         story.append(Spacer(1, spacing_params.get('before_section', 20)))
         story.append(Paragraph("Signatures:", styles['Heading2']))
@@ -111,8 +113,10 @@ class ExportService:
         # Space after signatures section
         story.append(Spacer(1, spacing_params.get('after_section', 20)))
 
-    def _add_signatures_docx(self, doc: Document, signatures: List[Dict], spacing_params: Dict) -> None:
+    def _add_signatures_docx(self, doc: 'Document', signatures: List[Dict], spacing_params: Dict) -> None:
         """Add signature section to DOCX document with customizable spacing"""
+        from docx.shared import Pt
+
         doc.add_paragraph().add_run().add_break()
         doc.add_heading('Signatures:', level=1)
         
@@ -149,6 +153,10 @@ class ExportService:
 
     def _add_logo_pdf(self, story: List, logo_path: str, width: float = 2.0) -> None:
         """Add logo to PDF document"""
+        from PIL import Image
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Spacer, Image as RLImage
+
         try:
             if os.path.exists(logo_path):
                 img = Image.open(logo_path)
@@ -160,8 +168,10 @@ class ExportService:
         except Exception as e:
             logger.warning(f"Could not add logo to PDF: {str(e)}")
 
-    def _add_logo_docx(self, doc: Document, logo_path: str, width: float = 2.0) -> None:
+    def _add_logo_docx(self, doc: 'Document', logo_path: str, width: float = 2.0) -> None:
         """Add logo to DOCX document"""
+        from docx.shared import Inches
+
         try:
             if os.path.exists(logo_path):
                 if logo_path.lower().endswith(('.png', '.jpg', '.jpeg')):
@@ -172,6 +182,10 @@ class ExportService:
 
     def export_as_pdf(self, form_data: Dict[str, Any], format_params: Dict[str, Any]) -> bytes:
         """Export form as fillable PDF with custom formatting"""
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
         try:
             self._validate_form_data(form_data)
 
@@ -292,6 +306,10 @@ class ExportService:
 
     def export_as_docx(self, form_data: Dict[str, Any], format_params: Dict[str, Any]) -> bytes:
         """Export form as fillable DOCX with custom formatting"""
+        from docx import Document
+        from docx.shared import Inches, Pt
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+
         try:
             self._validate_form_data(form_data)
 
@@ -374,7 +392,11 @@ class ExportService:
                 doc.add_paragraph()
 
             # Add signatures
-            self._add_signatures_docx(doc, format_params.get('signatures', []))
+            self._add_signatures_docx(
+                doc,
+                format_params.get('signatures', []),
+                format_params.get('signature_spacing', DEFAULT_EXPORT_PARAMS['signature_spacing'])
+            )
 
             # Save to buffer
             buffer = BytesIO()
@@ -386,6 +408,50 @@ class ExportService:
             logger.error(f"Error generating DOCX: {str(e)}")
             raise BadRequest(f"Error generating DOCX: {str(e)}")
 
+    @staticmethod
+    def build_form_data(form) -> Dict[str, Any]:
+        """Export payload for a Form: creator, and active questions in order with their options"""
+        return {
+            'title': form.title,
+            'description': form.description,
+            'created_at': form.created_at.isoformat() if form.created_at else None,
+            'updated_at': form.updated_at.isoformat() if form.updated_at else None,
+            'created_by': {
+                'id': form.creator.id,
+                'username': form.creator.username,
+                'email': form.creator.email,
+                'first_name': form.creator.first_name,
+                'last_name': form.creator.last_name,
+                'fullname': f"{form.creator.first_name} {form.creator.last_name}",
+                'environment': {
+                    'id': form.environment_id,
+                    'name': form.environment.name if form.environment else None
+                }
+            },
+            'is_public': form.is_public,
+            'questions': [
+                {
+                    'id': q.question.id,
+                    'form_question_id': q.id,
+                    'text': q.question.text,
+                    'type': q.question.question_type.type,
+                    'order_number': q.order_number,
+                    'remarks': q.question.remarks,
+                    'possible_answers': [
+                        {
+                            'id': fa.answer.id,
+                            'form_answer_id': fa.id,
+                            'value': fa.answer.value
+                        }
+                        for fa in sorted(q.form_answers, key=lambda x: x.id)
+                        if fa.answer and not fa.answer.is_deleted
+                    ] if q.question.question_type.type in ['checkbox', 'multiple_choices'] else None
+                }
+                for q in sorted(form.form_questions, key=lambda x: x.order_number or 0)
+                if q.question and not q.question.is_deleted
+            ]
+        }
+
     @staticmethod
     def get_supported_formats() -> List[str]:
         """Get list of supported export formats"""
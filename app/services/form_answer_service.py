@@ -16,6 +16,7 @@ from app.models.user import User
 logger = logging.getLogger(__name__)
 
 from app.models.form_question import FormQuestion
+from app.models.question import Question
 
 class FormAnswerService:
     @staticmethod
@@ -45,7 +46,7 @@ class FormAnswerService:
                 return None, "Form question not found or has been deleted"
 
             # Verify related form exists and is not deleted
-            if form_question.form.is_deleted:
+            if not form_question.form or form_question.form.is_deleted:
                 return None, "Cannot add answers to a deleted form"
 
             # Verify answer exists and is not deleted
@@ -168,10 +169,15 @@ class FormAnswerService:
     @staticmethod
     def get_all_form_answers(include_deleted=False):
         """Get all form answers"""
-        query = FormAnswer.query
+        form_question = joinedload(FormAnswer.form_question)
+        query = FormAnswer.query.options(
+            form_question.joinedload(FormQuestion.form),
+            form_question.joinedload(FormQuestion.question).joinedload(Question.question_type),
+            joinedload(FormAnswer.answer)
+        )
         
-        if not include_deleted:
-            query = query.filter(FormAnswer.is_deleted == False)
+        if include_deleted:
+            query = query.execution_options(include_deleted=True)
             
         return query.order_by(FormAnswer.id).all()
 
@@ -219,7 +225,7 @@ class FormAnswerService:
             # Authorization check
             if not current_user.role.is_super_user:
                 if not form_question.form.is_public and \
-                   form_question.form.creator.environment_id != current_user.environment_id:
+                   form_question.form.environment_id != current_user.environment_id:
                     return [], "Unauthorized: Form question belongs to different environment"
 
             # Get all non-deleted form answers
@@ -90,8 +90,7 @@ class FormQuestionService:
                 )
 
             if environment_id:
-                query = (query.join(User, User.id == Form.user_id)
-                        .filter(User.environment_id == environment_id))
+                query = query.filter(Form.environment_id == environment_id)
 
             # Order by form and question order
             questions = (query.order_by(
@@ -11,7 +11,7 @@ from app.services.base_service import BaseService
 from app.models.form import Form
 from app.models.form_question import FormQuestion
 from app import db
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload, with_expression
 from sqlalchemy.exc import IntegrityError
 import logging
 
@@ -29,6 +29,7 @@ class FormService(BaseService):
         return (Form.query
             .options(
                 joinedload(Form.creator),
+                joinedload(Form.environment),
                 joinedload(Form.form_questions)
                     .joinedload(FormQuestion.question)
                     .joinedload(Question.question_type)
@@ -52,15 +53,27 @@ class FormService(BaseService):
             logger.error(f"Operation error: {str(e)}")
             return None, str(e)
 
+    @staticmethod
+    def _serialization_options():
+        """
+        Loader options for everything Form.to_dict reads, so a list of forms
+        costs a fixed number of statements however many forms it holds
+        """
+        form_questions = selectinload(Form.form_questions)
+        return (
+            joinedload(Form.creator),
+            joinedload(Form.environment),
+            form_questions.joinedload(FormQuestion.question).joinedload(Question.question_type),
+            form_questions.selectinload(FormQuestion.form_answers).joinedload(FormAnswer.answer),
+            with_expression(Form.submissions_count, Form.submissions_count_expression()),
+        )
+
     @staticmethod
     def get_all_forms(user, is_public=None):
         """Get all forms with role-based filtering and public forms"""
         try:
             query = Form.query.options(
-                joinedload(Form.creator),
-                joinedload(Form.form_questions)
-                    .joinedload(FormQuestion.question)
-                    .joinedload(Question.question_type),
+                *FormService._serialization_options()
             ).filter_by(is_deleted=False)
 
             # Base query for public forms
@@ -75,9 +88,7 @@ class FormService(BaseService):
                 return (query.filter(
                     db.or_(
                         Form.is_public == True,
-                        db.and_(
-                            Form.creator.has(User.environment_id == user.environment_id)
-                        )
+                        Form.environment_id == user.environment_id
                     )
                 ).order_by(Form.created_at.desc()).all())
                 
@@ -94,10 +105,7 @@ class FormService(BaseService):
         """Get non-deleted form with relationships"""
         try:
             return Form.query.options(
-                joinedload(Form.creator),
-                joinedload(Form.form_questions)
-                    .joinedload(FormQuestion.question)
-                    .joinedload(Question.question_type)
+                *FormService._serialization_options()
             ).filter_by(
                 id=form_id,
                 is_deleted=False
@@ -113,24 +121,22 @@ class FormService(BaseService):
             joinedload(Form.form_questions).joinedload(FormQuestion.question)
         ).filter_by(id=form_id, is_default=False).first()
 
+    @staticmethod
+    def forms_by_environment_query(environment_id: int):
+        """Query behind get_forms_by_environment"""
+        return (Form.query
+            .filter(
+                Form.environment_id == environment_id,
+                Form.is_deleted == False
+            )
+            .options(*FormService._serialization_options())
+            .order_by(Form.created_at.desc()))
+
     @staticmethod
     def get_forms_by_environment(environment_id: int) -> list[Form]:
         """Get non-deleted forms for an environment"""
         try:
-            forms = (Form.query
-                .join(Form.creator)
-                .filter(
-                    Form.is_deleted == False,
-                    User.environment_id == environment_id,
-                    User.is_deleted == False
-                )
-                .options(
-                    joinedload(Form.creator).joinedload(User.environment),
-                    joinedload(Form.form_questions).joinedload(FormQuestion.question)
-                )
-                .order_by(Form.created_at.desc())
-                .all())
-            return forms
+            return FormService.forms_by_environment_query(environment_id).all()
         except Exception as e:
             logger.error(f"Error in get_forms_by_environment: {str(e)}")
             return []
@@ -174,10 +180,7 @@ class FormService(BaseService):
                     is_public=True,
                     is_deleted=False
                 )
-                .options(
-                    joinedload(Form.creator).joinedload(User.environment),
-                    joinedload(Form.form_questions).joinedload(FormQuestion.question)
-                )
+                .options(*FormService._serialization_options())
                 .order_by(Form.created_at.desc())
                 .all())
             return forms
@@ -197,33 +200,34 @@ class FormService(BaseService):
             if not user:
                 return None
                 
-            return (Form.query
-                    .filter_by(
-                        user_id=user.id,
-                        is_deleted=False
-                    )
-                    .join(User)
-                    .options(
-                        joinedload(Form.creator).joinedload(User.environment),
-                        joinedload(Form.form_questions)
-                            .joinedload(FormQuestion.question)
-                            .joinedload(Question.question_type)
-                    )
-                    .filter(User.is_deleted == False)
-                    .order_by(Form.created_at.desc())
-                    .all())
+            return FormService.forms_by_creator_query(user.id).all()
         except Exception as e:
             logger.error(f"Error in get_forms_by_creator: {str(e)}")
             return None
 
+    @staticmethod
+    def forms_by_creator_query(user_id: int):
+        """Query behind get_forms_by_creator"""
+        return (Form.query
+                .filter_by(
+                    user_id=user_id,
+                    is_deleted=False
+                )
+                .join(User)
+                .options(*FormService._serialization_options())
+                .filter(User.is_deleted == False)
+                .order_by(Form.created_at.desc()))
+
     @classmethod
     def create_form(cls, title: str, description: str, user_id: int, is_public: bool = False) -> Tuple[Optional[Form], Optional[str]]:
         """Create a new form"""
         def _create():
+            creator = User.query.get(user_id)
             form = Form(
                 title=title,
                 description=description,
                 user_id=user_id,
+                environment_id=creator.environment_id if creator else None,
                 is_public=is_public
             )
             db.session.add(form)
@@ -307,9 +311,13 @@ class FormService(BaseService):
     def submit_form(cls, form_id: int, username: str, answers: List[Dict]) -> Tuple[Optional[FormSubmission], Optional[str]]:
         """Submit form with answers"""
         def _submit():
+            form = Form.query.get(form_id)
+            submitter = User.query.filter_by(username=username).first()
             submission = FormSubmission(
                 form_id=form_id,
+                environment_id=form.environment_id if form else None,
                 submitted_by=username,
+                submitted_by_id=submitter.id if submitter else None,
                 submitted_at=datetime.utcnow()
             )
             db.session.add(submission)
@@ -358,7 +366,7 @@ class FormService(BaseService):
             if not form:
                 return None
                 
-            submissions = [s for s in form.submissions if not s.is_deleted]
+            submissions = form.submissions
             total_submissions = len(submissions)
             
             stats = {
@@ -409,21 +417,23 @@ class FormService(BaseService):
                 
         return trends
 
+    @staticmethod
+    def question_answers_query(form_question_id: int):
+        """Submitted answers of one form question, as counted in the form statistics"""
+        return (FormAnswer.query
+            .join(AnswerSubmitted)
+            .filter(
+                FormAnswer.form_question_id == form_question_id,
+                FormAnswer.is_deleted == False
+            ))
+
     @staticmethod
     def _calculate_question_statistics(form: Form) -> Dict:
         """Calculate question statistics"""
         stats = {'questions_stats': {}}
         
         for form_question in form.form_questions:
-            if form_question.is_deleted:
-                continue
-                
-            answers = (FormAnswer.query
-                .join(AnswerSubmitted)
-                .filter(
-                    FormAnswer.form_question_id == form_question.id,
-                    FormAnswer.is_deleted == False
-                ).all())
+            answers = FormService.question_answers_query(form_question.id).all()
 
             stats['questions_stats'][form_question.question_id] = {
                 'total_answers': len(answers),
@@ -548,6 +558,17 @@ class FormService(BaseService):
             
         return query.order_by(Form.created_at.desc()).all()
 
+    @staticmethod
+    def user_submissions_query(username: str, form_id: Optional[int] = None):
+        """Query behind get_user_submission_statistics"""
+        query = FormSubmission.query.filter(
+            FormSubmission.submitted_by_user(username),
+            FormSubmission.is_deleted == False
+        )
+        if form_id:
+            query = query.filter_by(form_id=form_id)
+        return query.order_by(FormSubmission.submitted_at.desc())
+
     @classmethod
     def get_user_submission_statistics(cls, username: str, form_id: Optional[int] = None) -> Dict:
         """
@@ -560,15 +581,7 @@ class FormService(BaseService):
         Returns:
             Dictionary containing submission statistics
         """
-        query = FormSubmission.query.filter_by(
-            submitted_by=username,
-            is_deleted=False
-        )
-        
-        if form_id:
-            query = query.filter_by(form_id=form_id)
-            
-        submissions = query.order_by(FormSubmission.submitted_at.desc()).all()
+        submissions = cls.user_submissions_query(username, form_id).all()
         
         return {
             'total_submissions': len(submissions),
@@ -25,9 +25,13 @@ class FormSubmissionService:
             tuple: (Created FormSubmission object or None, Error message or None)
         """
         try:
+            form = Form.query.get(form_id)
+            submitter = User.query.filter_by(username=username).first()
             submission = FormSubmission(
                 form_id=form_id,
-                submitted_by=username
+                environment_id=form.environment_id if form else None,
+                submitted_by=username,
+                submitted_by_id=submitter.id if submitter else None
             )
             db.session.add(submission)
             db.session.commit()
@@ -47,26 +51,41 @@ class FormSubmissionService:
             filters (dict): Optional filters
                 - form_id (int): Filter by form ID
                 - environment_id (int): Filter by environment
-                - submitted_by (str): Filter by submitter
+                - submitted_by_id (int): Filter by submitter ID
+                - submitted_by (str): Filter by submitter username
+                - start_date / end_date (datetime): Bound submitted_at
                 
         Returns:
             List[FormSubmission]: List of submissions matching filters
         """
+        return FormSubmissionService.submissions_query(filters).all()
+
+    @staticmethod
+    def submissions_query(filters: dict = None):
+        """Query behind get_all_submissions; takes the same filters"""
         query = FormSubmission.query.filter_by(is_deleted=False)
         
         if filters:
             if filters.get('form_id'):
                 query = query.filter_by(form_id=filters['form_id'])
                 
-            if filters.get('submitted_by'):
-                query = query.filter_by(submitted_by=filters['submitted_by'])
+            if filters.get('submitted_by_id'):
+                query = query.filter_by(submitted_by_id=filters['submitted_by_id'])
+            elif filters.get('submitted_by'):
+                query = query.filter(FormSubmission.submitted_by_user(filters['submitted_by']))
                 
             if filters.get('environment_id'):
-                query = query.join(Form).join(User).filter(
-                    User.environment_id == filters['environment_id']
+                query = query.filter(
+                    FormSubmission.environment_id == filters['environment_id']
                 )
+
+            # Bounding the partition key lets partitioned tables skip months
+            if filters.get('start_date'):
+                query = query.filter(FormSubmission.submitted_at >= filters['start_date'])
+            if filters.get('end_date'):
+                query = query.filter(FormSubmission.submitted_at < filters['end_date'])
                 
-        return query.order_by(FormSubmission.submitted_at.desc()).all()
+        return query.order_by(FormSubmission.submitted_at.desc())
 
     @staticmethod
     def get_submission(submission_id: int) -> Optional[FormSubmission]:
@@ -4,10 +4,8 @@ from flask import current_app
 class LoggingService:
     @staticmethod
     def setup_logging():
-        logging.basicConfig(level=logging.INFO)
-        file_handler = logging.FileHandler('app.log')
-        file_handler.setLevel(logging.INFO)
-        current_app.logger.addHandler(file_handler)
+        from app.utils.logging_config import setup_logging
+        setup_logging(current_app.config)
 
     @staticmethod
     def log_info(message):
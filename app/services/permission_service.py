@@ -168,9 +168,9 @@ class PermissionService(BaseService):
         try:
             permissions = Permission.query.filter_by(is_deleted=False).all()
 
-            logger.info(f"Number of permissions found: {len(permissions)}")
+            logger.debug(f"Number of permissions found: {len(permissions)}")
             for perm in permissions:
-                logger.info(f"Permission: id={perm.id}, name={perm.name}")
+                logger.debug(f"Permission: id={perm.id}, name={perm.name}")
             return permissions
         except Exception as e:
             logger.error(f"Error when getting all permissions: {str(e)}")
@@ -7,6 +7,7 @@ from app.models.form_question import FormQuestion
 from app.models.question import Question
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import or_
+from sqlalchemy.orm import joinedload
 from datetime import datetime
 import logging
 
@@ -130,8 +131,8 @@ class QuestionService:
         """Get all questions of a specific type"""
         query = Question.query.filter_by(question_type_id=question_type_id)
         
-        if not include_deleted:
-            query = query.filter(Question.is_deleted == False)
+        if include_deleted:
+            query = query.execution_options(include_deleted=True)
             
         return query.order_by(Question.id).all()
     
@@ -175,11 +176,9 @@ class QuestionService:
             if environment_id and current_user and not current_user.role.is_super_user:
                 query = query.join(
                     FormQuestion,
-                    Form,
-                    User
+                    Form
                 ).filter(
-                    User.environment_id == environment_id,
-                    User.is_deleted == False,
+                    Form.environment_id == environment_id,
                     Form.is_deleted == False,
                     FormQuestion.is_deleted == False
                 )
@@ -218,12 +217,8 @@ class QuestionService:
             ).join(
                 Form,
                 Form.id == FormQuestion.form_id
-            ).join(
-                User,
-                User.id == Form.user_id
             ).filter(
-                User.environment_id == environment_id,
-                User.is_deleted == False,
+                Form.environment_id == environment_id,
                 Form.is_deleted == False,
                 FormQuestion.is_deleted == False
             )
@@ -233,9 +228,9 @@ class QuestionService:
     @staticmethod
     def get_all_questions(include_deleted=False):
         """Get all questions"""
-        query = Question.query
-        if not include_deleted:
-            query = query.filter(Question.is_deleted == False)
+        query = Question.query.options(joinedload(Question.question_type))
+        if include_deleted:
+            query = query.execution_options(include_deleted=True)
         return query.order_by(Question.id).all()
 
     @staticmethod
@@ -368,7 +363,7 @@ class QuestionService:
 
                     # Soft delete submitted answers
                     submitted_answers = AnswerSubmitted.query.filter_by(
-                        form_answers_id=fa.id,
+                        form_answer_id=fa.id,
                         is_deleted=False
                     ).all()
 
@@ -40,6 +40,7 @@ class QuestionTypeService:
             # Check if type already exists
             existing = db.session.scalar(
                 select(QuestionType).filter_by(type=type_name)
+                .execution_options(include_deleted=True)
             )
             if existing:
                 return None, "A question type with this name already exists"
@@ -60,8 +61,8 @@ class QuestionTypeService:
         """Get all question types"""
         query = QuestionType.query
         
-        if not include_deleted:
-            query = query.filter(QuestionType.is_deleted == False)
+        if include_deleted:
+            query = query.execution_options(include_deleted=True)
             
         return query.order_by(QuestionType.type).all()
 
@@ -170,7 +171,10 @@ class QuestionTypeService:
             }
 
             # Find all questions of this type (including already deleted ones)
-            questions = Question.query.filter_by(question_type_id=type_id).all()
+            questions = (Question.query
+                         .filter_by(question_type_id=type_id)
+                         .execution_options(include_deleted=True)
+                         .all())
 
             for question in questions:
                 if not question.is_deleted:
@@ -199,7 +203,7 @@ class QuestionTypeService:
 
                         # Get submitted answers for this form answer
                         answers_submitted = AnswerSubmitted.query.filter_by(
-                            form_answers_id=fa.id,
+                            form_answer_id=fa.id,
                             is_deleted=False
                         ).all()
 
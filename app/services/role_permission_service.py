@@ -224,7 +224,8 @@ class RolePermissionService(BaseService):
         Returns:
             Tuple[Optional[RolePermission], Optional[str]]: Updated role permission and error message if any
         """
-        role_permission = RolePermission.query.filter_by(id=role_permission_id).first()
+        # Deleted mappings must stay reachable so administrators can restore them
+        role_permission = RolePermission.get_all_with_deleted().filter_by(id=role_permission_id).first()
         
         if not role_permission:
             return None, "RolePermission not found"
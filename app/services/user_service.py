@@ -7,8 +7,9 @@ from app.models.form import Form
 from app.models.form_question import FormQuestion
 from app.models.form_submission import FormSubmission
 from app.models.role import Role
+from app.models.role_permission import RolePermission
 from app.models.user import User
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload, with_expression
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime
 from app.services.base_service import BaseService
@@ -26,7 +27,8 @@ class UserService(BaseService):
     def create_user(first_name, last_name, email, contact_number, username, password, role_id, environment_id):
         try:
             # Verificar existencia antes de crear
-            if User.query.filter_by(username=username).first():
+            # Usernames stay reserved by soft-deleted users (unique constraint)
+            if User.get_all_with_deleted().filter_by(username=username).first():
                 db.session.rollback()
                 return None, "Username already exists"
             if not validate_email(email):
@@ -69,17 +71,23 @@ class UserService(BaseService):
     def get_user_by_username(username):
         return User.query.filter_by(username=username, is_deleted=False).first()
 
+    @staticmethod
+    def _serialization_options():
+        """Loader options for everything User.to_dict(include_details=True) reads"""
+        return (
+            joinedload(User.role).selectinload(Role.role_permissions).joinedload(RolePermission.permission),
+            joinedload(User.environment),
+            with_expression(User.created_forms_count, User.created_forms_count_expression()),
+        )
+
     @staticmethod
     def get_all_users(include_deleted=False):
         """Get all users with optional inclusion of deleted records"""
         try:
-            query = User.query.options(
-                joinedload(User.role),
-                joinedload(User.environment)
-            )
+            query = User.query.options(*UserService._serialization_options())
             
-            if not include_deleted:
-                query = query.filter(User.is_deleted == False)
+            if include_deleted:
+                query = query.execution_options(include_deleted=True)
                 
             return query.order_by(User.id).all()
         except Exception as e:
@@ -89,12 +97,9 @@ class UserService(BaseService):
     @staticmethod
     def get_all_users_with_relations(include_deleted=False):
         try:
-            query = User.query.options(
-                joinedload(User.role),
-                joinedload(User.environment)
-            )
-            if not include_deleted:
-                query = query.filter(User.is_deleted == False)
+            query = User.query.options(*UserService._serialization_options())
+            if include_deleted:
+                query = query.execution_options(include_deleted=True)
             users = query.order_by(User.id).all()
             return users
         except Exception as e:
@@ -182,7 +187,7 @@ class UserService(BaseService):
     @staticmethod
     def get_users_by_environment(environment_id: int) -> list[User]:
         """Get all non-deleted users in an environment"""
-        return User.query.filter_by(
+        return User.query.options(*UserService._serialization_options()).filter_by(
             environment_id=environment_id,
             is_deleted=False
         ).order_by(User.username).all()
@@ -273,7 +278,7 @@ class UserService(BaseService):
 
             # 6. Soft delete submissions made by this user
             user_submissions = FormSubmission.query.filter_by(
-                submitted_by=user.username,
+                submitted_by_id=user.id,
                 is_deleted=False
             ).all()
 
@@ -0,0 +1,168 @@
+"""
+Response compression negotiated from Accept-Encoding.
+
+Picks br (when the Brotli package is installed) or gzip for text-like
+responses: JSON, HTML, CSV and the like, per COMPRESSION_MIMETYPES.
+Buffered bodies shorter than COMPRESSION_MIN_SIZE go out as they are.
+Streamed bodies are compressed chunk by chunk, and each chunk is flushed
+so clients still see data as it is produced. File downloads
+(send_file, Content-Disposition: attachment) and responses that already
+carry a Content-Encoding are never touched.
+"""
+import logging
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from flask import request
+
+from app.utils.metrics import COMPRESSION_BYTES
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - Brotli is in requirements.txt
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIMETYPES = (
+    'application/json', 'application/problem+json', 'application/javascript', 'application/xml',
+    'text/html', 'text/plain', 'text/css', 'text/csv', 'text/xml', 'image/svg+xml',
+)
+
+
+class _Gzip:
+    """zlib stream in gzip framing"""
+
+    def __init__(self, level: int):
+        self._zlib = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._zlib.compress(data)
+
+    def flush(self) -> bytes:
+        return self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+class _Brotli:
+    def __init__(self, quality: int):
+        self._brotli = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._brotli.process(data)
+
+    def flush(self) -> bytes:
+        return self._brotli.flush()
+
+    def finish(self) -> bytes:
+        return self._brotli.finish()
+
+
+def available_encodings(config) -> list:
+    """Server-preferred encodings this process can produce"""
+    encodings = [name.strip() for name in config['COMPRESSION_ENCODINGS'].split(',') if name.strip()]
+    return [name for name in encodings if name == 'gzip' or (name == 'br' and brotli is not None)]
+
+
+def negotiate_encoding(accept_encodings, offered: list) -> Optional[str]:
+    """
+    Highest-quality encoding the client accepts, ties going to the server's
+    order. ``accept_encodings`` is werkzeug's parsed Accept-Encoding.
+    """
+    best, best_quality = None, 0
+    for name in offered:
+        quality = accept_encodings[name]
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+def _compressor(encoding: str, config):
+    if encoding == 'br':
+        return _Brotli(config['COMPRESSION_BROTLI_QUALITY'])
+    return _Gzip(config['COMPRESSION_GZIP_LEVEL'])
+
+
+def _stream(chunks: Iterable[bytes], compressor) -> Iterator[bytes]:
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def _is_candidate(response, mimetypes) -> bool:
+    if response.status_code < 200 or response.status_code in (204, 304):
+        return False
+    if response.mimetype not in mimetypes:
+        return False
+    if 'Content-Encoding' in response.headers or response.direct_passthrough:
+        return False
+    return not response.headers.get('Content-Disposition', '').lower().startswith('attachment')
+
+
+def compress_response(response, encoding: str, config):
+    """Encode the body in place; returns the same response"""
+    compressor = _compressor(encoding, config)
+
+    if response.is_streamed:
+        chunks = response.response
+        response.response = _stream(chunks, compressor)
+        if hasattr(chunks, 'close'):
+            response.call_on_close(chunks.close)
+        response.headers.pop('Content-Length', None)
+    else:
+        body = response.get_data()
+        if len(body) < config['COMPRESSION_MIN_SIZE']:
+            return response
+        compressed = compressor.compress(body) + compressor.finish()
+        if len(compressed) >= len(body):
+            return response
+        response.set_data(compressed)
+        COMPRESSION_BYTES.inc(encoding, 'original', amount=len(body))
+        COMPRESSION_BYTES.inc(encoding, 'compressed', amount=len(compressed))
+
+    response.headers['Content-Encoding'] = encoding
+    if response.headers.get('ETag'):
+        # The encoded body is a different representation of the resource
+        response.headers['ETag'] = response.headers['ETag'].rstrip('"') + f'-{encoding}"'
+    return response
+
+
+def init_compression(app):
+    """
+    Register the hook that compresses responses. Call it before the other
+    init_* hooks so it runs last and they see the uncompressed body.
+    """
+    app.config.setdefault('COMPRESSION_ENABLED', True)
+    app.config.setdefault('COMPRESSION_ENCODINGS', 'br,gzip')
+    app.config.setdefault('COMPRESSION_MIN_SIZE', 500)
+    app.config.setdefault('COMPRESSION_MIMETYPES', DEFAULT_MIMETYPES)
+    app.config.setdefault('COMPRESSION_BROTLI_QUALITY', 4)
+    app.config.setdefault('COMPRESSION_GZIP_LEVEL', 6)
+    if not app.config['COMPRESSION_ENABLED']:
+        return
+
+    offered = available_encodings(app.config)
+    mimetypes = frozenset(app.config['COMPRESSION_MIMETYPES'])
+    if not offered:
+        logger.warning("Response compression enabled but no usable encoding in COMPRESSION_ENCODINGS")
+        return
+
+    @app.after_request
+    def _compress_response(response):
+        if not _is_candidate(response, mimetypes):
+            return response
+        response.vary.add('Accept-Encoding')
+        encoding = negotiate_encoding(request.accept_encodings, offered)
+        if encoding is None:
+            return response
+        try:
+            return compress_response(response, encoding, app.config)
+        except Exception as e:
+            logger.error(f"Compressing {request.path} with {encoding} failed: {str(e)}")
+            return response
@@ -0,0 +1,120 @@
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class PoolWaitStats:
+    """Thread-safe accumulator for time spent waiting on pool checkouts"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'total_wait_ms': round(self.total_wait * 1000, 3),
+                'avg_wait_ms': round(self.total_wait * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                'max_wait_ms': round(self.max_wait * 1000, 3)
+            }
+
+
+# Shared by every pool instance so stats survive engine.dispose()/recreate()
+wait_stats = PoolWaitStats()
+
+
+# Per-thread state of the checkout in progress: when it started and, if the
+# pool had to open a new connection, when it began connecting
+_checkout = threading.local()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that records how long each checkout waited for a connection.
+    The wait ends at the ``checkout`` event, or when the pool starts opening
+    a new connection, so slow connects are not counted as waiting.
+    """
+
+    def __init__(self, creator, pool_size=5, max_overflow=10, **kwargs):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kwargs)
+        self.max_overflow = max_overflow
+
+    def connect(self):
+        _checkout.started = time.perf_counter()
+        _checkout.connecting = None
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            wait_stats.record(time.perf_counter() - _checkout.started, timed_out=True)
+            raise
+        finally:
+            _checkout.started = None
+
+
+@event.listens_for(Engine, 'do_connect')
+def _mark_connecting(dialect, connection_record, cargs, cparams):
+    if getattr(_checkout, 'started', None) is not None and _checkout.connecting is None:
+        _checkout.connecting = time.perf_counter()
+
+
+@event.listens_for(InstrumentedQueuePool, 'checkout')
+def _record_wait(dbapi_connection, connection_record, connection_proxy):
+    started = getattr(_checkout, 'started', None)
+    if started is None:
+        return
+    wait_stats.record((_checkout.connecting or time.perf_counter()) - started)
+    _checkout.started = None
+
+
+def instrument_engine_options(config) -> None:
+    """
+    Use InstrumentedQueuePool for server databases unless a pool class was
+    configured explicitly. SQLite keeps Flask-SQLAlchemy's defaults.
+    """
+    uri = config.get('SQLALCHEMY_DATABASE_URI') or ''
+    if uri.startswith('sqlite'):
+        return
+    options = dict(config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    options.setdefault('poolclass', InstrumentedQueuePool)
+    config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+
+def pool_status(engine) -> dict:
+    """Current pool occupancy plus accumulated checkout wait times"""
+    pool = engine.pool
+    status = {
+        'pool_class': type(pool).__name__,
+        'status': pool.status()
+    }
+    if isinstance(pool, QueuePool):
+        status.update({
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'idle': pool.checkedin(),
+            # overflow() is negative while the base pool is not yet filled
+            'overflow': max(pool.overflow(), 0),
+            'timeout_s': pool.timeout()
+        })
+    if isinstance(pool, InstrumentedQueuePool):
+        status['max_overflow'] = pool.max_overflow
+        status['wait'] = wait_stats.snapshot()
+    return status
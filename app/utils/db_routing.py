@@ -0,0 +1,156 @@
+"""
+Read-replica routing for the Flask-SQLAlchemy session.
+
+When a ``replica`` bind is configured, safe (GET/HEAD) requests read from
+it. Requests fall back to the primary when the client wrote recently
+(read-your-writes window), when replication lag is above the threshold,
+or as soon as the session flushes.
+
+The read-your-writes window lives with the client, so it holds across
+gunicorn workers and hosts: every successful write sets a signed
+timestamp in the ``db_last_write`` cookie and the ``X-Last-Write``
+response header. Clients that do not keep cookies send the header value
+back on their next requests. Tokens are signed with SECRET_KEY and
+expire with the window.
+"""
+import logging
+import threading
+import time
+from typing import Optional
+
+from flask import g, has_app_context, request
+from flask_sqlalchemy.session import Session
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from sqlalchemy import event, text
+
+logger = logging.getLogger(__name__)
+
+REPLICA_BIND = 'replica'
+READ_ONLY_METHODS = ('GET', 'HEAD')
+
+
+class RoutingSession(Session):
+    """Session that sends reads to the replica bind inside read-only requests"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and _reads_from_replica():
+            engine = self._db.engines.get(REPLICA_BIND)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, 'before_flush')
+def _pin_to_primary(session, flush_context, instances):
+    """A write inside a read-only request sends the rest of it to the primary"""
+    if has_app_context():
+        g.db_read_only = False
+
+
+def _reads_from_replica() -> bool:
+    return has_app_context() and g.get('db_read_only', False)
+
+
+LAST_WRITE_COOKIE = 'db_last_write'
+LAST_WRITE_HEADER = 'X-Last-Write'
+
+
+class WriteTracker:
+    """Signed last-write tokens handed to the client and checked on later reads"""
+
+    def __init__(self, secret_key):
+        self._serializer = URLSafeTimedSerializer(secret_key, salt='db-last-write')
+
+    def token(self) -> str:
+        return self._serializer.dumps(int(time.time()))
+
+    def wrote_within(self, token: Optional[str], seconds: float) -> bool:
+        if not token:
+            return False
+        try:
+            self._serializer.loads(token, max_age=seconds)
+            return True
+        except BadSignature:
+            # Covers expired tokens too (SignatureExpired)
+            return False
+
+
+class ReplicaLagMonitor:
+    """Caches the replica's replay lag so it is measured at most every interval"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self._lag: Optional[float] = None
+
+    def lag_seconds(self, engine, interval: float) -> Optional[float]:
+        """Replay lag in seconds, 0 for non-PostgreSQL stand-ins, None if unknown"""
+        with self._lock:
+            if time.monotonic() - self._checked_at < interval:
+                return self._lag
+            self._checked_at = time.monotonic()
+
+        lag = None
+        try:
+            if engine.dialect.name == 'postgresql':
+                with engine.connect() as connection:
+                    # The replay timestamp keeps ageing while the primary is
+                    # idle, so a replica that has replayed everything it
+                    # received counts as caught up
+                    lag = connection.execute(text(
+                        "SELECT CASE "
+                        "WHEN NOT pg_is_in_recovery() THEN 0 "
+                        "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+                        "END"
+                    )).scalar()
+                    lag = float(lag)
+            else:
+                lag = 0.0
+        except Exception as e:
+            logger.warning(f"Could not measure replica lag: {str(e)}")
+
+        with self._lock:
+            self._lag = lag
+        return lag
+
+
+lag_monitor = ReplicaLagMonitor()
+
+
+def init_replica_routing(app, db):
+    """Register the request hooks that choose primary or replica per request"""
+    app.config.setdefault('REPLICA_READ_YOUR_WRITES_SECONDS', 5.0)
+    app.config.setdefault('REPLICA_MAX_LAG_SECONDS', 5.0)
+    app.config.setdefault('REPLICA_LAG_CHECK_INTERVAL', 5.0)
+    write_tracker = WriteTracker(app.config['SECRET_KEY'])
+
+    @app.before_request
+    def _choose_database():
+        g.db_read_only = False
+        if REPLICA_BIND not in app.config.get('SQLALCHEMY_BINDS', {}):
+            return
+        if request.method not in READ_ONLY_METHODS:
+            return
+
+        token = request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(LAST_WRITE_COOKIE)
+        if write_tracker.wrote_within(token, app.config['REPLICA_READ_YOUR_WRITES_SECONDS']):
+            return
+
+        lag = lag_monitor.lag_seconds(db.engines[REPLICA_BIND], app.config['REPLICA_LAG_CHECK_INTERVAL'])
+        if lag is None or lag > app.config['REPLICA_MAX_LAG_SECONDS']:
+            return
+
+        g.db_read_only = True
+
+    @app.after_request
+    def _track_writes(response):
+        if (REPLICA_BIND in app.config.get('SQLALCHEMY_BINDS', {})
+                and request.method not in READ_ONLY_METHODS + ('OPTIONS',)
+                and response.status_code < 400):
+            window = app.config['REPLICA_READ_YOUR_WRITES_SECONDS']
+            token = write_tracker.token()
+            response.headers[LAST_WRITE_HEADER] = token
+            response.set_cookie(LAST_WRITE_COOKIE, token, max_age=int(window) + 1,
+                                httponly=True, samesite='Lax', secure=request.is_secure)
+        return response
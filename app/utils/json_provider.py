@@ -0,0 +1,78 @@
+"""
+orjson-backed JSON provider for Flask.
+
+Drop-in for DefaultJSONProvider: keys are sorted and datetimes, dates,
+Decimal, UUID and dataclasses come out exactly as the default provider
+writes them (HTTP dates for datetimes), so responses keep the same keys in
+the same order. The one visible difference is that non-ASCII text is sent
+as UTF-8 instead of \\uXXXX escapes. Anything orjson cannot encode or
+would order differently (non-string keys, which the stdlib sorts before
+stringifying; ints beyond 64 bits; unusual dump arguments) falls back to
+the stdlib encoder.
+
+Selected with JSON_PROVIDER ('orjson' or 'default'); without the orjson
+package the default provider stays in place.
+"""
+import logging
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Datetimes and dataclasses go through DefaultJSONProvider.default so their
+# format and key order match the stdlib provider
+_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+) if orjson else 0
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """DefaultJSONProvider with orjson doing the encoding and decoding"""
+
+    def _encode(self, obj, indent: bool = False) -> bytes:
+        option = _OPTIONS if self.sort_keys else _OPTIONS & ~orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs) -> str:
+        # orjson only writes the compact and indent=2 layouts; anything else
+        # (including the stdlib's spaced default) stays with the stdlib
+        compact = kwargs == {'separators': (',', ':')}
+        if not (compact or kwargs == {'indent': 2}):
+            return super().dumps(obj, **kwargs)
+        try:
+            return self._encode(obj, indent=not compact).decode('utf-8')
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Same as the default provider, but the body goes straight from orjson to bytes"""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        try:
+            body = self._encode(obj, indent=indent) + b'\n'
+        except TypeError:
+            return super().response(obj)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def init_json_provider(app):
+    """Install the provider named by JSON_PROVIDER"""
+    app.config.setdefault('JSON_PROVIDER', 'orjson')
+    if app.config['JSON_PROVIDER'] != 'orjson':
+        return
+    if orjson is None:
+        logger.warning("JSON_PROVIDER is 'orjson' but orjson is not installed; using the default provider")
+        return
+    app.json = OrjsonProvider(app)
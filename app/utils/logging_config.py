@@ -1,25 +1,184 @@
 # app/utils/logging_config.py
 
+"""
+Non-blocking application logging.
+
+Request threads only put records on an in-memory queue (QueueHandler); a
+QueueListener thread formats them and does the stream/file I/O. Output is
+plain text or one JSON object per line (LOG_FORMAT=json). Chatty loggers
+can be sampled (LOG_SAMPLE_RATES) or capped per second
+(LOG_RATE_LIMIT_PER_SECOND); warnings and errors always pass.
+"""
+import atexit
+import copy
+import json
 import logging
 import os
-from datetime import datetime
+import queue
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Dict, Optional
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Attributes every LogRecord has; anything else was passed via extra=
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, including any extra= fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName,
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        return json.dumps(entry, default=str)
+
+
+class _QueueHandler(QueueHandler):
+    """Keeps the traceback out of the message so JSON output has it as its own field"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Drops a share of records below WARNING for configured logger prefixes and
+    caps how many such records each logger may emit per second.
+    """
+
+    def __init__(self, sample_rates: Dict[str, float] = None, rate_limit: int = 0):
+        super().__init__()
+        # Longest prefix first so 'app.services.form_service' beats 'app.services'
+        self.sample_rates = sorted((sample_rates or {}).items(), key=lambda item: -len(item[0]))
+        self.rate_limit = rate_limit
+        self._windows: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def _sample_rate(self, name: str) -> float:
+        for prefix, rate in self.sample_rates:
+            if name == prefix or name.startswith(prefix + '.'):
+                return rate
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._sample_rate(record.name)
+        if rate < 1.0 and random.random() >= rate:
+            return False
+        if not self.rate_limit:
+            return True
+
+        second = int(time.monotonic())
+        with self._lock:
+            window = self._windows.get(record.name)
+            if window is None or window[0] != second:
+                window = self._windows[record.name] = [second, 0]
+            window[1] += 1
+            return window[1] <= self.rate_limit
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """'app.views=0.1,app.services.form_service=0.5' -> {prefix: rate}"""
+    rates = {}
+    for item in (value or '').split(','):
+        if '=' in item:
+            prefix, rate = item.split('=', 1)
+            rates[prefix.strip()] = float(rate)
+    return rates
+
+
+def setup_logging(config: dict = None):
+    """
+    Configure the root logger once per process.
+
+    Recognized config keys: LOG_LEVEL, LOG_FORMAT ('text' or 'json'),
+    LOG_FILE, LOG_SAMPLE_RATES (dict or 'prefix=rate,...'),
+    LOG_RATE_LIMIT_PER_SECOND.
+    """
+    global _listener, _queue_handler
+    config = config or {}
+
+    root = logging.getLogger()
+    root.setLevel(config.get('LOG_LEVEL', 'INFO'))
+    if _listener is not None:
+        return _listener
+
+    formatter = JsonFormatter() if config.get('LOG_FORMAT') == 'json' else logging.Formatter(TEXT_FORMAT)
+    handlers = [logging.StreamHandler()]
+    if config.get('LOG_FILE'):
+        log_file = Path(config['LOG_FILE'])
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=5))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = _QueueHandler(log_queue)
+    sample_rates = config.get('LOG_SAMPLE_RATES') or {}
+    if isinstance(sample_rates, str):
+        sample_rates = parse_sample_rates(sample_rates)
+    _queue_handler.addFilter(SamplingFilter(
+        sample_rates=sample_rates,
+        rate_limit=config.get('LOG_RATE_LIMIT_PER_SECOND', 0)
+    ))
+
+    # Replace basicConfig/default handlers so nothing writes synchronously
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    # The listener thread does not survive fork (gunicorn preload_app)
+    os.register_at_fork(after_in_child=_restart_listener)
 
-def setup_logging():
-    """Configure logging for the application"""
-    log_dir = Path('logs')
-    log_dir.mkdir(exist_ok=True)
-    
-    log_file = log_dir / f'app_{datetime.now():%Y%m%d}.log'
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
-    
     # Set SQLAlchemy logging level
-    logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
\ No newline at end of file
+    logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
+    return _listener
+
+
+def _restart_listener():
+    """Give a forked child its own queue and listener thread"""
+    global _listener
+    if _listener is None or _queue_handler is None:
+        return
+    log_queue = queue.SimpleQueue()
+    _queue_handler.queue = log_queue
+    _listener = QueueListener(log_queue, *_listener.handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,406 @@
+"""
+Metrics rendered in the Prometheus text exposition format.
+
+Updates are lock-free on the hot path: every thread writes to its own
+shard, and a scrape sums the shards. The only lock is taken once per
+thread per metric, when its shard is created. Shards of threads that
+have exited are folded into one retired total, so thread churn does not
+grow the shard list.
+
+With METRICS_MULTIPROC_DIR set (gunicorn.conf.py sets it), every worker
+writes its totals to <dir>/metrics_<pid>.json every METRICS_FLUSH_INTERVAL
+seconds and on exit, and a scrape on any worker merges all the files.
+When a worker exits, the master folds its counters and histograms into
+metrics_dead.json and drops its gauges, so series stay monotonic across
+worker restarts.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from flask import g, request
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - gunicorn does not run on Windows either
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+EXPORT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+DEAD_FILE = 'metrics_dead.json'
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class _Metric:
+    """Base class holding one shard dict per thread"""
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, dict]] = []
+        self._retired: dict = {}
+        self._lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._prune()
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def _prune(self):
+        """Fold shards of exited threads into the retired totals; call with the lock held"""
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                self._merge(self._retired, shard)
+        self._shards = live
+
+    def values(self) -> dict:
+        """Totals for this process, keyed by label values"""
+        totals: dict = {}
+        with self._lock:
+            self._prune()
+            self._merge(totals, self._retired)
+            # dict() copies are safe against concurrent inserts from the owning thread
+            shards = [dict(shard) for _, shard in self._shards]
+        for shard in shards:
+            self._merge(totals, shard)
+        return totals
+
+    def _merge(self, target: dict, source: dict):
+        raise NotImplementedError
+
+    def dump(self, values: dict) -> list:
+        return [[list(labels), value] for labels, value in values.items()]
+
+    def load(self, samples: list) -> dict:
+        return {tuple(labels): value for labels, value in samples}
+
+    def render(self, values: Optional[dict] = None) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples(self.values() if values is None else values))
+        return lines
+
+    def _samples(self, values: dict) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, *labels, amount: float = 1.0):
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+    def _merge(self, target: dict, source: dict):
+        for labels, value in source.items():
+            target[labels] = target.get(labels, 0.0) + value
+
+    def _samples(self, values: dict) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {value}"
+            for labels, value in sorted(values.items())
+        ]
+
+
+class Gauge(Counter):
+    """Up/down value; per-thread deltas are summed like a counter"""
+    kind = 'gauge'
+
+    def dec(self, *labels, amount: float = 1.0):
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels):
+        shard = self._shard()
+        series = shard.get(labels)
+        if series is None:
+            # [count per bucket (+Inf last), sum]
+            series = shard[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def _merge(self, target: dict, source: dict):
+        for labels, (counts, total) in source.items():
+            merged = target.get(labels)
+            if merged is None:
+                target[labels] = [list(counts), total]
+            else:
+                merged[0] = [a + b for a, b in zip(merged[0], counts)]
+                merged[1] += total
+
+    def _samples(self, values: dict) -> List[str]:
+        lines = []
+        for labels, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames + ('le',), labels + (le,))} {cumulative}"
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {total}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+REQUESTS = Counter(
+    'http_requests_total', 'HTTP requests handled.',
+    ('blueprint', 'endpoint', 'method', 'status')
+)
+REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds', 'HTTP request latency in seconds.',
+    ('blueprint', 'endpoint', 'method')
+)
+IN_FLIGHT = Gauge('http_requests_in_flight', 'HTTP requests currently being handled.')
+EXPORT_DURATION = Histogram(
+    'export_render_duration_seconds', 'Time spent rendering form exports.',
+    ('format',), buckets=EXPORT_BUCKETS
+)
+ATTACHMENT_BYTES = Counter(
+    'attachment_bytes_total', 'Attachment bytes uploaded (in) and downloaded (out).',
+    ('direction',)
+)
+COMPRESSION_BYTES = Counter(
+    'http_response_compression_bytes_total', 'Buffered response bytes before and after compression.',
+    ('encoding', 'stage')
+)
+
+TRACES_DROPPED_SPANS = Counter(
+    'tracing_dropped_spans_total', 'Spans dropped because the trace export queue was full.'
+)
+
+REGISTRY = [
+    REQUESTS, REQUEST_DURATION, IN_FLIGHT, EXPORT_DURATION, ATTACHMENT_BYTES, COMPRESSION_BYTES,
+    TRACES_DROPPED_SPANS,
+]
+
+
+# Shared directory for multi-process aggregation; set by init_metrics
+_multiproc_dir: Optional[str] = None
+_flusher_pid: Optional[int] = None
+_flusher_lock = threading.Lock()
+_flush_lock = threading.Lock()
+
+
+def _process_file(directory: str, pid: int) -> str:
+    return os.path.join(directory, f'metrics_{pid}.json')
+
+
+@contextmanager
+def _directory_lock(directory: str, exclusive: bool):
+    """Keeps scrapes from reading while a dead worker's file is being folded"""
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(directory, '.lock'), 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _read(path: str) -> dict:
+    try:
+        with open(path) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write(path: str, data: dict):
+    """Atomic replace, so readers never see a partial file"""
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w') as fh:
+        json.dump(data, fh)
+    os.replace(tmp_path, path)
+
+
+def flush(directory: Optional[str] = None):
+    """Write this process's totals to its file in the shared directory"""
+    directory = directory or _multiproc_dir
+    if not directory:
+        return
+    # Serialized so an older snapshot never overwrites a newer one
+    with _flush_lock:
+        _write(_process_file(directory, os.getpid()),
+               {metric.name: metric.dump(metric.values()) for metric in REGISTRY})
+
+
+def mark_process_dead(pid: int, directory: Optional[str] = None):
+    """Fold an exited worker's counters and histograms into the dead file; its gauges go away"""
+    directory = directory or _multiproc_dir
+    path = _process_file(directory, pid) if directory else None
+    if not path or not os.path.exists(path):
+        return
+    with _directory_lock(directory, exclusive=True):
+        dead_path = os.path.join(directory, DEAD_FILE)
+        dead, exited = _read(dead_path), _read(path)
+        for metric in REGISTRY:
+            if metric.kind == 'gauge':
+                continue
+            totals = metric.load(dead.get(metric.name, []))
+            metric._merge(totals, metric.load(exited.get(metric.name, [])))
+            dead[metric.name] = metric.dump(totals)
+        _write(dead_path, dead)
+        os.remove(path)
+
+
+def collect(directory: Optional[str] = None) -> Dict[str, dict]:
+    """
+    Totals per metric across processes. This process publishes its file
+    first and then every process, itself included, counts as its file
+    says; files only grow, so scrapes stay monotonic whichever worker
+    serves them.
+    """
+    directory = directory or _multiproc_dir
+    if not directory:
+        return {metric.name: metric.values() for metric in REGISTRY}
+
+    flush(directory)
+    with _directory_lock(directory, exclusive=False):
+        names = sorted(name for name in os.listdir(directory)
+                       if name.startswith('metrics_') and name.endswith('.json'))
+        files = {name: _read(os.path.join(directory, name)) for name in names}
+    values = {metric.name: {} for metric in REGISTRY}
+    for name, data in files.items():
+        for metric in REGISTRY:
+            if metric.kind == 'gauge' and name == DEAD_FILE:
+                continue
+            metric._merge(values[metric.name], metric.load(data.get(metric.name, [])))
+    return values
+
+
+def _flush_loop(interval: float):
+    while True:
+        time.sleep(interval)
+        try:
+            flush()
+        except Exception as e:
+            logger.warning(f"Could not write metrics file: {str(e)}")
+
+
+def _ensure_flusher(interval: float):
+    """Start the periodic writer once per process (workers fork after the app loads)"""
+    global _flusher_pid
+    if _flusher_pid == os.getpid():
+        return
+    with _flusher_lock:
+        if _flusher_pid == os.getpid():
+            return
+        _flusher_pid = os.getpid()
+        threading.Thread(target=_flush_loop, args=(interval,), name='metrics-flush', daemon=True).start()
+
+
+def _pool_lines(engines: Dict) -> List[str]:
+    """Pool gauges read at scrape time from each bind's engine (of the worker serving the scrape)"""
+    from app.utils.db_pool import pool_status
+
+    gauges = {
+        'size': ('db_pool_size', 'Configured pool size.'),
+        'checked_out': ('db_pool_checked_out', 'Connections currently checked out.'),
+        'idle': ('db_pool_idle', 'Idle connections in the pool.'),
+        'overflow': ('db_pool_overflow', 'Overflow connections currently open.'),
+    }
+    samples = {key: [] for key in gauges}
+    wait = None
+    for bind, engine in engines.items():
+        status = pool_status(engine)
+        label = _format_labels(('bind',), ('default' if bind is None else bind,))
+        for key in gauges:
+            if key in status:
+                samples[key].append(f"{gauges[key][0]}{label} {status[key]}")
+        wait = status.get('wait', wait)
+
+    lines = []
+    for key, (name, documentation) in gauges.items():
+        if samples[key]:
+            lines += [f"# HELP {name} {documentation}", f"# TYPE {name} gauge", *samples[key]]
+    if wait:
+        # Wait stats are shared by every instrumented pool in the process
+        lines += [
+            "# HELP db_pool_checkout_wait_seconds_total Time spent waiting for pool checkouts.",
+            "# TYPE db_pool_checkout_wait_seconds_total counter",
+            f"db_pool_checkout_wait_seconds_total {wait['total_wait_ms'] / 1000}",
+            "# HELP db_pool_checkout_timeouts_total Pool checkouts that timed out.",
+            "# TYPE db_pool_checkout_timeouts_total counter",
+            f"db_pool_checkout_timeouts_total {wait['timeouts']}",
+        ]
+    return lines
+
+
+def render_metrics(engines: Dict) -> str:
+    values = collect()
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render(values[metric.name]))
+    lines.extend(_pool_lines(engines))
+    return '\n'.join(lines) + '\n'
+
+
+def init_metrics(app):
+    """Register the request hooks that feed the HTTP metrics"""
+    global _multiproc_dir
+    app.config.setdefault('METRICS_ENABLED', False)
+    app.config.setdefault('METRICS_MULTIPROC_DIR', None)
+    app.config.setdefault('METRICS_FLUSH_INTERVAL', 5.0)
+    if not app.config['METRICS_ENABLED']:
+        return
+
+    _multiproc_dir = app.config['METRICS_MULTIPROC_DIR']
+    if _multiproc_dir:
+        os.makedirs(_multiproc_dir, exist_ok=True)
+
+    @app.before_request
+    def _start_request_metrics():
+        if _multiproc_dir:
+            _ensure_flusher(app.config['METRICS_FLUSH_INTERVAL'])
+        g.metrics_start = time.perf_counter()
+        IN_FLIGHT.inc()
+
+    @app.after_request
+    def _record_request_metrics(response):
+        start = g.get('metrics_start')
+        if start is not None:
+            blueprint = request.blueprint or ''
+            endpoint = request.endpoint or 'unmatched'
+            REQUESTS.inc(blueprint, endpoint, request.method, str(response.status_code))
+            REQUEST_DURATION.observe(time.perf_counter() - start, blueprint, endpoint, request.method)
+        return response
+
+    @app.teardown_request
+    def _finish_request_metrics(exc):
+        if g.pop('metrics_start', None) is not None:
+            IN_FLIGHT.dec()
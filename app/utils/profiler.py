@@ -0,0 +1,145 @@
+"""
+On-demand request profiling for super users.
+
+Send ``X-Profile: 1`` (or ``?_profile=1``) with a request authenticated
+as a super user and it runs under cProfile. The stats are saved as a
+``.prof`` file (pstats format; loadable by snakeviz, flameprof or
+gprof2dot) in PROFILE_DIR, which keeps at most PROFILE_MAX_FILES files.
+Requests without the flag only pay for one header/arg lookup.
+"""
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from flask import current_app, g, request
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_ARG = '_profile'
+_UNSAFE = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+def _requested() -> bool:
+    return bool(request.headers.get(PROFILE_HEADER) or request.args.get(PROFILE_ARG))
+
+
+def _is_super_user() -> bool:
+    from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+    from app.services.auth_service import AuthService
+    try:
+        verify_jwt_in_request(optional=True)
+        identity = get_jwt_identity()
+        user = AuthService.get_current_user(identity) if identity else None
+        return bool(user and user.role and user.role.is_super_user)
+    except Exception:
+        return False
+
+
+def profile_dir() -> str:
+    return current_app.config['PROFILE_DIR']
+
+
+def list_profiles() -> List[dict]:
+    """Saved profiles, newest first"""
+    directory = profile_dir()
+    if not os.path.isdir(directory):
+        return []
+    profiles = []
+    for name in os.listdir(directory):
+        if not name.endswith('.prof'):
+            continue
+        stat = os.stat(os.path.join(directory, name))
+        profiles.append({
+            'name': name,
+            'size': stat.st_size,
+            'created_at': datetime.utcfromtimestamp(stat.st_mtime).isoformat()
+        })
+    return sorted(profiles, key=lambda profile: profile['created_at'], reverse=True)
+
+
+def profile_path(name: str) -> Optional[str]:
+    """Absolute path of a saved profile, or None for unknown or unsafe names"""
+    if name != os.path.basename(name) or not name.endswith('.prof'):
+        return None
+    path = os.path.join(profile_dir(), name)
+    return path if os.path.isfile(path) else None
+
+
+def profile_summary(path: str, limit: int = 40, sort: str = 'cumulative') -> str:
+    """Text report of the top functions in a saved profile"""
+    output = io.StringIO()
+    pstats.Stats(path, stream=output).strip_dirs().sort_stats(sort).print_stats(limit)
+    return output.getvalue()
+
+
+def _prune(directory: str, max_files: int):
+    files = sorted(
+        (os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.prof')),
+        key=os.path.getmtime
+    )
+    for path in files[:max(len(files) - max_files, 0)]:
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.warning(f"Could not remove old profile {path}: {str(e)}")
+
+
+def _save(profiler: cProfile.Profile, elapsed: float) -> str:
+    directory = profile_dir()
+    os.makedirs(directory, exist_ok=True)
+    endpoint = _UNSAFE.sub('_', request.endpoint or 'unmatched')
+    name = f"{datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')}_{request.method}_{endpoint}_{elapsed * 1000:.0f}ms.prof"
+    profiler.dump_stats(os.path.join(directory, name))
+    _prune(directory, current_app.config['PROFILE_MAX_FILES'])
+    return name
+
+
+def init_profiler(app):
+    """Register the request hooks that profile flagged super-user requests"""
+    app.config.setdefault('PROFILING_ENABLED', True)
+    app.config.setdefault('PROFILE_DIR', os.path.join(os.path.dirname(app.root_path), 'profiles'))
+    app.config.setdefault('PROFILE_MAX_FILES', 50)
+
+    if not app.config['PROFILING_ENABLED']:
+        return
+
+    @app.before_request
+    def _start_profile():
+        if not _requested() or not _is_super_user():
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            # Another profiler is already active in this thread
+            logger.warning(f"Could not start request profiler: {str(e)}")
+            return
+        g.profiler = profiler
+        g.profile_start = time.perf_counter()
+
+    @app.after_request
+    def _save_profile(response):
+        profiler = g.pop('profiler', None)
+        if profiler is None:
+            return response
+        profiler.disable()
+        try:
+            name = _save(profiler, time.perf_counter() - g.pop('profile_start'))
+            response.headers['X-Profile-Id'] = name
+            logger.info(f"Saved request profile {name}")
+        except Exception as e:
+            logger.error(f"Error saving request profile: {str(e)}")
+        return response
+
+    @app.teardown_request
+    def _stop_profile(exc):
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            profiler.disable()
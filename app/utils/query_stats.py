@@ -0,0 +1,107 @@
+"""
+Per-request SQL instrumentation.
+
+Counts statements and cumulative database time for every request, and
+warns when the same statement shape runs more than N_PLUS_ONE_THRESHOLD
+times in one request (the usual signature of lazy loads inside to_dict).
+"""
+import logging
+import re
+import time
+from collections import Counter
+from typing import List, Tuple
+
+from flask import g, has_app_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r'\s+')
+# Expanded IN lists differ only in placeholder count: "IN (?, ?, ?)" -> "IN (?)"
+_PLACEHOLDER_LIST = re.compile(r'\((?:\s*(?:\?|%\(\w+\)s|%s|:\w+)\s*,)+\s*(?:\?|%\(\w+\)s|%s|:\w+)\s*\)')
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a compiled statement so repeated queries compare equal"""
+    return _PLACEHOLDER_LIST.sub('(?)', _WHITESPACE.sub(' ', statement).strip())
+
+
+class QueryStats:
+    """Statements executed during one request"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.total_time += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed more than threshold times, most frequent first"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+
+def current_stats():
+    """QueryStats for the active request, or None outside one"""
+    if not has_app_context():
+        return None
+    return g.get('query_stats')
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _start_timer(conn, cursor, statement, parameters, context, executemany):
+    if current_stats() is not None:
+        conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    stats = current_stats()
+    starts = conn.info.get('query_start')
+    if stats is None or not starts:
+        return
+    stats.record(statement, time.perf_counter() - starts.pop())
+
+
+@event.listens_for(Engine, 'handle_error')
+def _discard_timer(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get('query_start'):
+        connection.info['query_start'].pop()
+
+
+def init_query_stats(app):
+    """Register the request hooks that collect and report query statistics"""
+    app.config.setdefault('QUERY_STATS_ENABLED', True)
+    app.config.setdefault('N_PLUS_ONE_THRESHOLD', 10)
+    if app.config.get('QUERY_STATS_HEADERS') is None:
+        # Headers expose internals; only send them in debug/testing by default
+        app.config['QUERY_STATS_HEADERS'] = app.debug or app.testing
+
+    if not app.config['QUERY_STATS_ENABLED']:
+        return
+
+    @app.before_request
+    def _start_query_stats():
+        g.query_stats = QueryStats()
+
+    @app.after_request
+    def _report_query_stats(response):
+        stats = g.pop('query_stats', None)
+        if stats is None:
+            return response
+
+        for shape, count in stats.repeated(app.config['N_PLUS_ONE_THRESHOLD']):
+            logger.warning(
+                f"Possible N+1 in {request.endpoint} ({request.method} {request.path}): "
+                f"{count}x {shape[:300]}"
+            )
+
+        if app.config['QUERY_STATS_HEADERS']:
+            response.headers['X-DB-Queries'] = str(stats.count)
+            response.headers['X-DB-Time'] = f"{stats.total_time * 1000:.2f}ms"
+        return response
@@ -0,0 +1,202 @@
+"""
+Slow-query log.
+
+Statements slower than SLOW_QUERY_MS are logged with their normalized
+shape, redacted parameters, duration and the service function that ran
+them. With SLOW_QUERY_EXPLAIN on, the plan for the first
+SLOW_QUERY_EXPLAIN_LIMIT occurrences of each shape is written to a
+rotating file (EXPLAIN (ANALYZE, BUFFERS) for PostgreSQL SELECTs).
+"""
+import logging
+import os
+import sys
+import threading
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from logging.handlers import RotatingFileHandler
+from typing import Optional
+
+from sqlalchemy import event
+
+from app.utils.query_stats import statement_shape
+
+logger = logging.getLogger(__name__)
+explain_logger = logging.getLogger(f"{__name__}.explain")
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVICES_DIR = os.path.join(APP_DIR, 'services') + os.sep
+UTILS_DIR = os.path.join(APP_DIR, 'utils') + os.sep
+
+# Bound on the number of distinct shapes remembered for the explain limit
+MAX_TRACKED_SHAPES = 1000
+EXPLAINABLE = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH')
+
+
+def explain_prefix(dialect_name: str, analyze: bool = False) -> str:
+    if dialect_name == 'sqlite':
+        return 'EXPLAIN QUERY PLAN '
+    if dialect_name == 'postgresql' and analyze:
+        return 'EXPLAIN (ANALYZE, BUFFERS) '
+    return 'EXPLAIN '
+
+
+def _redact(value):
+    """Keep numbers, dates and flags; hide anything that could be user data"""
+    if value is None or isinstance(value, (bool, int, float, Decimal, date, datetime)):
+        return value
+    if isinstance(value, (str, bytes)):
+        return f"<{type(value).__name__} len={len(value)}>"
+    return f"<{type(value).__name__}>"
+
+
+def redact_parameters(parameters, executemany: bool = False):
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return {key: _redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_redact(value) for value in parameters]
+    return _redact(parameters)
+
+
+def calling_function() -> str:
+    """The innermost service function on the stack, else the innermost app frame"""
+    fallback = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(APP_DIR + os.sep) and not filename.startswith(UTILS_DIR):
+            code = frame.f_code
+            location = f"{frame.f_globals.get('__name__')}:{getattr(code, 'co_qualname', code.co_name)}:{frame.f_lineno}"
+            if filename.startswith(SERVICES_DIR):
+                return location
+            fallback = fallback or location
+        frame = frame.f_back
+    return fallback or 'unknown'
+
+
+class SlowQueryLog:
+    """Engine listeners that time statements and report the slow ones"""
+
+    def __init__(self, threshold_ms: float, explain: bool = False, explain_limit: int = 3):
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self.explain_limit = explain_limit
+        self._explained = {}
+        self._lock = threading.Lock()
+
+    def attach(self, engine):
+        event.listen(engine, 'before_cursor_execute', self._before)
+        event.listen(engine, 'after_cursor_execute', self._after)
+        event.listen(engine, 'handle_error', self._discard)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('slow_query_start', []).append(time.perf_counter())
+
+    def _discard(self, exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get('slow_query_start'):
+            connection.info['slow_query_start'].pop()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get('slow_query_start')
+        if not starts:
+            return
+        duration = time.perf_counter() - starts.pop()
+        if duration < self.threshold:
+            return
+
+        shape = statement_shape(statement)
+        caller = calling_function()
+        params = redact_parameters(parameters, executemany)
+        logger.warning(
+            f"Slow query ({duration * 1000:.1f} ms) from {caller}: {shape[:1000]} | params={params}"
+        )
+
+        explainable = statement.lstrip().upper().startswith(EXPLAINABLE)
+        if self.explain and explainable and not executemany and self._should_explain(shape):
+            plan = self._explain(conn, cursor, statement, parameters)
+            explain_logger.info(
+                f"{duration * 1000:.1f} ms from {caller}\n{shape}\nparams={params}\n"
+                + ('\n'.join(plan) if plan else '(plan unavailable)') + '\n'
+            )
+
+    def _should_explain(self, shape: str) -> bool:
+        with self._lock:
+            seen = self._explained.get(shape, 0)
+            if seen >= self.explain_limit:
+                return False
+            if seen == 0 and len(self._explained) >= MAX_TRACKED_SHAPES:
+                return False
+            self._explained[shape] = seen + 1
+            return True
+
+    def _explain(self, conn, cursor, statement, parameters) -> Optional[list]:
+        """Run EXPLAIN on the raw DBAPI connection so no engine events fire"""
+        dialect = conn.dialect.name
+        # ANALYZE executes the statement again; only do that for reads
+        analyze = statement.lstrip().upper().startswith('SELECT')
+        explain_cursor = cursor.connection.cursor()
+        savepoint = dialect == 'postgresql'
+        try:
+            # A failed EXPLAIN must not abort the caller's transaction
+            if savepoint:
+                explain_cursor.execute('SAVEPOINT slow_query_explain')
+            explain_cursor.execute(explain_prefix(dialect, analyze) + statement, parameters)
+            plan = [' | '.join(str(column) for column in row) for row in explain_cursor.fetchall()]
+            if savepoint:
+                explain_cursor.execute('RELEASE SAVEPOINT slow_query_explain')
+            return plan
+        except Exception as e:
+            if savepoint:
+                try:
+                    explain_cursor.execute('ROLLBACK TO SAVEPOINT slow_query_explain')
+                except Exception:
+                    pass
+            logger.warning(f"Could not capture plan for slow query: {str(e)}")
+            return None
+        finally:
+            explain_cursor.close()
+
+
+def _configure_explain_file(path: str, max_bytes: int, backup_count: int):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    for handler in explain_logger.handlers:
+        if isinstance(handler, RotatingFileHandler) and handler.baseFilename == os.path.abspath(path):
+            return
+    handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count)
+    handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+    explain_logger.addHandler(handler)
+    explain_logger.setLevel(logging.INFO)
+    explain_logger.propagate = False
+
+
+def init_slow_query_log(app, db):
+    """Attach the slow-query listeners to every engine of the app"""
+    app.config.setdefault('SLOW_QUERY_MS', 500)
+    app.config.setdefault('SLOW_QUERY_EXPLAIN', False)
+    app.config.setdefault('SLOW_QUERY_EXPLAIN_LIMIT', 3)
+    app.config.setdefault('SLOW_QUERY_LOG_FILE', os.path.join(os.path.dirname(APP_DIR), 'logs', 'slow_queries.log'))
+    app.config.setdefault('SLOW_QUERY_LOG_MAX_BYTES', 5 * 1024 * 1024)
+    app.config.setdefault('SLOW_QUERY_LOG_BACKUPS', 5)
+
+    if not app.config['SLOW_QUERY_MS']:
+        return None
+
+    slow_log = SlowQueryLog(
+        threshold_ms=app.config['SLOW_QUERY_MS'],
+        explain=app.config['SLOW_QUERY_EXPLAIN'],
+        explain_limit=app.config['SLOW_QUERY_EXPLAIN_LIMIT']
+    )
+    if slow_log.explain:
+        _configure_explain_file(
+            app.config['SLOW_QUERY_LOG_FILE'],
+            app.config['SLOW_QUERY_LOG_MAX_BYTES'],
+            app.config['SLOW_QUERY_LOG_BACKUPS']
+        )
+
+    with app.app_context():
+        for engine in db.engines.values():
+            slow_log.attach(engine)
+    return slow_log
@@ -0,0 +1,433 @@
+"""
+Lightweight request tracing.
+
+Each request gets a root span; the ``traced`` decorator opens child spans
+for views, controllers, services and SQL statements, so a slow request can
+be broken down by layer (auth, validation, service, db, file_io, ...).
+The active span lives in a contextvar, so nesting follows the call stack.
+
+Finished traces are exported off the request thread, in batches, either
+as JSON lines (TRACING_EXPORTER=jsonl) or as OTLP/HTTP JSON to a collector
+(TRACING_EXPORTER=otlp). The export queue is bounded; when the exporter
+falls behind, new traces are dropped and counted in
+tracing_dropped_spans_total instead of piling up in memory. With
+TRACING_ENABLED off nothing is wrapped.
+
+TRACING_SAMPLE_RATE applies to every request. An incoming W3C traceparent
+keeps its trace id, but its sampled flag only decides sampling when
+TRACING_TRUST_PARENT is set (e.g. behind a gateway that starts traces).
+"""
+import contextvars
+import functools
+import importlib
+import inspect
+import json
+import logging
+import os
+import pkgutil
+import queue
+import random
+import threading
+import time
+import urllib.request
+from typing import Callable, Dict, List, Optional
+
+from flask import g, request
+from sqlalchemy import event
+
+from app.utils.metrics import TRACES_DROPPED_SPANS
+
+logger = logging.getLogger(__name__)
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar('current_span', default=None)
+
+# Layer overrides for classes and methods that are not plain service logic
+CLASS_LAYERS = {
+    'AuthService': 'auth',
+    'PermissionManager': 'auth',
+}
+METHOD_LAYERS = {
+    'AttachmentService.save_file': 'file_io',
+    'AttachmentService.physically_delete_file': 'file_io',
+    'AttachmentService.verify_file_integrity': 'file_io',
+    'AttachmentService.cleanup_orphaned_files': 'file_io',
+    'ExportService.export_as_pdf': 'render',
+    'ExportService.export_as_docx': 'render',
+}
+
+
+class Span:
+    __slots__ = ('trace', 'span_id', 'parent_id', 'name', 'layer', 'attributes',
+                 'start_ns', 'end_ns', 'error', '_start', 'duration')
+
+    def __init__(self, trace: 'Trace', name: str, layer: str, parent: Optional['Span'], attributes: dict):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else trace.parent_span_id
+        self.name = name
+        self.layer = layer
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.error = None
+        self._start = time.perf_counter()
+        self.duration = 0.0
+
+    def finish(self, error: Optional[BaseException] = None):
+        self.duration = time.perf_counter() - self._start
+        self.end_ns = self.start_ns + int(self.duration * 1e9)
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        self.trace.spans.append(self)
+
+    def to_dict(self) -> dict:
+        return {
+            'trace_id': self.trace.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'layer': self.layer,
+            'start_ns': self.start_ns,
+            'duration_ms': round(self.duration * 1000, 3),
+            'attributes': self.attributes,
+            'error': self.error,
+        }
+
+
+class Trace:
+    """All spans finished during one request"""
+
+    def __init__(self, trace_id: Optional[str] = None, parent_span_id: Optional[str] = None):
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.parent_span_id = parent_span_id
+        self.spans: List[Span] = []
+
+    def layer_breakdown(self) -> Dict[str, float]:
+        """Exclusive milliseconds per layer (span time minus its children's time)"""
+        child_time: Dict[str, float] = {}
+        for span in self.spans:
+            if span.parent_id:
+                child_time[span.parent_id] = child_time.get(span.parent_id, 0.0) + span.duration
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            exclusive = max(span.duration - child_time.get(span.span_id, 0.0), 0.0)
+            totals[span.layer] = totals.get(span.layer, 0.0) + exclusive
+        return {layer: round(seconds * 1000, 3) for layer, seconds in sorted(totals.items())}
+
+
+class span:
+    """Context manager opening a child span of the current one (no-op outside a trace)"""
+
+    def __init__(self, name: str, layer: str = 'app', **attributes):
+        self.name = name
+        self.layer = layer
+        self.attributes = attributes
+        self._span = None
+        self._token = None
+
+    def __enter__(self):
+        parent = _current_span.get()
+        if parent is not None:
+            self._span = Span(parent.trace, self.name, self.layer, parent, self.attributes)
+            self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._span is not None:
+            _current_span.reset(self._token)
+            self._span.finish(exc)
+        return False
+
+
+def traced(name: Optional[str] = None, layer: str = 'app'):
+    """Decorator recording a span around each call while a trace is active"""
+    def decorator(func: Callable):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with span(span_name, layer):
+                return func(*args, **kwargs)
+
+        wrapper.__traced__ = True
+        return wrapper
+    return decorator
+
+
+def instrument_class(cls, layer: str):
+    """Wrap every function, staticmethod and classmethod defined on cls"""
+    class_layer = CLASS_LAYERS.get(cls.__name__, layer)
+    for attr_name, attr in list(vars(cls).items()):
+        if attr_name.startswith('__'):
+            continue
+        if isinstance(attr, (staticmethod, classmethod)):
+            func = attr.__func__
+        elif inspect.isfunction(attr):
+            func = attr
+        else:
+            continue
+        if getattr(func, '__traced__', False):
+            continue
+
+        qualname = f"{cls.__name__}.{attr_name}"
+        method_layer = METHOD_LAYERS.get(qualname) or ('validation' if attr_name.startswith(('validate', '_validate')) else class_layer)
+        wrapped = traced(qualname, method_layer)(func)
+        if isinstance(attr, staticmethod):
+            wrapped = staticmethod(wrapped)
+        elif isinstance(attr, classmethod):
+            wrapped = classmethod(wrapped)
+        setattr(cls, attr_name, wrapped)
+
+
+def instrument_package(package_name: str, layer: str):
+    """Instrument the classes defined in every module of a package"""
+    package = importlib.import_module(package_name)
+    for module_info in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{package_name}.{module_info.name}")
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == module.__name__:
+                instrument_class(cls, layer)
+
+
+class SpanExporter:
+    """Exports finished traces in batches from a background thread"""
+
+    def __init__(self, queue_size: int = 2048, batch_size: int = 64, batch_delay: float = 1.0):
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.dropped_spans = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def submit(self, trace: Trace) -> bool:
+        """Queue a trace for export; False when the queue is full and it was dropped"""
+        # Start lazily, and again in each forked worker
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._queue = queue.Queue(maxsize=self.queue_size)
+                    self._thread = threading.Thread(target=self._run, name='span-exporter', daemon=True)
+                    self._thread.start()
+                    self._pid = os.getpid()
+        try:
+            self._queue.put_nowait(trace)
+            return True
+        except queue.Full:
+            self.dropped_spans += len(trace.spans)
+            TRACES_DROPPED_SPANS.inc(amount=len(trace.spans))
+            return False
+
+    def _next_batch(self) -> List[Trace]:
+        """Block for one trace, then gather more until the batch is full or batch_delay passes"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.batch_delay
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                self.export(batch)
+            except Exception as e:
+                logger.warning(f"Could not export {len(batch)} traces: {str(e)}")
+
+    def export(self, traces: List[Trace]):
+        raise NotImplementedError
+
+
+class JsonlExporter(SpanExporter):
+    """One JSON object per span appended to a local file"""
+
+    def __init__(self, path: str, **options):
+        super().__init__(**options)
+        self.path = path
+
+    def export(self, traces: List[Trace]):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, 'a') as f:
+            f.write(''.join(
+                json.dumps(s.to_dict(), default=str) + '\n' for trace in traces for s in trace.spans
+            ))
+
+
+class OtlpHttpExporter(SpanExporter):
+    """POSTs spans as OTLP/HTTP JSON (e.g. http://collector:4318/v1/traces)"""
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0, **options):
+        super().__init__(**options)
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+
+    @staticmethod
+    def _attribute(key, value) -> dict:
+        if isinstance(value, bool):
+            return {'key': key, 'value': {'boolValue': value}}
+        if isinstance(value, int):
+            return {'key': key, 'value': {'intValue': str(value)}}
+        if isinstance(value, float):
+            return {'key': key, 'value': {'doubleValue': value}}
+        return {'key': key, 'value': {'stringValue': str(value)}}
+
+    def payload(self, traces: List[Trace]) -> dict:
+        spans = []
+        for s in (s for trace in traces for s in trace.spans):
+            attributes = {'layer': s.layer, **s.attributes}
+            spans.append({
+                'traceId': s.trace.trace_id,
+                'spanId': s.span_id,
+                'parentSpanId': s.parent_id or '',
+                'name': s.name,
+                'kind': 2 if s.layer == 'http' else 1,
+                'startTimeUnixNano': str(s.start_ns),
+                'endTimeUnixNano': str(s.end_ns),
+                'attributes': [self._attribute(k, v) for k, v in attributes.items()],
+                'status': {'code': 2, 'message': s.error} if s.error else {'code': 1},
+            })
+        return {'resourceSpans': [{
+            'resource': {'attributes': [self._attribute('service.name', self.service_name)]},
+            'scopeSpans': [{'scope': {'name': __name__}, 'spans': spans}]
+        }]}
+
+    def export(self, traces: List[Trace]):
+        body = json.dumps(self.payload(traces)).encode()
+        http_request = urllib.request.Request(
+            self.endpoint, data=body, headers={'Content-Type': 'application/json'}, method='POST'
+        )
+        with urllib.request.urlopen(http_request, timeout=self.timeout) as response:
+            response.read()
+
+
+def _is_hex(value: str, length: int) -> bool:
+    return len(value) == length and all(c in '0123456789abcdef' for c in value) and value.strip('0') != ''
+
+
+def _parse_traceparent(header: Optional[str]):
+    """W3C traceparent '00-<trace id>-<parent id>-<flags>' -> (trace id, parent id, sampled)"""
+    parts = (header or '').split('-')
+    if len(parts) == 4 and _is_hex(parts[1], 32) and _is_hex(parts[2], 16) and len(parts[3]) == 2:
+        try:
+            return parts[1], parts[2], bool(int(parts[3], 16) & 0x01)
+        except ValueError:
+            pass
+    return None, None, None
+
+
+def _should_sample(parent_sampled: Optional[bool], trust_parent: bool, rate: float) -> bool:
+    """A trusted parent's sampled flag wins; everything else gets the local rate"""
+    if trust_parent and parent_sampled is not None:
+        return parent_sampled
+    return random.random() < rate
+
+
+def _instrument_views(app):
+    for endpoint, view in list(app.view_functions.items()):
+        if not getattr(view, '__traced__', False):
+            app.view_functions[endpoint] = traced(endpoint, 'view')(view)
+
+
+def _instrument_engines(db):
+    from app.utils.query_stats import statement_shape
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        sql_span = span('db.query', 'db', statement=statement_shape(statement)[:500])
+        sql_span.__enter__()
+        conn.info.setdefault('trace_spans', []).append(sql_span)
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        spans = conn.info.get('trace_spans')
+        if spans:
+            spans.pop().__exit__(None, None, None)
+
+    def on_error(exception_context):
+        connection = exception_context.connection
+        spans = connection.info.get('trace_spans') if connection is not None else None
+        if spans:
+            error = exception_context.original_exception
+            spans.pop().__exit__(type(error), error, None)
+
+    for engine in db.engines.values():
+        event.listen(engine, 'before_cursor_execute', before)
+        event.listen(engine, 'after_cursor_execute', after)
+        event.listen(engine, 'handle_error', on_error)
+
+
+def init_tracing(app, db):
+    """
+    Instrument views, controllers, services and SQL, and trace requests.
+    Call after blueprints are registered.
+    """
+    app.config.setdefault('TRACING_ENABLED', False)
+    app.config.setdefault('TRACING_SAMPLE_RATE', 1.0)
+    app.config.setdefault('TRACING_TRUST_PARENT', False)
+    app.config.setdefault('TRACING_QUEUE_SIZE', 2048)
+    app.config.setdefault('TRACING_BATCH_SIZE', 64)
+    app.config.setdefault('TRACING_BATCH_DELAY', 1.0)
+    app.config.setdefault('TRACING_EXPORTER', 'jsonl')
+    app.config.setdefault('TRACING_JSONL_PATH', os.path.join(os.path.dirname(app.root_path), 'logs', 'traces.jsonl'))
+    app.config.setdefault('TRACING_OTLP_ENDPOINT', 'http://localhost:4318/v1/traces')
+    app.config.setdefault('TRACING_SERVICE_NAME', 'maintenance-executions-api')
+
+    if not app.config['TRACING_ENABLED']:
+        return None
+
+    options = {
+        'queue_size': app.config['TRACING_QUEUE_SIZE'],
+        'batch_size': app.config['TRACING_BATCH_SIZE'],
+        'batch_delay': app.config['TRACING_BATCH_DELAY'],
+    }
+    if app.config['TRACING_EXPORTER'] == 'otlp':
+        exporter = OtlpHttpExporter(app.config['TRACING_OTLP_ENDPOINT'], app.config['TRACING_SERVICE_NAME'], **options)
+    else:
+        exporter = JsonlExporter(app.config['TRACING_JSONL_PATH'], **options)
+
+    instrument_package('app.services', 'service')
+    instrument_package('app.controllers', 'controller')
+    from app.utils.permission_manager import PermissionManager
+    instrument_class(PermissionManager, 'auth')
+    _instrument_views(app)
+    _instrument_engines(db)
+
+    @app.before_request
+    def _start_trace():
+        trace_id, parent_id, parent_sampled = _parse_traceparent(request.headers.get('traceparent'))
+        if not _should_sample(parent_sampled, app.config['TRACING_TRUST_PARENT'], app.config['TRACING_SAMPLE_RATE']):
+            return
+        trace = Trace(trace_id, parent_id)
+        root = Span(trace, f"{request.method} {request.path}", 'http', None,
+                    {'http.method': request.method, 'http.route': str(request.url_rule or request.path)})
+        g.trace_root = root
+        g.trace_token = _current_span.set(root)
+
+    @app.after_request
+    def _tag_trace(response):
+        root = g.get('trace_root')
+        if root is not None:
+            root.attributes['http.status_code'] = response.status_code
+            response.headers['X-Trace-Id'] = root.trace.trace_id
+        return response
+
+    @app.teardown_request
+    def _finish_trace(exc):
+        root = g.pop('trace_root', None)
+        if root is None:
+            return
+        _current_span.reset(g.pop('trace_token'))
+        root.finish(exc)
+        root.attributes['layers_ms'] = json.dumps(root.trace.layer_breakdown())
+        exporter.submit(root.trace)
+
+    return exporter
@@ -16,6 +16,8 @@ from .form_question_views import form_question_bp
 from .form_answer_views import form_answer_bp
 from .frontend_views import frontend_bp
 from .export_views import export_bp
+from .admin_views import admin_bp
+from .metrics_views import metrics_bp
 
 def register_blueprints(app):
     blueprints = [
@@ -34,6 +36,8 @@ def register_blueprints(app):
         (form_question_bp, '/api/form-questions'),
         (form_answer_bp, '/api/form-answers'),
         (export_bp, '/api/export'),
+        (admin_bp, '/api/admin'),
+        (metrics_bp, ''),
         (frontend_bp, ''),
     ]
 
@@ -0,0 +1,55 @@
+from flask import Blueprint, jsonify, request, send_file
+from flask_jwt_extended import jwt_required
+from app import db
+from app.utils.db_pool import pool_status
+from app.utils.profiler import list_profiles, profile_path, profile_summary
+from app.utils.permission_manager import PermissionManager, RoleType
+import logging
+
+logger = logging.getLogger(__name__)
+
+admin_bp = Blueprint('admin', __name__)
+
+@admin_bp.route('/db-pool', methods=['GET'])
+@jwt_required()
+@PermissionManager.require_role(RoleType.ADMIN)
+def get_db_pool_status():
+    """Report connection pool occupancy and checkout wait times - Admin only"""
+    try:
+        return jsonify(pool_status(db.engine)), 200
+    except Exception as e:
+        logger.error(f"Error getting pool status: {str(e)}")
+        return jsonify({"error": "Internal server error"}), 500
+
+@admin_bp.route('/profiles', methods=['GET'])
+@jwt_required()
+@PermissionManager.require_role(RoleType.ADMIN)
+def get_profiles():
+    """List saved request profiles - Admin only"""
+    try:
+        return jsonify(list_profiles()), 200
+    except Exception as e:
+        logger.error(f"Error listing profiles: {str(e)}")
+        return jsonify({"error": "Internal server error"}), 500
+
+@admin_bp.route('/profiles/<name>', methods=['GET'])
+@jwt_required()
+@PermissionManager.require_role(RoleType.ADMIN)
+def get_profile(name):
+    """Download a saved profile, or a text summary with ?format=text - Admin only"""
+    try:
+        path = profile_path(name)
+        if not path:
+            return jsonify({"error": "Profile not found"}), 404
+
+        if request.args.get('format') == 'text':
+            limit = request.args.get('limit', 40, type=int)
+            sort = request.args.get('sort', 'cumulative')
+            if sort not in ('cumulative', 'tottime', 'calls'):
+                return jsonify({"error": "sort must be one of: cumulative, tottime, calls"}), 400
+            return profile_summary(path, limit, sort), 200, {'Content-Type': 'text/plain; charset=utf-8'}
+
+        return send_file(path, mimetype='application/octet-stream', as_attachment=True, download_name=name)
+    except Exception as e:
+        logger.error(f"Error retrieving profile {name}: {str(e)}")
+        return jsonify({"error": "Internal server error"}), 500
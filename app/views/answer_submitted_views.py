@@ -4,6 +4,7 @@ from app.controllers.answer_submitted_controller import AnswerSubmittedControlle
 from app.services.auth_service import AuthService
 from app.utils.permission_manager import PermissionManager, EntityType, RoleType
 import logging
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -98,20 +99,28 @@ def get_all_answers_submitted():
         if form_id:
             filters['form_id'] = form_id
 
-        # Date range filters
+        # Date range filters (ISO dates, end exclusive)
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
         if start_date and end_date:
-            filters['date_range'] = {
-                'start': start_date,
-                'end': end_date
-            }
+            try:
+                filters['date_range'] = {
+                    'start': datetime.fromisoformat(start_date),
+                    'end': datetime.fromisoformat(end_date)
+                }
+            except ValueError:
+                return jsonify({"error": "Invalid start_date or end_date, expected ISO format"}), 400
 
         answers_submitted = AnswerSubmittedController.get_all_answers_submitted(user, filters)
 
+        # Echo the dates as sent
+        applied = dict(filters)
+        if 'date_range' in applied:
+            applied['date_range'] = {'start': start_date, 'end': end_date}
+
         return jsonify({
             'total_count': len(answers_submitted),
-            'filters_applied': filters,
+            'filters_applied': applied,
             'answers_submitted': answers_submitted
         }), 200
 
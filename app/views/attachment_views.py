@@ -4,6 +4,7 @@ from werkzeug.utils import secure_filename
 from app.controllers.attachment_controller import AttachmentController
 from app.services.auth_service import AuthService
 from app.utils.permission_manager import PermissionManager, EntityType, RoleType
+from app.utils.metrics import ATTACHMENT_BYTES
 import logging
 import os
 
@@ -175,6 +176,7 @@ def get_attachment(attachment_id):
             return jsonify({"error": error}), 404 if error == "File not found" else 400
 
         # Return file for download
+        ATTACHMENT_BYTES.inc('out', amount=os.path.getsize(attachment_data['file_path']))
         return send_file(
             attachment_data['file_path'],
             mimetype=attachment_data['record'].file_type,
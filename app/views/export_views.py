@@ -5,9 +5,11 @@ from app.services.export_service import ExportService
 from app.services.auth_service import AuthService
 from app.controllers.form_controller import FormController
 from app.utils.permission_manager import PermissionManager, EntityType
+from app.utils.metrics import EXPORT_DURATION
 from io import BytesIO
 import logging
 import os
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +62,7 @@ def export_form_data(form_id):
 
         # Check access rights
         if not user.role.is_super_user:
-            if not form.is_public and form.creator.environment_id != user.environment_id:
+            if not form.is_public and form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
 
         # Get and validate format
@@ -115,49 +117,11 @@ def export_form_data(form_id):
                 return jsonify({"error": "Logo must be PNG or JPG/JPEG format"}), 400
 
         # Prepare form data
-        form_data = {
-            'title': form.title,
-            'description': form.description,
-            'created_at': form.created_at.isoformat() if form.created_at else None,
-            'updated_at': form.updated_at.isoformat() if form.updated_at else None,
-            'created_by': {
-                'id': form.creator.id,
-                'username': form.creator.username,
-                'email': form.creator.email,
-                'first_name': form.creator.first_name,
-                'last_name': form.creator.last_name,
-                'fullname': f"{form.creator.first_name} {form.creator.last_name}",
-                'environment': {
-                    'id': form.creator.environment_id,
-                    'name': form.creator.environment.name if form.creator.environment else None
-                }
-            },
-            'is_public': form.is_public,
-            'questions': [
-                {
-                    'id': q.question.id,
-                    'form_question_id': q.id,
-                    'text': q.question.text,
-                    'type': q.question.question_type.type,
-                    'order_number': q.order_number,
-                    'remarks': q.question.remarks,
-                    'possible_answers': [
-                        {
-                            'id': fa.answer.id,
-                            'form_answer_id': fa.id,
-                            'value': fa.answer.value
-                        }
-                        for fa in sorted(q.form_answers, key=lambda x: x.id)
-                        if not fa.is_deleted and fa.answer and not fa.answer.is_deleted
-                    ] if q.question.question_type.type in ['checkbox', 'multiple_choices'] else None
-                }
-                for q in sorted(form.form_questions, key=lambda x: x.order_number or 0)
-                if not q.is_deleted and q.question and not q.question.is_deleted
-            ]
-        }
+        form_data = ExportService.build_form_data(form)
 
         # Generate export
         try:
+            render_start = time.perf_counter()
             if export_format == 'PDF':
                 file_data = export_service.export_as_pdf(form_data, format_params)
                 mimetype = 'application/pdf'
@@ -168,6 +132,7 @@ def export_form_data(form_id):
                 mimetype = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
                 filename = f'form_{form_id}_{datetime.now().strftime("%Y%m%d")}.docx'
 
+            EXPORT_DURATION.observe(time.perf_counter() - render_start, export_format)
             logger.info(f"Form {form_id} exported as {export_format} by user {current_user}")
 
             return send_file(
@@ -293,7 +258,7 @@ def preview_export_parameters(form_id):
 
         # Check access rights
         if not user.role.is_super_user:
-            if not form.is_public and form.creator.environment_id != user.environment_id:
+            if not form.is_public and form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
 
         # Get current parameters from request or use defaults
@@ -345,7 +310,7 @@ def preview_export_parameters(form_id):
             "form_info": {
                 "id": form.id,
                 "title": form.title,
-                "questions_count": len([q for q in form.form_questions if not q.is_deleted])
+                "questions_count": len(form.form_questions)
             },
             "current_parameters": current_params,
             "available_parameters": {
@@ -36,7 +36,7 @@ def create_form_answer():
 
         # Check authorization
         if not user.role.is_super_user:
-            if form_question.form.creator.environment_id != user.environment_id:
+            if form_question.form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
 
         # Verify answer exists
@@ -106,7 +106,7 @@ def bulk_create_form_answers():
             form_question_ids = [fa['form_question_id'] for fa in data['form_answers']]
             for fq_id in form_question_ids:
                 form_question = FormQuestionController.get_form_question(fq_id)
-                if not form_question or form_question.form.creator.environment_id != user.environment_id:
+                if not form_question or form_question.form.environment_id != user.environment_id:
                     return jsonify({"error": "Unauthorized access"}), 403
 
         form_answers, error = FormAnswerController.bulk_create_form_answers(data['form_answers'])
@@ -161,7 +161,7 @@ def get_answers_by_question(form_question_id):
         # Validate access to form question
         if not user.role.is_super_user:
             form_question = FormQuestionController.get_form_question(form_question_id)
-            if not form_question or form_question.form.creator.environment_id != user.environment_id:
+            if not form_question or form_question.form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
 
         form_answers = FormAnswerController.get_answers_by_question(form_question_id)
@@ -186,7 +186,7 @@ def get_form_answer(form_answer_id):
 
         # Check access
         if not user.role.is_super_user:
-            if form_answer.form_question.form.creator.environment_id != user.environment_id:
+            if form_answer.form_question.form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
 
         return jsonify(form_answer.to_dict()), 200
@@ -210,7 +210,7 @@ def update_form_answer(form_answer_id):
 
         # Check access
         if not user.role.is_super_user:
-            if form_answer.form_question.form.creator.environment_id != user.environment_id:
+            if form_answer.form_question.form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
 
         data = request.get_json()
@@ -251,7 +251,7 @@ def delete_form_answer(form_answer_id):
 
         # Access control
         if not user.role.is_super_user:
-            if form_answer.form_question.form.creator.environment_id != user.environment_id:
+            if form_answer.form_question.form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
 
         # Check if answer is already submitted
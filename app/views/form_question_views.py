@@ -31,7 +31,7 @@ def create_form_question():
         # Check form access
         if not user.role.is_super_user:
             form = FormController.get_form(data['form_id'])
-            if not form or form.creator.environment_id != user.environment_id:
+            if not form or form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access to form"}), 403
 
         new_form_question, error = FormQuestionController.create_form_question(
@@ -128,7 +128,7 @@ def get_form_questions(form_id):
         # Check form access
         if not user.role.is_super_user:
             form = FormController.get_form(form_id)
-            if not form or form.creator.environment_id != user.environment_id:
+            if not form or form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access to form"}), 403
 
         questions = FormQuestionController.get_questions_by_form(form_id)
@@ -159,7 +159,7 @@ def get_form_question(form_question_id: int):
 
         # Check environment access for non-admin users
         if not user.role.is_super_user:
-            if form_question.form.creator.environment_id != user.environment_id:
+            if form_question.form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
 
         # Build response data
@@ -173,7 +173,7 @@ def get_form_question(form_question_id: int):
                 "creator": {
                     "id": form_question.form.creator.id,
                     "username": form_question.form.creator.username,
-                    "environment_id": form_question.form.creator.environment_id
+                    "environment_id": form_question.form.environment_id
                 }
             },
             "question": {
@@ -224,7 +224,7 @@ def update_form_question(form_question_id):
 
         # Check form access
         if not user.role.is_super_user:
-            if form_question.form.creator.environment_id != user.environment_id:
+            if form_question.form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
 
         data = request.get_json()
@@ -267,7 +267,7 @@ def delete_form_question(form_question_id):
 
         # Access control
         if not user.role.is_super_user:
-            if form_question.form.creator.environment_id != user.environment_id:
+            if form_question.form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
 
         # Check if there are any submissions using this question
@@ -320,7 +320,7 @@ def bulk_create_form_questions():
         # Check form access
         if not user.role.is_super_user:
             form = FormController.get_form(data['form_id'])
-            if not form or form.creator.environment_id != user.environment_id:
+            if not form or form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access to form"}), 403
 
         form_questions, error = FormQuestionController.bulk_create_form_questions(
@@ -60,6 +60,15 @@ def get_all_submissions():
         if form_id:
             filters['form_id'] = form_id
 
+        # Date range filters (ISO dates, end exclusive)
+        for key in ('start_date', 'end_date'):
+            value = request.args.get(key)
+            if value:
+                try:
+                    filters[key] = datetime.fromisoformat(value)
+                except ValueError:
+                    return jsonify({"error": f"Invalid {key}, expected ISO format"}), 400
+
         submissions = FormSubmissionController.get_all_submissions(user, filters)
 
         return jsonify([
@@ -86,7 +95,7 @@ def get_submission(submission_id):
         # Access control
         if not user.role.is_super_user:
             if user.role.name in [RoleType.SITE_MANAGER, RoleType.SUPERVISOR]:
-                if submission.form.creator.environment_id != user.environment_id:
+                if submission.environment_id != user.environment_id:
                     return jsonify({"error": "Unauthorized access"}), 403
             elif submission.submitted_by != current_user:
                 return jsonify({"error": "Unauthorized access"}), 403
@@ -114,7 +123,7 @@ def delete_submission(submission_id):
         # Access control
         if not user.role.is_super_user:
             if user.role.name in [RoleType.SITE_MANAGER, RoleType.SUPERVISOR]:
-                if submission.form.creator.environment_id != user.environment_id:
+                if submission.environment_id != user.environment_id:
                     return jsonify({"error": "Unauthorized access"}), 403
             elif submission.submitted_by != current_user:
                 return jsonify({"error": "Cannot delete submissions by other users"}), 403
@@ -64,7 +64,7 @@ def get_form(form_id):
             if not form.is_public:
                 return jsonify({"error": "Unauthorized access"}), 403
         elif user.role.name in [RoleType.SUPERVISOR, RoleType.SITE_MANAGER]:
-            if form.creator.environment_id != user.environment_id:
+            if form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
 
         return jsonify(form.to_dict()), 200
@@ -79,11 +79,11 @@ def get_form(form_id):
 def get_forms_by_environment(environment_id):
     """Get all forms associated with an environment"""
     try:
-        logger.info(f"Accessing forms for environment ID: {environment_id}")
+        logger.debug(f"Accessing forms for environment ID: {environment_id}")
         
         current_user = get_jwt_identity()
         user = AuthService.get_current_user(current_user)
-        logger.info(f"Current user: {user.username}, Environment: {user.environment_id}")
+        logger.debug(f"Current user: {user.username}, Environment: {user.environment_id}")
 
         # If user is not admin, they can only see forms from their environment
         if not user.role.is_super_user and user.environment_id != environment_id:
@@ -98,7 +98,7 @@ def get_forms_by_environment(environment_id):
 
         # Convert forms to dict representation
         forms_data = [form.to_dict() for form in forms if hasattr(form, 'to_dict')]
-        logger.info(f"Found {len(forms_data)} forms for environment {environment_id}")
+        logger.debug(f"Found {len(forms_data)} forms for environment {environment_id}")
         
         return jsonify({"forms": forms_data}), 200
 
@@ -254,7 +254,7 @@ def add_questions_to_form(form_id):
             
         # Check environment access for non-admin roles
         if not user.role.is_super_user:
-            if form.creator.environment_id != user.environment_id:
+            if form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
 
         data = request.get_json()
@@ -298,7 +298,7 @@ def get_form_submissions(form_id):
             submissions = [s for s in form.submissions if s.submitted_by == current_user]
         # For other non-admin roles, check environment access
         elif not user.role.is_super_user:
-            if form.creator.environment_id != user.environment_id:
+            if form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
             submissions = form.submissions
         # Admins can see all submissions
@@ -347,7 +347,7 @@ def get_form_statistics(form_id):
             
         # For other non-admin roles, check environment access
         if not user.role.is_super_user:
-            if form.creator.environment_id != user.environment_id:
+            if form.environment_id != user.environment_id:
                 return jsonify({"error": "Unauthorized access"}), 403
 
         stats = FormController.get_form_statistics(form_id)
@@ -376,7 +376,7 @@ def update_form(form_id):
             
         # Check environment access for non-admin roles
         if not user.role.is_super_user:
-            if form.creator.environment_id != user.environment_id:
+            if form.environment_id != user.environment_id:
                 return jsonify({
                     "error": "Unauthorized",
                     "message": "You can only update forms in your environment"
@@ -440,7 +440,7 @@ def delete_form(form_id):
         # Access control checks
         if not user.role.is_super_user:
             # Check environment access
-            if form.creator.environment_id != user.environment_id:
+            if form.environment_id != user.environment_id:
                 return jsonify({
                     "error": "Unauthorized",
                     "message": "You can only delete forms in your environment"
@@ -15,7 +15,7 @@ def frontend_auth_required():
             try:
                 verify_jwt_in_request()
                 current_user = get_jwt_identity()
-                logger.info(f"Authenticated user accessing {request.path}: {current_user}")
+                logger.debug(f"Authenticated user accessing {request.path}: {current_user}")
                 return fn(*args, **kwargs)
             except Exception as e:
                 logger.warning(f"Authentication failed for {request.path}: {str(e)}")
@@ -25,19 +25,19 @@ def frontend_auth_required():
 
 @frontend_bp.route('/')
 def index():
-    logger.info("Accessing root path")
+    logger.debug("Accessing root path")
     return redirect(url_for('frontend.login'))
 
 @frontend_bp.route('/login')
 def login():
-    logger.info("Accessing login page")
+    logger.debug("Accessing login page")
     # Check if user is already authenticated
     try:
         verify_jwt_in_request()
-        logger.info("User already authenticated, redirecting to dashboard")
+        logger.debug("User already authenticated, redirecting to dashboard")
         return redirect(url_for('frontend.dashboard'))
     except Exception:
-        logger.info("No valid authentication found, showing login page")
+        logger.debug("No valid authentication found, showing login page")
         return render_template('auth/login.html')
 
 @frontend_bp.route('/dashboard')
@@ -45,7 +45,7 @@ def dashboard():
     try:
         # Get the token from the request header
         auth_header = request.headers.get('Authorization')
-        logger.info(f"Dashboard access attempt. Auth header present: {bool(auth_header)}")
+        logger.debug(f"Dashboard access attempt. Auth header present: {bool(auth_header)}")
         
         if not auth_header:
             logger.warning("No Authorization header found")
@@ -54,7 +54,7 @@ def dashboard():
         # Verify the token
         verify_jwt_in_request()
         current_user = get_jwt_identity()
-        logger.info(f"Dashboard access granted for user: {current_user}")
+        logger.debug(f"Dashboard access granted for user: {current_user}")
         
         # Get user details
         user = AuthService.get_current_user(current_user)
@@ -0,0 +1,25 @@
+from flask import Blueprint, Response, current_app, jsonify, request
+from app import db
+from app.utils.metrics import render_metrics
+import hmac
+import logging
+
+logger = logging.getLogger(__name__)
+
+metrics_bp = Blueprint('metrics', __name__)
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Prometheus scrape endpoint; requires 'Bearer <METRICS_TOKEN>' when a token is configured"""
+    if not current_app.config.get('METRICS_ENABLED', False):
+        return jsonify({"error": "Not found"}), 404
+
+    token = current_app.config.get('METRICS_TOKEN')
+    if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f"Bearer {token}"):
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        return Response(render_metrics(db.engines), mimetype='text/plain; version=0.0.4')
+    except Exception as e:
+        logger.error(f"Error rendering metrics: {str(e)}")
+        return jsonify({"error": "Internal server error"}), 500
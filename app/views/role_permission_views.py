@@ -46,7 +46,7 @@ def get_roles_with_permissions():
             role_data['permissions'] = [
                 rp.permission.to_dict() 
                 for rp in role.role_permissions 
-                if not rp.is_deleted and not rp.permission.is_deleted
+                if rp.permission and not rp.permission.is_deleted
             ]
             result.append(role_data)
             
@@ -0,0 +1,108 @@
+"""
+JSON provider benchmark on the largest list endpoints.
+
+Loads the micro-benchmark fixture (forms with 10, 100 and 1,000 questions)
+into an in-memory database, fetches each endpoint once to capture the
+object the view hands to jsonify, and then times:
+  - encode:  provider.response(payload) for Flask's default provider and
+             the orjson provider, and whether both produce identical bytes
+  - request: the whole GET through the test client with each provider
+
+Usage:
+    python benchmarks/json_encoding.py [--repeat 5] [--min-time 0.2] [--json]
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from micro import BenchConfig, build_fixture, measure  # noqa: E402
+
+ENDPOINTS = (
+    '/api/forms',
+    '/api/forms/{large_form}',
+    '/api/questions',
+    '/api/form-questions',
+    '/api/form-answers',
+)
+
+
+def capture_payload(app, client, path: str, headers: dict):
+    """The object the view passed to jsonify for ``path``"""
+    provider = app.json
+    captured = []
+    original = provider.response
+
+    def recording_response(*args, **kwargs):
+        captured.append(provider._prepare_response_obj(args, kwargs))
+        return original(*args, **kwargs)
+
+    provider.response = recording_response
+    try:
+        response = client.get(path, headers=headers)
+    finally:
+        del provider.response
+    if response.status_code != 200 or not captured:
+        raise RuntimeError(f"GET {path} returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+    return captured[-1], len(response.get_data())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='Timed rounds per benchmark')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum seconds per round')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    from flask.json.provider import DefaultJSONProvider
+    from flask_jwt_extended import create_access_token
+
+    from app import create_app, db
+    from app.utils.json_provider import OrjsonProvider
+
+    app = create_app(BenchConfig)
+    providers = {'default': DefaultJSONProvider(app), 'orjson': OrjsonProvider(app)}
+    client = app.test_client()
+    results = {}
+
+    with app.app_context():
+        db.create_all()
+        fixture = build_fixture(db)
+        headers = {'Authorization': f"Bearer {create_access_token(identity=fixture['users']['Admin'].username)}"}
+        large_form = max(fixture['forms'].values(), key=lambda form: len(form.form_questions)).id
+
+    for template in ENDPOINTS:
+        path = template.format(large_form=large_form)
+        app.json = providers['default']
+        payload, size = capture_payload(app, client, path, headers)
+        row = {'bytes': size}
+
+        with app.app_context():
+            bodies = {name: provider.response(payload).get_data() for name, provider in providers.items()}
+            row['identical'] = bodies['default'] == bodies['orjson']
+            for name, provider in providers.items():
+                row[f'encode_{name}'] = measure(lambda: provider.response(payload), args.repeat, args.min_time)
+
+        for name, provider in providers.items():
+            app.json = provider
+            row[f'request_{name}'] = measure(lambda: client.get(path, headers=headers), args.repeat, args.min_time)
+        results[path] = row
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'endpoint':<22} {'bytes':>9} {'encode default':>15} {'encode orjson':>14} {'speedup':>8} "
+          f"{'request default':>16} {'request orjson':>15} {'speedup':>8} {'same':>5}")
+    for path, row in results.items():
+        encode = row['encode_default']['median_us'] / row['encode_orjson']['median_us']
+        request = row['request_default']['median_us'] / row['request_orjson']['median_us']
+        print(f"{path:<22} {row['bytes']:>9} {row['encode_default']['median_us']:>13.0f}us "
+              f"{row['encode_orjson']['median_us']:>12.0f}us {encode:>7.1f}x "
+              f"{row['request_default']['median_us']:>14.0f}us {row['request_orjson']['median_us']:>13.0f}us "
+              f"{request:>7.2f}x {'yes' if row['identical'] else 'NO':>5}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,379 @@
+"""
+Scenario load test for a running server.
+
+Virtual users loop over weighted CMMS workflows for a fixed duration:
+
+  technician  login -> list public forms -> fetch a form -> create a
+              submission -> submit its answers -> upload a signature
+  supervisor  list forms -> form statistics -> form submissions ->
+              environment submissions
+  admin       export a form as PDF or DOCX
+
+Latency percentiles, throughput and status counts are reported per
+endpoint (route template) and per scenario, and written as JSON. Given a
+--baseline result file the run fails (exit 1) when an endpoint's p95 or
+error rate regresses beyond the tolerance.
+
+Typical run against a local PostgreSQL:
+
+    flask db upgrade && flask database init
+    flask database testdata --forms 200 --submissions-per-form 100 --seed 1
+    gunicorn -c gunicorn.conf.py wsgi:app &
+    python benchmarks/loadtest.py --admin-username admin --admin-password secret \\
+        --duration 120 --users 32 --output loadtest.json --baseline last_release.json
+
+Technicians and supervisors are picked from users whose username starts
+with --user-prefix (the ``flask database testdata`` users) and log in
+with --password.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import struct
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+import zlib
+from collections import Counter, defaultdict
+
+from throughput import login, percentile
+
+TEXT_FORMATS = {'text': 'Load test reading %H:%M', 'date': '%d/%m/%Y', 'datetime': '%d/%m/%Y %H:%M:%S'}
+
+
+def tiny_png() -> bytes:
+    """A valid 1x1 PNG, enough to pass MIME sniffing as a signature image"""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+    header = struct.pack('>IIBBBBB', 1, 1, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(b'\x00\x00\x00\x00')) + chunk(b'IEND', b''))
+
+
+def multipart(fields: dict, files: dict):
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+    for name, (filename, content, content_type) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'.encode() + content + b'\r\n'
+        )
+    parts.append(f'--{boundary}--\r\n'.encode())
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+
+class Recorder:
+    """Thread-safe latency and status collection keyed by endpoint name"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def add(self, name: str, status, seconds: float):
+        with self._lock:
+            self.latencies[name].append(seconds * 1000)
+            self.statuses[name][str(status)] += 1
+
+    def summary(self, elapsed: float) -> dict:
+        result = {}
+        for name in sorted(self.latencies):
+            values = self.latencies[name]
+            statuses = self.statuses[name]
+            errors = sum(count for status, count in statuses.items() if not status.startswith(('2', '3')))
+            result[name] = {
+                'count': len(values),
+                'errors': errors,
+                'error_rate': round(errors / len(values), 4),
+                'throughput_rps': round(len(values) / elapsed, 2),
+                'p50_ms': round(percentile(values, 50), 2),
+                'p95_ms': round(percentile(values, 95), 2),
+                'p99_ms': round(percentile(values, 99), 2),
+                'mean_ms': round(statistics.mean(values), 2),
+                'max_ms': round(max(values), 2),
+                'statuses': dict(statuses),
+            }
+        return result
+
+
+class Client:
+    """One virtual user's HTTP session"""
+
+    def __init__(self, base_url: str, recorder: Recorder, timeout: float):
+        self.base_url = base_url
+        self.recorder = recorder
+        self.timeout = timeout
+        self.token = None
+        self.user = None
+
+    def request(self, name: str, method: str, path: str, json_body=None, body: bytes = None,
+                content_type: str = None):
+        headers = {'Authorization': f'Bearer {self.token}'} if self.token else {}
+        if json_body is not None:
+            body, content_type = json.dumps(json_body).encode(), 'application/json'
+        if content_type:
+            headers['Content-Type'] = content_type
+        request = urllib.request.Request(f'{self.base_url}{path}', data=body, headers=headers, method=method)
+        start = time.perf_counter()
+        payload = None
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                status, raw = response.status, response.read()
+            if raw and response.headers.get_content_type() == 'application/json':
+                payload = json.loads(raw)
+        except urllib.error.HTTPError as e:
+            e.read()
+            status = e.code
+        except Exception as e:
+            status = type(e).__name__
+        self.recorder.add(name, status, time.perf_counter() - start)
+        return status, payload
+
+    def login(self, username: str, password: str) -> bool:
+        status, payload = self.request('POST /api/users/login', 'POST', '/api/users/login',
+                                       json_body={'username': username, 'password': password})
+        self.token = payload.get('access_token') if status == 200 and payload else None
+        return self.token is not None
+
+
+class Workload:
+    """Users, forms and text-answer ids discovered once before the run"""
+
+    def __init__(self, args):
+        self.args = args
+        self.base_url = args.url.rstrip('/')
+        self.admin_token = login(self.base_url, args.admin_username, args.admin_password)
+        self.users = defaultdict(list)
+        self.form_ids = []
+        self.text_answers = {}
+        self.signature = tiny_png()
+
+    def _get(self, path: str):
+        request = urllib.request.Request(f'{self.base_url}{path}',
+                                         headers={'Authorization': f'Bearer {self.admin_token}'})
+        with urllib.request.urlopen(request, timeout=self.args.timeout) as response:
+            return json.loads(response.read())
+
+    def discover(self):
+        for user in self._get('/api/users'):
+            if user['username'].startswith(self.args.user_prefix):
+                role = (user.get('role') or {}).get('name')
+                self.users[role].append((user['username'], (user.get('environment') or {}).get('id')))
+        forms = self._get('/api/forms/public')
+        self.form_ids = [form['id'] for form in self._get('/api/forms')][:self.args.max_forms]
+        # Text questions expose no answer options and technicians cannot list form answers,
+        # so map form question -> form answer once as admin
+        text_questions = {
+            question['form_question_id'] for form in forms
+            for question in form.get('questions', []) if 'possible_answers' not in question
+        }
+        for form_answer in self._get('/api/form-answers'):
+            form_question_id = form_answer['form_question']['id']
+            if form_question_id in text_questions:
+                self.text_answers.setdefault(form_question_id, form_answer['id'])
+        if not self.users['Technician'] or not self.users['Supervisor'] or not self.form_ids:
+            sys.exit("No technicians, supervisors or forms found; run 'flask database testdata' first")
+
+
+def technician_scenario(client: Client, workload: Workload, rng: random.Random):
+    username, _ = rng.choice(workload.users['Technician'])
+    if not client.login(username, workload.args.password):
+        return
+    status, forms = client.request('GET /api/forms/public', 'GET', '/api/forms/public')
+    if status != 200 or not forms:
+        return
+    form = rng.choice(forms)
+    client.request('GET /api/forms/<id>', 'GET', f"/api/forms/{form['id']}")
+
+    status, created = client.request('POST /api/form-submissions', 'POST', '/api/form-submissions',
+                                     json_body={'form_id': form['id']})
+    if status != 201:
+        return
+    submission_id = created['submission']['id']
+
+    answers = []
+    for question in form.get('questions', []):
+        options = question.get('possible_answers')
+        if options:
+            answers.append({'form_answer_id': rng.choice(options)['form_answer_id']})
+        elif question['form_question_id'] in workload.text_answers:
+            answer = {'form_answer_id': workload.text_answers[question['form_question_id']]}
+            # Only these types take free text; user/signature answers must not carry any
+            if question['type'] in TEXT_FORMATS:
+                answer['text_answered'] = time.strftime(TEXT_FORMATS[question['type']])
+            answers.append(answer)
+    if answers:
+        client.request('POST /api/answers-submitted/bulk', 'POST', '/api/answers-submitted/bulk',
+                       json_body={'form_submission_id': submission_id, 'submissions': answers})
+
+    body, content_type = multipart(
+        {'form_submission_id': submission_id, 'is_signature': 'true'},
+        {'file': ('signature.png', workload.signature, 'image/png')}
+    )
+    client.request('POST /api/attachments', 'POST', '/api/attachments', body=body, content_type=content_type)
+
+
+def supervisor_scenario(client: Client, workload: Workload, rng: random.Random):
+    # Supervisors stay logged in between dashboard refreshes
+    if client.token is None:
+        client.user = rng.choice(workload.users['Supervisor'])
+        if not client.login(client.user[0], workload.args.password):
+            return
+    status, forms = client.request('GET /api/forms', 'GET', '/api/forms')
+    # The list includes other environments' public forms; dashboards only open their own
+    own = [form for form in forms or [] if form['created_by']['environment']['id'] == client.user[1]]
+    if status != 200 or not own:
+        return
+    form_id = rng.choice(own)['id']
+    client.request('GET /api/forms/<id>/statistics', 'GET', f'/api/forms/{form_id}/statistics')
+    client.request('GET /api/forms/<id>/submissions', 'GET', f'/api/forms/{form_id}/submissions')
+    client.request('GET /api/form-submissions', 'GET', '/api/form-submissions')
+
+
+def admin_scenario(client: Client, workload: Workload, rng: random.Random):
+    client.token = workload.admin_token
+    export_format = rng.choice(('PDF', 'DOCX'))
+    form_id = rng.choice(workload.form_ids)
+    client.request(f'GET /api/export/form/<id>?format={export_format}', 'GET',
+                   f'/api/export/form/{form_id}?format={export_format}')
+
+
+SCENARIOS = {
+    'technician': technician_scenario,
+    'supervisor': supervisor_scenario,
+    'admin': admin_scenario,
+}
+
+
+def parse_mix(value: str) -> dict:
+    """'technician=70,supervisor=25,admin=5' -> {scenario: weight}"""
+    mix = {}
+    for item in value.split(','):
+        name, weight = item.split('=', 1)
+        if name.strip() not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"Unknown scenario '{name}'")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def run(workload: Workload, args) -> dict:
+    recorder = Recorder()
+    scenario_times = Recorder()
+    names, weights = zip(*args.mix.items())
+    deadline = time.perf_counter() + args.duration
+
+    def virtual_user(index: int):
+        rng = random.Random(args.seed * 1000 + index)
+        # Each virtual user keeps one role so sessions look like real clients
+        name = rng.choices(names, weights)[0]
+        client = Client(workload.base_url, recorder, args.timeout)
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                SCENARIOS[name](client, workload, rng)
+                outcome = 'ok'
+            except Exception as e:
+                outcome = type(e).__name__
+            scenario_times.add(name, 200 if outcome == 'ok' else outcome, time.perf_counter() - start)
+            if args.think_time:
+                time.sleep(rng.uniform(0, 2 * args.think_time))
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=virtual_user, args=(i,), daemon=True) for i in range(args.users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    endpoints = recorder.summary(elapsed)
+    return {
+        'meta': {
+            'url': workload.base_url, 'duration_s': round(elapsed, 2), 'users': args.users,
+            'mix': args.mix, 'seed': args.seed, 'started_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'totals': {
+            'requests': sum(item['count'] for item in endpoints.values()),
+            'errors': sum(item['errors'] for item in endpoints.values()),
+            'throughput_rps': round(sum(item['count'] for item in endpoints.values()) / elapsed, 2),
+        },
+        'endpoints': endpoints,
+        'scenarios': scenario_times.summary(elapsed),
+    }
+
+
+def compare(result: dict, baseline: dict, tolerance: float, error_tolerance: float) -> list:
+    """Endpoints whose p95 or error rate got worse than the baseline allows"""
+    regressions = []
+    for name, current in result['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(name)
+        if not previous:
+            continue
+        if current['p95_ms'] > previous['p95_ms'] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['p95_ms']} -> {current['p95_ms']} ms")
+        if current['error_rate'] > previous['error_rate'] + error_tolerance:
+            regressions.append(f"{name}: error rate {previous['error_rate']} -> {current['error_rate']}")
+    return regressions
+
+
+def print_report(result: dict):
+    meta, totals = result['meta'], result['totals']
+    print(f"{totals['requests']} requests in {meta['duration_s']}s with {meta['users']} users: "
+          f"{totals['throughput_rps']} req/s, {totals['errors']} errors")
+    print(f"{'endpoint':<48} {'count':>7} {'rps':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'err%':>6}")
+    for section in ('endpoints', 'scenarios'):
+        for name, item in result[section].items():
+            label = name if section == 'endpoints' else f'scenario: {name}'
+            print(f"{label:<48} {item['count']:>7} {item['throughput_rps']:>7} {item['p50_ms']:>8} "
+                  f"{item['p95_ms']:>8} {item['p99_ms']:>8} {item['error_rate'] * 100:>6.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://127.0.0.1:8000', help='Server base URL')
+    parser.add_argument('--admin-username', required=True)
+    parser.add_argument('--admin-password', required=True)
+    parser.add_argument('--user-prefix', default='td', help='Only use users whose username starts with this')
+    parser.add_argument('--password', default='Testdata1!', help='Password of the generated users')
+    parser.add_argument('--users', type=int, default=16, help='Concurrent virtual users')
+    parser.add_argument('--duration', type=float, default=60.0, help='Run time in seconds')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('technician=70,supervisor=25,admin=5'),
+                        help='Scenario weights')
+    parser.add_argument('--think-time', type=float, default=0.0, help='Mean pause between scenarios (s)')
+    parser.add_argument('--max-forms', type=int, default=50, help='Forms used by the admin export scenario')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Per-request timeout (s)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='Write the JSON result here')
+    parser.add_argument('--baseline', help='Fail when results regress against this JSON result')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed p95 increase (fraction)')
+    parser.add_argument('--error-tolerance', type=float, default=0.01, help='Allowed error-rate increase')
+    args = parser.parse_args()
+
+    workload = Workload(args)
+    workload.discover()
+    result = run(workload, args)
+    print_report(result)
+
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(result, handle, indent=2)
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as handle:
+            regressions = compare(result, json.load(handle), args.tolerance, args.error_tolerance)
+        if regressions:
+            print('\nRegressions against baseline:')
+            for line in regressions:
+                print(f'  {line}')
+            sys.exit(1)
+        print('\nNo regressions against baseline.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+"""
+Micro-benchmarks for serializers, permission checks and export rendering.
+
+Builds a deterministic fixture in an in-memory SQLite database (or
+DATABASE_URL) and times:
+  - Form.to_dict, FormQuestion.to_dict, AnswerSubmitted.to_dict
+  - User.to_dict(include_details=True)
+  - PermissionManager.has_permission
+  - ExportService.export_as_pdf / export_as_docx
+on forms with 10, 100 and 1,000 questions. Serializers run warm (objects
+already in the session), so the numbers cover Python work plus whatever
+queries the method itself issues.
+
+Results are compared with benchmarks/micro_baseline.json; the run exits 1
+when a benchmark's median is slower than the baseline by more than
+--tolerance. Baselines are machine-specific: record one with
+--save-baseline on the machine that runs the comparison.
+
+Usage:
+    python benchmarks/micro.py [--filter export] [--repeat 5] [--json]
+    python benchmarks/micro.py --save-baseline
+"""
+import argparse
+import copy
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'micro_baseline.json')
+SIZES = (10, 100, 1000)
+QUESTION_TYPES = ('text', 'multiple_choices', 'checkbox', 'date')
+OPTIONS = ('Pass', 'Fail', 'N/A', 'Needs review')
+FIXED_TIME = datetime(2024, 1, 15, 9, 30)
+
+
+class BenchConfig:
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = os.environ['DATABASE_URL']
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    JWT_SECRET_KEY = 'micro-benchmark-secret-key-0123456789'
+    SECRET_KEY = 'micro-benchmark'
+    LOG_LEVEL = 'WARNING'
+    QUERY_STATS_ENABLED = False
+    METRICS_ENABLED = False
+    PROFILING_ENABLED = False
+    SLOW_QUERY_MS = 0
+    TRACING_ENABLED = False
+
+
+def build_fixture(db):
+    """Same rows on every run: no randomness, fixed timestamps"""
+    from app.models import (
+        Answer, AnswerSubmitted, Environment, Form, FormAnswer, FormQuestion,
+        FormSubmission, Question, QuestionType, Role, User
+    )
+
+    env = Environment(name='Bench', description='Benchmark environment')
+    db.session.add(env)
+    roles = {name: Role(name=name, description=name, is_super_user=name == 'Admin')
+             for name in ('Admin', 'Supervisor', 'Technician')}
+    db.session.add_all(roles.values())
+    db.session.flush()
+
+    users = {}
+    for name in roles:
+        users[name] = User(first_name=name, last_name='Bench', email=f'{name.lower()}@bench.local',
+                           username=name.lower(), password_hash='x', role_id=roles[name].id,
+                           environment_id=env.id)
+    db.session.add_all(users.values())
+    types = {name: QuestionType(type=name) for name in QUESTION_TYPES}
+    db.session.add_all(types.values())
+    answers = [Answer(value=value) for value in OPTIONS] + [Answer(value=None)]
+    db.session.add_all(answers)
+    db.session.flush()
+
+    forms = {}
+    for size in SIZES:
+        form = Form(title=f'Inspection with {size} questions', description='Benchmark form',
+                    user_id=users['Supervisor'].id, environment_id=env.id, is_public=True,
+                    created_at=FIXED_TIME, updated_at=FIXED_TIME)
+        db.session.add(form)
+        db.session.flush()
+        for n in range(size):
+            type_name = QUESTION_TYPES[n % len(QUESTION_TYPES)]
+            question = Question(text=f'Question {n + 1}: check item {n % 37}', question_type_id=types[type_name].id)
+            db.session.add(question)
+            db.session.flush()
+            form_question = FormQuestion(form_id=form.id, question_id=question.id, order_number=n + 1)
+            db.session.add(form_question)
+            db.session.flush()
+            options = answers[:len(OPTIONS)] if type_name in ('multiple_choices', 'checkbox') else answers[-1:]
+            db.session.add_all([FormAnswer(form_question_id=form_question.id, answer_id=answer.id)
+                                for answer in options])
+        forms[size] = form
+    db.session.flush()
+
+    form = forms[SIZES[0]]
+    submission = FormSubmission(form_id=form.id, environment_id=env.id, submitted_by='technician',
+                                submitted_by_id=users['Technician'].id, submitted_at=FIXED_TIME)
+    db.session.add(submission)
+    db.session.flush()
+    form_answer = form.form_questions[1].form_answers[0]
+    answer_submitted = AnswerSubmitted(form_answer_id=form_answer.id, form_submission_id=submission.id)
+    db.session.add(answer_submitted)
+    db.session.commit()
+
+    return {
+        'forms': forms,
+        'users': users,
+        'form_question': form.form_questions[1],
+        'answer_submitted': answer_submitted,
+    }
+
+
+def define_benchmarks(fixture) -> dict:
+    """name -> zero-argument callable"""
+    from app.services.export_service import DEFAULT_EXPORT_PARAMS, ExportService
+    from app.utils.permission_manager import EntityType, PermissionManager
+
+    export_service = ExportService()
+    format_params = copy.deepcopy(DEFAULT_EXPORT_PARAMS)
+    technician = fixture['users']['Technician']
+    supervisor = fixture['users']['Supervisor']
+
+    benchmarks = {
+        'user_to_dict_details': lambda: supervisor.to_dict(include_details=True),
+        'form_question_to_dict': fixture['form_question'].to_dict,
+        'answer_submitted_to_dict': fixture['answer_submitted'].to_dict,
+        'has_permission_allowed': lambda: PermissionManager.has_permission(
+            technician, 'create', EntityType.SUBMISSIONS),
+        'has_permission_denied': lambda: PermissionManager.has_permission(
+            technician, 'delete', EntityType.FORMS),
+    }
+    for size, form in fixture['forms'].items():
+        form_data = ExportService.build_form_data(form)
+        benchmarks[f'form_to_dict[{size}]'] = form.to_dict
+        benchmarks[f'export_pdf[{size}]'] = lambda data=form_data: export_service.export_as_pdf(data, format_params)
+        benchmarks[f'export_docx[{size}]'] = lambda data=form_data: export_service.export_as_docx(data, format_params)
+    return benchmarks
+
+
+def measure(func, repeat: int, min_time: float) -> dict:
+    """Median and best per-call time over ``repeat`` rounds of at least ``min_time`` seconds"""
+    func()  # warm-up: lazy loads, imports, caches
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    rounds = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - start) / number)
+    return {
+        'median_us': round(statistics.median(rounds) * 1e6, 2),
+        'min_us': round(min(rounds) * 1e6, 2),
+        'loops': number,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> dict:
+    """name -> current/baseline median ratio, for benchmarks present in both"""
+    ratios = {}
+    for name, result in results.items():
+        previous = baseline.get('results', {}).get(name)
+        if previous and previous['median_us']:
+            ratios[name] = result['median_us'] / previous['median_us']
+    return ratios
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filter', help='Only run benchmarks whose name contains this')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed rounds per benchmark')
+    parser.add_argument('--min-time', type=float, default=0.1, help='Minimum seconds per round')
+    parser.add_argument('--baseline', default=BASELINE, help='Baseline JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown (fraction)')
+    parser.add_argument('--save-baseline', action='store_true', help='Write results as the new baseline')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    from app import create_app, db
+
+    app = create_app(BenchConfig)
+    with app.app_context():
+        db.create_all()
+        benchmarks = define_benchmarks(build_fixture(db))
+        results = {
+            name: measure(func, args.repeat, args.min_time)
+            for name, func in benchmarks.items()
+            if not args.filter or args.filter in name
+        }
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+    ratios = compare(results, baseline, args.tolerance)
+    regressions = sorted(name for name, ratio in ratios.items() if ratio > 1 + args.tolerance)
+
+    if args.json:
+        print(json.dumps({'results': results, 'ratios': ratios, 'regressions': regressions}, indent=2))
+    else:
+        print(f"{'benchmark':<28} {'median':>12} {'best':>12} {'loops':>7} {'vs baseline':>12}")
+        for name, result in results.items():
+            ratio = f"{(ratios[name] - 1) * 100:+.1f}%" if name in ratios else '-'
+            flag = '  REGRESSION' if name in regressions else ''
+            print(f"{name:<28} {result['median_us']:>10.1f}us {result['min_us']:>10.1f}us "
+                  f"{result['loops']:>7} {ratio:>12}{flag}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as handle:
+            json.dump({
+                'meta': {
+                    'python': platform.python_version(),
+                    'machine': platform.machine(),
+                    'platform': platform.platform(),
+                    'recorded_at': datetime.utcnow().isoformat(timespec='seconds'),
+                },
+                'results': results,
+            }, handle, indent=2)
+            handle.write('\n')
+        print(f"Saved baseline to {args.baseline}")
+    elif regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than baseline by more than {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
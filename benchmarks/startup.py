@@ -0,0 +1,103 @@
+"""
+Worker startup benchmark.
+
+Each run starts a fresh interpreter, the way a gunicorn worker would, and
+measures:
+  - time to import the ``app`` package
+  - time for ``create_app()``
+  - resident memory (RSS) once the app is built
+  - which heavy, rarely used libraries ended up imported
+
+Usage:
+    python benchmarks/startup.py [--runs 10] [--json]
+
+DATABASE_URL defaults to an in-memory SQLite database; booting the app
+does not query the database, so the backend does not affect the numbers.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Libraries only needed by exports/attachments; none should load at boot
+HEAVY_MODULES = ['reportlab', 'docx', 'PIL', 'lxml', 'magic']
+
+PROBE = r"""
+import json, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+app.create_app()
+created = time.perf_counter()
+
+rss_kb = 0
+try:
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith('VmRSS:'):
+                rss_kb = int(line.split()[1])
+except OSError:
+    import resource
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'create_app_ms': (created - imported) * 1000,
+    'rss_mb': rss_kb / 1024,
+    'modules': len(sys.modules),
+    'heavy_modules': [m for m in HEAVY if m in sys.modules],
+}))
+"""
+
+
+def run_once() -> dict:
+    env = dict(os.environ)
+    env.setdefault('DATABASE_URL', 'sqlite://')
+    result = subprocess.run(
+        [sys.executable, '-c', f"HEAVY = {HEAVY_MODULES!r}\n{PROBE}"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    # Application logging goes to stderr; the measurement is the last stdout line
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples: list) -> dict:
+    summary = {}
+    for key in ('import_ms', 'create_app_ms', 'rss_mb', 'modules'):
+        values = [sample[key] for sample in samples]
+        summary[key] = {
+            'median': round(statistics.median(values), 1),
+            'min': round(min(values), 1),
+            'max': round(max(values), 1),
+        }
+    summary['heavy_modules'] = sorted({m for sample in samples for m in sample['heavy_modules']})
+    summary['runs'] = len(samples)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='Fresh interpreters to start (default: 10)')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    args = parser.parse_args()
+
+    summary = summarize([run_once() for _ in range(args.runs)])
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    print(f"Startup over {summary['runs']} runs (median [min-max])")
+    for key, label in (('import_ms', 'import app (ms)'), ('create_app_ms', 'create_app() (ms)'),
+                       ('rss_mb', 'RSS after boot (MB)'), ('modules', 'modules loaded')):
+        stats = summary[key]
+        print(f"  {label:<22} {stats['median']:>8} [{stats['min']}-{stats['max']}]")
+    print(f"  heavy modules loaded   {', '.join(summary['heavy_modules']) or 'none'}")
+
+
+if __name__ == '__main__':
+    main()
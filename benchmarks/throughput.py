@@ -0,0 +1,85 @@
+"""
+Small local load script: fire concurrent GET requests at a running server
+and report throughput and latency.
+
+    gunicorn -c gunicorn.conf.py wsgi:app &
+    python benchmarks/throughput.py --path /api/forms --username admin --password secret
+
+Without credentials the requests are unauthenticated (expect 401s, which
+still exercise routing, JWT checks and the worker pool).
+"""
+import argparse
+import json
+import statistics
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+
+def login(base_url: str, username: str, password: str) -> str:
+    request = urllib.request.Request(
+        f"{base_url}/api/users/login",
+        data=json.dumps({'username': username, 'password': password}).encode(),
+        headers={'Content-Type': 'application/json'},
+        method='POST'
+    )
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return json.loads(response.read())['access_token']
+
+
+def fetch(url: str, headers: dict, timeout: float):
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        e.read()
+        status = e.code
+    except Exception as e:
+        status = type(e).__name__
+    return status, time.perf_counter() - start
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://127.0.0.1:8000', help='Server base URL')
+    parser.add_argument('--path', default='/api/forms', help='Path to request')
+    parser.add_argument('--requests', type=int, default=500, help='Total requests')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent clients')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Per-request timeout (s)')
+    parser.add_argument('--username')
+    parser.add_argument('--password')
+    args = parser.parse_args()
+
+    base_url = args.url.rstrip('/')
+    headers = {}
+    if args.username and args.password:
+        headers['Authorization'] = f"Bearer {login(base_url, args.username, args.password)}"
+
+    url = f"{base_url}{args.path}"
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(lambda _: fetch(url, headers, args.timeout), range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies = [seconds * 1000 for _, seconds in results]
+    statuses = Counter(status for status, _ in results)
+
+    print(f"{args.requests} requests to {args.path} with concurrency {args.concurrency} in {elapsed:.2f}s")
+    print(f"  throughput  {args.requests / elapsed:.1f} req/s")
+    print(f"  latency ms  p50 {percentile(latencies, 50):.1f}  p95 {percentile(latencies, 95):.1f}  "
+          f"p99 {percentile(latencies, 99):.1f}  mean {statistics.mean(latencies):.1f}")
+    print(f"  statuses    {', '.join(f'{status}: {count}' for status, count in sorted(statuses.items(), key=str))}")
+
+
+if __name__ == '__main__':
+    main()
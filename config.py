@@ -5,35 +5,128 @@ import getpass
 from dotenv import load_dotenv
 from datetime import timedelta
 import logging
-import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 
-load_dotenv()
 logger = logging.getLogger(__name__)
 
 class Config:
     """Application configuration class."""
     def __init__(self):
+        load_dotenv()
         self.SECRET_KEY = os.environ.get('SECRET_KEY') or os.urandom(32)
         self.JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or os.urandom(32)
         self.JWT_ACCESS_TOKEN_EXPIRES = 3600
         
         self.SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+        # Logging (see app/utils/logging_config.py)
+        self.LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+        self.LOG_FORMAT = os.environ.get('LOG_FORMAT', 'text').lower()
+        self.LOG_FILE = os.environ.get('LOG_FILE')
+        self.LOG_SAMPLE_RATES = os.environ.get('LOG_SAMPLE_RATES', '')
+        self.LOG_RATE_LIMIT_PER_SECOND = int(os.environ.get('LOG_RATE_LIMIT_PER_SECOND', 0))
+        # Log directory listings when an attachment file is missing
+        self.ATTACHMENT_DEBUG = os.environ.get('ATTACHMENT_DEBUG', 'false').lower() in ('1', 'true', 'yes')
         self.SQLALCHEMY_DATABASE_URI = self._get_database_uri()
+        self.SQLALCHEMY_ENGINE_OPTIONS = self._get_engine_options(self.SQLALCHEMY_DATABASE_URI)
+
+        # Optional read replica for GET requests (see app/utils/db_routing.py)
+        replica_url = os.environ.get('DATABASE_REPLICA_URL')
+        self.SQLALCHEMY_BINDS = {'replica': replica_url} if replica_url else {}
+        self.REPLICA_READ_YOUR_WRITES_SECONDS = float(os.environ.get('REPLICA_READ_YOUR_WRITES_SECONDS', 5))
+        self.REPLICA_MAX_LAG_SECONDS = float(os.environ.get('REPLICA_MAX_LAG_SECONDS', 5))
+        self.REPLICA_LAG_CHECK_INTERVAL = float(os.environ.get('REPLICA_LAG_CHECK_INTERVAL', 5))
+
+        # Per-request query counting and N+1 warnings (see app/utils/query_stats.py)
+        self.QUERY_STATS_ENABLED = os.environ.get('QUERY_STATS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+        self.N_PLUS_ONE_THRESHOLD = int(os.environ.get('N_PLUS_ONE_THRESHOLD', 10))
+        # X-DB-Queries/X-DB-Time headers; unset means on only in debug/testing
+        query_headers = os.environ.get('QUERY_STATS_HEADERS')
+        self.QUERY_STATS_HEADERS = query_headers.lower() in ('1', 'true', 'yes') if query_headers else None
+
+        # Prometheus /metrics endpoint (off by default); set METRICS_TOKEN to require a bearer token
+        self.METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+        self.METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+        # Shared directory that merges every worker's metrics (gunicorn.conf.py sets it)
+        self.METRICS_MULTIPROC_DIR = os.environ.get('METRICS_MULTIPROC_DIR')
+        self.METRICS_FLUSH_INTERVAL = float(os.environ.get('METRICS_FLUSH_INTERVAL', 5))
+
+        # Slow-query log (see app/utils/slow_query_log.py); 0 disables it
+        self.SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 500))
+        self.SLOW_QUERY_EXPLAIN = os.environ.get('SLOW_QUERY_EXPLAIN', 'false').lower() in ('1', 'true', 'yes')
+        self.SLOW_QUERY_EXPLAIN_LIMIT = int(os.environ.get('SLOW_QUERY_EXPLAIN_LIMIT', 3))
+        self.SLOW_QUERY_LOG_FILE = os.environ.get(
+            'SLOW_QUERY_LOG_FILE',
+            os.path.join(os.path.abspath(os.path.dirname(__file__)), 'logs', 'slow_queries.log')
+        )
+
+        # On-demand profiling of super-user requests (X-Profile: 1)
+        self.PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+        self.PROFILE_DIR = os.environ.get(
+            'PROFILE_DIR',
+            os.path.join(os.path.abspath(os.path.dirname(__file__)), 'profiles')
+        )
+        self.PROFILE_MAX_FILES = int(os.environ.get('PROFILE_MAX_FILES', 50))
+
+        # JSON encoder for responses: 'orjson' or Flask's 'default' (see app/utils/json_provider.py)
+        self.JSON_PROVIDER = os.environ.get('JSON_PROVIDER', 'orjson').lower()
+
+        # Response compression (see app/utils/compression.py); encodings in preference order
+        self.COMPRESSION_ENABLED = os.environ.get('COMPRESSION_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+        self.COMPRESSION_ENCODINGS = os.environ.get('COMPRESSION_ENCODINGS', 'br,gzip')
+        self.COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 500))
+        self.COMPRESSION_BROTLI_QUALITY = int(os.environ.get('COMPRESSION_BROTLI_QUALITY', 4))
+        self.COMPRESSION_GZIP_LEVEL = int(os.environ.get('COMPRESSION_GZIP_LEVEL', 6))
+
+        # Request tracing (see app/utils/tracing.py); exporter is 'jsonl' or 'otlp'
+        self.TRACING_ENABLED = os.environ.get('TRACING_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+        self.TRACING_SAMPLE_RATE = float(os.environ.get('TRACING_SAMPLE_RATE', 1.0))
+        # Let an incoming traceparent's sampled flag override the rate (trusted gateways only)
+        self.TRACING_TRUST_PARENT = os.environ.get('TRACING_TRUST_PARENT', 'false').lower() in ('1', 'true', 'yes')
+        self.TRACING_QUEUE_SIZE = int(os.environ.get('TRACING_QUEUE_SIZE', 2048))
+        self.TRACING_BATCH_SIZE = int(os.environ.get('TRACING_BATCH_SIZE', 64))
+        self.TRACING_BATCH_DELAY = float(os.environ.get('TRACING_BATCH_DELAY', 1.0))
+        self.TRACING_EXPORTER = os.environ.get('TRACING_EXPORTER', 'jsonl').lower()
+        self.TRACING_JSONL_PATH = os.environ.get(
+            'TRACING_JSONL_PATH',
+            os.path.join(os.path.abspath(os.path.dirname(__file__)), 'logs', 'traces.jsonl')
+        )
+        self.TRACING_OTLP_ENDPOINT = os.environ.get('TRACING_OTLP_ENDPOINT', 'http://localhost:4318/v1/traces')
+        self.TRACING_SERVICE_NAME = os.environ.get('TRACING_SERVICE_NAME', 'maintenance-executions-api')
         
         # Add these new configurations
         self.UPLOAD_FOLDER = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'uploads')
         self.MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
-        
-        print("Upload Folder")
-        print(self.UPLOAD_FOLDER)
-        
-        # Ensure upload directory exists
-        if not os.path.exists(self.UPLOAD_FOLDER):
-            os.makedirs(self.UPLOAD_FOLDER)
 
-    def create_db_and_user(self, db_host, db_name, db_user, db_pass):
+    @staticmethod
+    def _get_engine_options(db_url):
+        """Build SQLAlchemy engine/pool options from DB_* environment variables."""
+        options = {
+            'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes'),
+        }
+
+        # Pool sizing does not apply to SQLite's single-file/in-memory pools
+        if db_url.startswith('sqlite'):
+            return options
+
+        options.update({
+            'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+            'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+            'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 30)),
+            'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+        })
+
+        statement_timeout = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 0))
+        if statement_timeout and db_url.startswith('postgresql'):
+            options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+
+        return options
+
+    @staticmethod
+    def create_db_and_user(db_host, db_name, db_user, db_pass):
         """Create database and user if they don't exist."""
+        import psycopg2
+        from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
         try:
             # Connect to PostgreSQL server with superuser privileges
             conn = psycopg2.connect(
@@ -69,39 +162,45 @@ class Config:
             logger.error(f"Error creating database/user: {str(e)}")
             return False, str(e)
 
-    def _get_database_uri(self):
-        """Get database URI from environment or prompt user."""
+    @staticmethod
+    def _get_database_uri():
+        """Get database URI from environment."""
         db_url = os.environ.get('DATABASE_URL')
-        
-        if not db_url and os.isatty(0):
-            print("\n⚠️  Database URL not found in environment variables.")
-            
-            # Get database connection details
-            db_host = input("Database host (default: localhost): ").strip() or 'localhost'
-            db_name = input("Database name: ").strip()
-            db_user = input("Database username: ").strip()
-            db_pass = getpass.getpass("Database password: ").strip()
-
-            # Create database and user if needed
-            success, error = self.create_db_and_user(db_host, db_name, db_user, db_pass)
-            if not success:
-                raise Exception(f"Failed to create database/user: {error}")
-
-            db_url = f"postgresql://{db_user}:{db_pass}@{db_host}/{db_name}"
-            
-            # Ask to save to .env
-            if input("\nSave credentials to .env file? (y/n): ").lower().strip() == 'y':
-                try:
-                    with open('.env', 'a') as f:
-                        f.write("\n# Database Configuration\n")
-                        f.write(f"DATABASE_URL={db_url}\n")
-                    print("✅ Credentials saved to .env file")
-                except Exception as e:
-                    print(f"⚠️  Warning: Could not save to .env file: {str(e)}")
-
         if not db_url:
-            raise ValueError("Database URL is required. Please set DATABASE_URL environment variable or run in interactive mode.")
-            
+            raise ValueError(
+                "Database URL is required. Please set DATABASE_URL environment variable "
+                "or run 'python -m management.db_config' to configure it interactively."
+            )
+        return db_url
+
+    @staticmethod
+    def prompt_database_uri():
+        """Prompt for database credentials, create the database and optionally save to .env."""
+        print("\n⚠️  Database URL not found in environment variables.")
+
+        # Get database connection details
+        db_host = input("Database host (default: localhost): ").strip() or 'localhost'
+        db_name = input("Database name: ").strip()
+        db_user = input("Database username: ").strip()
+        db_pass = getpass.getpass("Database password: ").strip()
+
+        # Create database and user if needed
+        success, error = Config.create_db_and_user(db_host, db_name, db_user, db_pass)
+        if not success:
+            raise Exception(f"Failed to create database/user: {error}")
+
+        db_url = f"postgresql://{db_user}:{db_pass}@{db_host}/{db_name}"
+
+        # Ask to save to .env
+        if input("\nSave credentials to .env file? (y/n): ").lower().strip() == 'y':
+            try:
+                with open('.env', 'a') as f:
+                    f.write("\n# Database Configuration\n")
+                    f.write(f"DATABASE_URL={db_url}\n")
+                print("✅ Credentials saved to .env file")
+            except Exception as e:
+                print(f"⚠️  Warning: Could not save to .env file: {str(e)}")
+
         return db_url
 
     @staticmethod
@@ -0,0 +1,94 @@
+# gunicorn.conf.py
+"""
+Gunicorn settings for the API.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Every value can be overridden from the environment (GUNICORN_* or the
+standard WEB_CONCURRENCY). Each worker owns its own SQLAlchemy pool, so
+keep workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below PostgreSQL's
+max_connections.
+"""
+import multiprocessing
+import glob
+import os
+import tempfile
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Request handling is mostly waiting on PostgreSQL, so run a few threads per
+# process and size processes from the CPU count.
+workers = _env_int('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1)
+threads = _env_int('GUNICORN_THREADS', 4)
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+# Import the app once in the master; workers fork with it already loaded.
+# Connections opened before the fork must not be shared (see post_fork).
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() in ('1', 'true', 'yes')
+
+# PDF/DOCX exports are the slowest requests; leave them room to finish,
+# including during a graceful restart.
+timeout = _env_int('GUNICORN_TIMEOUT', 120)
+graceful_timeout = _env_int('GUNICORN_GRACEFUL_TIMEOUT', 120)
+keepalive = _env_int('GUNICORN_KEEPALIVE', 5)
+
+# Recycle workers periodically to bound memory growth; jitter keeps them
+# from restarting at the same moment.
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', 100)
+
+# Workers write their metrics here and /metrics merges them (app/utils/metrics.py).
+# Set before the app loads so every worker sees the same directory.
+metrics_dir = os.environ.setdefault(
+    'METRICS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), f'cmms-metrics-{os.getpid()}')
+)
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = os.environ.get('GUNICORN_ERROR_LOG', '-')
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+
+def post_fork(server, worker):
+    """Drop pooled connections inherited from the master process"""
+    if not preload_app:
+        return
+    from app import db
+    flask_app = server.app.wsgi()
+    with flask_app.app_context():
+        for engine in db.engines.values():
+            # close=False leaves the parent's sockets alone; the child just
+            # starts with an empty pool
+            engine.dispose(close=False)
+    server.log.info(f"Worker {worker.pid}: database pools reset after fork")
+
+
+def _remove_metrics_files():
+    for path in glob.glob(os.path.join(metrics_dir, 'metrics_*.json')):
+        os.remove(path)
+
+
+def on_starting(server):
+    """Start every series from zero; files left by a previous master would be double counted"""
+    os.makedirs(metrics_dir, exist_ok=True)
+    _remove_metrics_files()
+
+
+def on_exit(server):
+    _remove_metrics_files()
+
+
+def worker_exit(server, worker):
+    """Write the exiting worker's final totals"""
+    from app.utils import metrics
+    metrics.flush()
+
+
+def child_exit(server, worker):
+    """Fold an exited worker's counters into the totals kept for dead workers"""
+    from app.utils import metrics
+    metrics.mark_process_dead(worker.pid, metrics_dir)
@@ -7,7 +7,7 @@ from datetime import datetime
 app = create_app()
 with app.app_context():
     # Create or update Role
-    role = Role.query.filter_by(name="Super admin").first()
+    role = Role.get_all_with_deleted().filter_by(name="Super admin").first()
     if not role:
         role = Role(name="Super admin", description="Can create all", is_super_user=True)
         db.session.add(role)
@@ -19,7 +19,7 @@ with app.app_context():
         print("Super admin role updated")
 
     # Create or update Environment
-    env = Environment.query.filter_by(name="ADMIN").first()
+    env = Environment.get_all_with_deleted().filter_by(name="ADMIN").first()
     if not env:
         env = Environment(name="ADMIN", description="Only administrators")
         db.session.add(env)
@@ -33,7 +33,7 @@ with app.app_context():
     db.session.commit()
 
     # Create or update User
-    user = User.query.filter_by(username='admin').first()
+    user = User.get_all_with_deleted().filter_by(username='admin').first()
     if not user:
         user = User(
             first_name="ADMIN",
@@ -4,6 +4,10 @@ from app import db
 from .db_config import init_database_config
 from .db_init import DatabaseInitializer
 from .create_test_data import TestDataCreator
+from .query_plans import explain_service_queries
+from .partitioning import PARTITIONED_TABLES, convert_table, create_partitions, detach_partition
+from app.services.archive_service import ArchiveService
+from datetime import datetime
 
 def register_commands(app):
     # Database command group
@@ -32,17 +36,114 @@ def register_commands(app):
 
     # Create test data command
     @database.command()
+    @click.option('--environments', type=int, help='Environments to create.')
+    @click.option('--users-per-env', type=int, help='Users per environment.')
+    @click.option('--forms', type=int, help='Forms to create.')
+    @click.option('--questions-per-form', type=int, help='Questions on each form.')
+    @click.option('--submissions-per-form', type=int, help='Average submissions per form (skewed).')
+    @click.option('--attachments', type=float, help='Average attachment stubs per submission.')
+    @click.option('--attachment-files', is_flag=True, help='Also write placeholder files to UPLOAD_FOLDER.')
+    @click.option('--days', default=365, show_default=True, help='Spread submissions over this many days.')
+    @click.option('--seed', type=int, help='Random seed for a reproducible dataset.')
+    @click.option('--batch-size', default=10000, show_default=True, help='Rows per COPY/insert batch.')
     @with_appcontext
-    def testdata():
-        """Create test data for development."""
+    def testdata(**scale):
+        """Create synthetic test data; size it with the scale options."""
         click.echo("Creating test data...")
-        creator = TestDataCreator(app)
+        creator = TestDataCreator(app, echo=click.echo, **scale)
         success, error = creator.create_test_data()
         if success:
             click.echo("Test data created successfully.")
         else:
             click.echo(f"Error creating test data: {error}", err=True)
 
+    # Query plan inspection command
+    @database.command()
+    @click.option('--analyze', is_flag=True, help='Execute the queries (PostgreSQL EXPLAIN ANALYZE).')
+    @with_appcontext
+    def explain(analyze):
+        """Print EXPLAIN plans for the main service queries."""
+        for label, sql, plan in explain_service_queries(analyze=analyze):
+            click.echo(f"\n=== {label}")
+            click.echo(sql)
+            for line in plan:
+                click.echo(f"  {line}")
+
+    # Partitioning commands (PostgreSQL only)
+    @database.command()
+    @click.argument('table', type=click.Choice(list(PARTITIONED_TABLES)))
+    @click.option('--months-ahead', default=3, show_default=True, help='Future monthly partitions to create.')
+    @click.option('--keep-legacy', is_flag=True, help='Keep the original table as <table>_legacy.')
+    @with_appcontext
+    def partition(table, months_ahead, keep_legacy):
+        """Convert a table to monthly range partitions."""
+        if not click.confirm(f"Rebuild '{table}' as a partitioned table? Writes are blocked while rows are copied."):
+            return
+        summary, error = convert_table(table, months_ahead=months_ahead, keep_legacy=keep_legacy)
+        if error:
+            click.echo(f"Error partitioning {table}: {error}", err=True)
+            return
+        click.echo(f"Partitioned {table} by {summary['partition_key']}: "
+                   f"{summary['rows_copied']} rows into {len(summary['partitions'])} partitions.")
+        for fk in summary['replaced_foreign_keys']:
+            click.echo(f"  replaced foreign key {fk} with reference triggers")
+
+    @database.command('create-partitions')
+    @click.option('--table', type=click.Choice(list(PARTITIONED_TABLES)), help='Defaults to all partitioned tables.')
+    @click.option('--months-ahead', default=3, show_default=True)
+    @with_appcontext
+    def create_partitions_command(table, months_ahead):
+        """Create upcoming monthly partitions (run from cron)."""
+        for name in ([table] if table else PARTITIONED_TABLES):
+            created, error = create_partitions(name, months_ahead=months_ahead)
+            if error:
+                click.echo(f"{name}: {error}", err=True)
+            else:
+                click.echo(f"{name}: created {len(created)} partitions {', '.join(created)}")
+
+    @database.command('detach-partition')
+    @click.argument('table', type=click.Choice(list(PARTITIONED_TABLES)))
+    @click.argument('month')
+    @click.option('--drop', is_flag=True, help='Drop the detached table instead of keeping it.')
+    @with_appcontext
+    def detach_partition_command(table, month, drop):
+        """Detach the MONTH (YYYY-MM) partition of a table."""
+        try:
+            month_date = datetime.strptime(month, '%Y-%m').date()
+        except ValueError:
+            click.echo("Month must be in YYYY-MM format", err=True)
+            return
+        success, error = detach_partition(table, month_date, drop=drop)
+        if success:
+            click.echo(f"Detached {month} from {table}{' and dropped it' if drop else ''}.")
+        else:
+            click.echo(f"Error detaching partition: {error}", err=True)
+
+    # Archive command
+    @database.command()
+    @click.option('--days', default=90, show_default=True, help='Archive rows soft-deleted more than this many days ago.')
+    @click.option('--table', help='Only archive this table.')
+    @click.option('--batch-size', default=1000, show_default=True, help='Rows moved per transaction.')
+    @click.option('--sleep', 'sleep_seconds', default=0.0, show_default=True, help='Pause between batches (seconds).')
+    @click.option('--dry-run', is_flag=True, help='Count eligible rows without moving them.')
+    @with_appcontext
+    def archive(days, table, batch_size, sleep_seconds, dry_run):
+        """Move long soft-deleted rows into archive tables (safe to rerun)."""
+        def report(table_name, moved, last_id):
+            click.echo(f"  {table_name}: {moved} rows {'eligible' if dry_run else 'archived'} (last id {last_id})")
+
+        options = dict(batch_size=batch_size, sleep_seconds=sleep_seconds, dry_run=dry_run, progress=report)
+        if table:
+            moved, error = ArchiveService.archive_table(table, days, **options)
+            results = {table: moved}
+        else:
+            results, error = ArchiveService.archive_all(days, **options)
+
+        click.echo(f"{'Eligible' if dry_run else 'Archived'} {sum(results.values())} rows "
+                   f"across {len([n for n in results.values() if n])} tables.")
+        if error:
+            click.echo(f"Archive stopped early: {error}. Rerun to resume.", err=True)
+
     # Full setup command
     @database.command()
     def setup():
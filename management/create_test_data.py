@@ -1,321 +1,479 @@
-from app import db
-from app.models import (
-    QuestionType, Question, Answer, Form, FormQuestion, 
-    FormAnswer, FormSubmission, AnswerSubmitted, Attachment
-)
-from datetime import datetime, timedelta
+"""
+Synthetic data for development and benchmarking.
+
+``flask database testdata`` generates environments, users, a shared
+question bank, forms, submissions, submitted answers and attachment
+stubs at a configurable scale. Distributions are skewed the way real
+tenants are: a few environments own most forms, a few forms receive most
+submissions (Pareto), a few users submit most of them (Zipf) and recent
+months are busier than old ones.
+
+Rows are built as tuples with pre-allocated ids and loaded in batches:
+``COPY ... FROM STDIN`` on PostgreSQL, multi-row executemany elsewhere.
+No ORM objects are created, so 10M answers take minutes, not hours.
+Run ``flask database init`` first; roles and question types must exist.
+"""
+import csv
+import io
 import logging
-from app.models.user import User
+import os
 import random
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select
+from werkzeug.security import generate_password_hash
+
+from app import db
 
 logger = logging.getLogger(__name__)
 
-class TestDataCreator:
-    def __init__(self, app):
-        self.app = app
+TEST_PASSWORD = 'Testdata1!'
 
-    def create_question_types(self):
-        """Create basic question types"""
-        types = [
-            ('single_text', 'Texto libre, una respuesta'),
-            ('multiple_choice', 'Selección múltiple'),
-            ('single_choice', 'Selección única'),
-            ('date', 'Fecha')
-        ]
-        
-        created_types = []
-        for type_name, description in types:
-            qt = QuestionType.query.filter_by(type=type_name).first()
-            if not qt:
-                qt = QuestionType(type=type_name)
-                db.session.add(qt)
-                logger.info(f"Created question type: {type_name}")
-            created_types.append(qt)
-        
-        db.session.commit()
-        return created_types
-
-    def create_project_questions(self):
-        """Create project evaluation questions"""
-        questions_data = [
-            {
-                'text': '¿Cuál es el nombre del proyecto?',
-                'type': 'single_text',
-                'order': 1,
-                'has_remarks': False
-            },
-            {
-                'text': 'Seleccione las áreas involucradas',
-                'type': 'multiple_choice',
-                'order': 2,
-                'has_remarks': True
-            },
-            {
-                'text': '¿Cuál es el estado actual del proyecto?',
-                'type': 'single_choice',
-                'order': 3,
-                'has_remarks': True
-            },
-            {
-                'text': 'Fecha estimada de finalización',
-                'type': 'date',
-                'order': 4,
-                'has_remarks': False
-            },
-            {
-                'text': 'Seleccione los riesgos identificados',
-                'type': 'multiple_choice',
-                'order': 5,
-                'has_remarks': True
-            }
-        ]
-
-        created_questions = []
-        for q_data in questions_data:
-            q_type = QuestionType.query.filter_by(type=q_data['type']).first()
-            if not q_type:
-                continue
-
-            question = Question(
-                text=q_data['text'],
-                question_type_id=q_type.id,
-                order_number=q_data['order'],
-                has_remarks=q_data['has_remarks']
-            )
-            db.session.add(question)
-            created_questions.append(question)
-
-        db.session.commit()
-        return created_questions
-
-    def create_project_answers(self):
-        """Create project evaluation answers"""
-        answers_data = [
-            # Respuesta para nombre del proyecto
-            'Modernización Sistema Core',
-            
-            # Respuestas para áreas involucradas
-            'Desarrollo',
-            'QA',
-            'Infraestructura',
-            
-            # Respuestas para estado del proyecto
-            'En progreso',
-            'Completado',
-            'Retrasado',
-            'En pausa',
-            
-            # Respuesta para fecha
-            '2024-12-31',
-            
-            # Respuestas para riesgos
-            'Retraso en entregas',
-            'Problemas de integración',
-            'Falta de recursos',
-            'Cambios de alcance',
-            'Problemas técnicos',
-            'Dependencias externas'
-        ]
-
-        created_answers = []
-        for value in answers_data:
-            answer = Answer.query.filter_by(value=value).first()
-            if not answer:
-                answer = Answer(value=value)
-                db.session.add(answer)
-                logger.info(f"Created answer option: {value}")
-            created_answers.append(answer)
-
-        db.session.commit()
-        return created_answers
-
-    def create_project_forms(self):
-        """Create project evaluation forms"""
-        admin_user = User.query.filter_by(username='datacentermanager').first()
-        if not admin_user:
-            logger.error("Admin user not found")
-            return []
-
-        forms_data = [
-            {
-                'title': 'Evaluación de Proyecto 2024',
-                'description': 'Formulario para evaluación trimestral de proyectos',
-                'is_public': True
-            },
-            {
-                'title': 'Evaluación de Riesgos de Proyecto',
-                'description': 'Formulario para evaluación de riesgos y mitigaciones',
-                'is_public': True
-            },
-            {
-                'title': 'Reporte de Avance de Proyecto',
-                'description': 'Formulario para reportar el avance mensual del proyecto',
-                'is_public': True
-            }
-        ]
-
-        created_forms = []
-        questions = Question.query.all()
-        
-        for form_data in forms_data:
-            form = Form.query.filter_by(title=form_data['title']).first()
-            if not form:
-                form = Form(
-                    title=form_data['title'],
-                    description=form_data['description'],
-                    user_id=admin_user.id,
-                    is_public=form_data['is_public']
-                )
-                db.session.add(form)
-                db.session.flush()
-
-                # Add questions to form
-                for i, question in enumerate(questions, 1):
-                    form_question = FormQuestion(
-                        form_id=form.id,
-                        question_id=question.id,
-                        order_number=i
-                    )
-                    db.session.add(form_question)
-
-                created_forms.append(form)
-                logger.info(f"Created form: {form_data['title']}")
-
-        db.session.commit()
-        return created_forms
-
-    def create_sample_submissions(self):
-        """Create sample form submissions"""
+DEFAULT_SCALE = {
+    'environments': 3,
+    'users_per_env': 10,
+    'forms': 20,
+    'questions_per_form': 8,
+    'submissions_per_form': 25,
+    'attachments': 0.3,
+}
+
+# Share of the question bank per type; choice types get answer options
+QUESTION_TYPE_WEIGHTS = {
+    'text': 30, 'multiple_choices': 25, 'checkbox': 15,
+    'date': 10, 'datetime': 5, 'user': 10, 'signature': 5,
+}
+TEXT_TYPES = ('text', 'date', 'datetime')
+
+# Pareto shape for submissions per form (~80/20)
+FORM_POPULARITY_ALPHA = 1.16
+
+FIRST_NAMES = [
+    'Ana', 'Carlos', 'Maria', 'Jose', 'Laura', 'Miguel', 'Sofia', 'Diego', 'Elena', 'Pablo',
+    'James', 'Mary', 'Robert', 'Linda', 'David', 'Susan', 'Daniel', 'Karen', 'Paul', 'Nancy',
+]
+LAST_NAMES = [
+    'Garcia', 'Rodriguez', 'Martinez', 'Lopez', 'Gonzalez', 'Perez', 'Sanchez', 'Ramirez',
+    'Torres', 'Flores', 'Smith', 'Johnson', 'Brown', 'Miller', 'Davis', 'Wilson', 'Moore',
+]
+ASSETS = [
+    'Generator', 'Chiller', 'UPS', 'Cooling Tower', 'Air Handler', 'Fire Pump', 'Switchgear',
+    'Transformer', 'Boiler', 'Elevator', 'Compressor', 'PDU', 'CRAC Unit', 'Battery Bank',
+]
+FORM_KINDS = [
+    'Daily Inspection', 'Weekly Checklist', 'Monthly Maintenance', 'Quarterly Service',
+    'Incident Report', 'Safety Walkthrough', 'Commissioning', 'Work Order Close-out',
+]
+QUESTION_TEMPLATES = {
+    'text': ['{asset} reading', '{asset} observations', 'Describe {asset} condition', '{asset} meter value'],
+    'multiple_choices': ['{asset} overall status', '{asset} alarm state', 'Is the {asset} operational?'],
+    'checkbox': ['{asset} tasks completed', '{asset} parts replaced', '{asset} issues found'],
+    'date': ['Last {asset} service date', 'Next {asset} service date'],
+    'datetime': ['{asset} inspection start', '{asset} shutdown time'],
+    'user': ['{asset} technician on duty', '{asset} supervisor'],
+    'signature': ['{asset} sign-off', '{asset} approval'],
+}
+OPTION_VALUES = [
+    'Pass', 'Fail', 'N/A', 'Yes', 'No', 'Good', 'Fair', 'Poor', 'Critical', 'Normal',
+    'Warning', 'Alarm', 'Cleaned', 'Lubricated', 'Filter replaced', 'Belt replaced',
+    'Leak found', 'Noise', 'Vibration', 'Overheating', 'Corrosion', 'Calibrated',
+]
+TEXT_ANSWERS = [
+    'Within normal range', 'Minor wear observed', 'No issues', 'Reading stable',
+    'Scheduled follow-up', 'Replaced on site', 'Awaiting parts', 'Logged in CMMS',
+]
+ATTACHMENT_TYPES = [('application/pdf', 'pdf'), ('image/jpeg', 'jpg'), ('image/png', 'png')]
+
+
+def zipf_weights(n: int, s: float = 1.0) -> List[float]:
+    """Rank-based weights: item k gets 1/k^s"""
+    return [1.0 / (k ** s) for k in range(1, n + 1)]
+
+
+def apportion(total: int, weights: Sequence[float]) -> List[int]:
+    """Split total into integer shares proportional to weights, summing exactly to total"""
+    weight_sum = sum(weights) or 1.0
+    exact = [total * w / weight_sum for w in weights]
+    shares = [int(x) for x in exact]
+    remainder = total - sum(shares)
+    by_fraction = sorted(range(len(exact)), key=lambda i: exact[i] - shares[i], reverse=True)
+    for i in by_fraction[:remainder]:
+        shares[i] += 1
+    return shares
+
+
+class BulkLoader:
+    """Batched inserts of row tuples with explicit ids"""
+
+    def __init__(self, connection, batch_size: int = 10000):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.use_copy = connection.dialect.name == 'postgresql'
+        self.counts: Dict[str, int] = {}
+
+    def next_id(self, table: str) -> int:
+        table_obj = db.metadata.tables[table]
+        return (self.connection.execute(select(func.max(table_obj.c.id))).scalar() or 0) + 1
+
+    def load(self, table: str, columns: Sequence[str], rows: Iterable[tuple]):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._flush(table, columns, batch)
+                batch = []
+        if batch:
+            self._flush(table, columns, batch)
+
+    def _flush(self, table: str, columns: Sequence[str], batch: List[tuple]):
+        if self.use_copy:
+            self._copy(table, columns, batch)
+        else:
+            self._insert(table, columns, batch)
+        self.counts[table] = self.counts.get(table, 0) + len(batch)
+
+    def _insert(self, table: str, columns: Sequence[str], batch: List[tuple]):
+        """Driver-level executemany; Core's per-row type processing costs more than the insert"""
+        dialect = self.connection.dialect
+        if dialect.name == 'sqlite':
+            # Same text format SQLAlchemy's SQLite DateTime type writes
+            batch = [tuple(value.isoformat(' ') if isinstance(value, datetime) else value for value in row)
+                     for row in batch]
+        placeholder = '?' if dialect.paramstyle == 'qmark' else '%s'
+        self.connection.exec_driver_sql(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join([placeholder] * len(columns))})",
+            batch
+        )
+
+    def _copy(self, table: str, columns: Sequence[str], batch: List[tuple]):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in batch:
+            writer.writerow(['' if value is None else value for value in row])
+        buffer.seek(0)
+        cursor = self.connection.connection.cursor()
         try:
-            # Get first form and its questions
-            form = Form.query.first()
-            if not form:
-                logger.error("No forms found")
-                return False
-
-            form_questions = FormQuestion.query.filter_by(form_id=form.id).all()
-            answers = Answer.query.all()
-
-            # Create a submission
-            submission = FormSubmission(
-                form_id=form.id,
-                submitted_by='datacentermanager',
-                submitted_at=datetime.utcnow()
+            cursor.copy_expert(
+                f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer
             )
-            db.session.add(submission)
-            db.session.flush()
-
-            # Create form answers and link them to submission
-            for fq in form_questions:
-                # Select appropriate answer based on question type
-                question = Question.query.get(fq.question_id)
-                suitable_answers = [a for a in answers if len(a.value) > 0]  # Filter out empty answers
-                answer = random.choice(suitable_answers)
-
-                form_answer = FormAnswer(
-                    form_question_id=fq.id,
-                    answer_id=answer.id,
-                    remarks='Observación de ejemplo' if question.has_remarks else None
-                )
-                db.session.add(form_answer)
-                db.session.flush()
-
-                # Link answer to submission
-                answer_submitted = AnswerSubmitted(
-                    form_answer_id=form_answer.id,
-                    form_submission_id=submission.id
-                )
-                db.session.add(answer_submitted)
-
-            # Add sample attachments
-            attachments_data = [
-                {
-                    'file_type': 'pdf',
-                    'file_path': '/storage/projects/cronograma.pdf',
-                    'is_signature': False
-                },
-                {
-                    'file_type': 'xlsx',
-                    'file_path': '/storage/projects/riesgos.xlsx',
-                    'is_signature': False
-                },
-                {
-                    'file_type': 'png',
-                    'file_path': '/storage/projects/firma_aprobacion.png',
-                    'is_signature': True
-                }
-            ]
-
-            for att_data in attachments_data:
-                attachment = Attachment(
-                    form_submission_id=submission.id,
-                    **att_data
-                )
-                db.session.add(attachment)
-
-            db.session.commit()
-            return True
+        finally:
+            cursor.close()
 
-        except Exception as e:
-            logger.error(f"Error creating sample submissions: {str(e)}")
-            db.session.rollback()
-            return False
+    def reset_sequences(self):
+        """Explicit ids leave PostgreSQL sequences behind; move them past max(id)"""
+        if self.connection.dialect.name != 'postgresql':
+            return
+        for table in self.counts:
+            self.connection.exec_driver_sql(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"(SELECT COALESCE(MAX(id), 1) FROM {table}))"
+            )
+
+
+class TestDataCreator:
+    """Generates a synthetic dataset of the requested scale"""
+
+    def __init__(self, app, environments: int = None, users_per_env: int = None, forms: int = None,
+                 questions_per_form: int = None, submissions_per_form: int = None,
+                 attachments: float = None, days: int = 365, seed: Optional[int] = None,
+                 batch_size: int = 10000, attachment_files: bool = False,
+                 echo: Callable[[str], None] = print):
+        self.app = app
+        overrides = {
+            'environments': environments, 'users_per_env': users_per_env, 'forms': forms,
+            'questions_per_form': questions_per_form, 'submissions_per_form': submissions_per_form,
+            'attachments': attachments,
+        }
+        self.scale = {key: DEFAULT_SCALE[key] if value is None else value for key, value in overrides.items()}
+        self.days = days
+        self.batch_size = batch_size
+        self.attachment_files = attachment_files
+        self.echo = echo
+        self.random = random.Random(seed)
+        self.now = datetime.utcnow().replace(microsecond=0)
+        # Keeps names unique across repeated runs against the same database
+        self.run_tag = self.now.strftime('%y%m%d%H%M%S')
+
+    def _pick(self, items: Sequence, weights: Sequence[float] = None):
+        return self.random.choices(items, weights=weights)[0] if weights else self.random.choice(items)
+
+    def _timestamp(self, days: int = None) -> datetime:
+        """Recent-biased day within the last ``days``, business-hours-biased time of day"""
+        days_ago = int((self.days if days is None else days) * self.random.random() ** 2)
+        hour = min(max(int(self.random.gauss(11, 3)), 0), 23)
+        day = (self.now - timedelta(days=days_ago)).replace(hour=hour, minute=0, second=0)
+        timestamp = day + timedelta(minutes=self.random.randrange(60), seconds=self.random.randrange(60))
+        return min(timestamp, self.now)
+
+    def _lookup(self, loader: BulkLoader) -> Tuple[Dict[str, int], Dict[str, int]]:
+        roles_table = db.metadata.tables['roles']
+        types_table = db.metadata.tables['question_types']
+        roles = dict(loader.connection.execute(select(roles_table.c.name, roles_table.c.id)).all())
+        types = dict(loader.connection.execute(select(types_table.c.type, types_table.c.id)).all())
+        return roles, types
+
+    def create_environments(self, loader: BulkLoader) -> List[int]:
+        first = loader.next_id('environments')
+        ids = list(range(first, first + self.scale['environments']))
+        loader.load(
+            'environments',
+            ('id', 'name', 'description', 'is_deleted', 'created_at', 'updated_at'),
+            ((env_id, f"TD{self.run_tag}-{n:05d}", 'Synthetic test environment', False, self.now, self.now)
+             for n, env_id in enumerate(ids, 1))
+        )
+        return ids
+
+    def create_users(self, loader: BulkLoader, environment_ids: List[int],
+                     roles: Dict[str, int]) -> Dict[int, List[Tuple[int, str]]]:
+        """One site manager, ~15% supervisors, the rest technicians; returns env -> [(id, username)]"""
+        password_hash = generate_password_hash(TEST_PASSWORD)
+        next_id = loader.next_id('users')
+        users_by_env: Dict[int, List[Tuple[int, str]]] = {}
+        rows = []
+        for env_index, env_id in enumerate(environment_ids, 1):
+            users = users_by_env[env_id] = []
+            for n in range(self.scale['users_per_env']):
+                if n == 0:
+                    role = 'Site Manager'
+                elif self.random.random() < 0.15:
+                    role = 'Supervisor'
+                else:
+                    role = 'Technician'
+                first_name, last_name = self._pick(FIRST_NAMES), self._pick(LAST_NAMES)
+                username = f"td{self.run_tag}_{env_index}_{n}"
+                rows.append((
+                    next_id, first_name, last_name, f"{username}@example.com",
+                    f"555-{self.random.randrange(10 ** 7):07d}", username, password_hash,
+                    roles.get(role), env_id, False, self.now, self.now
+                ))
+                users.append((next_id, username))
+                next_id += 1
+        loader.load(
+            'users',
+            ('id', 'first_name', 'last_name', 'email', 'contact_number', 'username', 'password_hash',
+             'role_id', 'environment_id', 'is_deleted', 'created_at', 'updated_at'),
+            rows
+        )
+        return users_by_env
+
+    def create_question_bank(self, loader: BulkLoader, types: Dict[str, int]):
+        """Questions shared by all forms, plus option answers and a blank answer for text types"""
+        type_names = [name for name in QUESTION_TYPE_WEIGHTS if name in types]
+        type_weights = [QUESTION_TYPE_WEIGHTS[name] for name in type_names]
+        size = max(self.scale['questions_per_form'] * 4,
+                   self.scale['forms'] * self.scale['questions_per_form'] // 5)
+
+        answer_id = loader.next_id('answers')
+        blank_answer_id = answer_id
+        option_ids = list(range(answer_id + 1, answer_id + 1 + len(OPTION_VALUES)))
+        loader.load(
+            'answers',
+            ('id', 'value', 'remarks', 'is_deleted', 'created_at', 'updated_at'),
+            [(blank_answer_id, None, 'Free-text placeholder', False, self.now, self.now)]
+            + [(option_id, value, None, False, self.now, self.now)
+               for option_id, value in zip(option_ids, OPTION_VALUES)]
+        )
+
+        question_id = loader.next_id('questions')
+        questions = []
+        rows = []
+        for _ in range(size):
+            type_name = self._pick(type_names, type_weights)
+            text = self._pick(QUESTION_TEMPLATES[type_name]).format(asset=self._pick(ASSETS))
+            rows.append((question_id, text, types[type_name], None, False, self.now, self.now))
+            questions.append((question_id, type_name))
+            question_id += 1
+        loader.load(
+            'questions',
+            ('id', 'text', 'question_type_id', 'remarks', 'is_deleted', 'created_at', 'updated_at'),
+            rows
+        )
+        return questions, blank_answer_id, option_ids
+
+    def _form_questions(self, questions: List[Tuple[int, str]], weights: List[float]) -> List[Tuple[int, str]]:
+        """Distinct questions for one form, favouring the popular ones"""
+        wanted = min(self.scale['questions_per_form'], len(questions))
+        chosen = {}
+        while len(chosen) < wanted:
+            for question in self.random.choices(questions, weights=weights, k=wanted * 2):
+                chosen.setdefault(question[0], question)
+                if len(chosen) == wanted:
+                    break
+        return list(chosen.values())
+
+    def create_forms(self, loader: BulkLoader, users_by_env: Dict[int, List[Tuple[int, str]]],
+                     questions: List[Tuple[int, str]], blank_answer_id: int, option_ids: List[int]) -> List[dict]:
+        environment_ids = list(users_by_env)
+        env_weights = zipf_weights(len(environment_ids))
+        question_weights = zipf_weights(len(questions), 0.8)
+
+        form_id = loader.next_id('forms')
+        form_question_id = loader.next_id('form_questions')
+        form_answer_id = loader.next_id('form_answers')
+        forms, form_rows, form_question_rows, form_answer_rows = [], [], [], []
+
+        for n in range(self.scale['forms']):
+            env_id = self._pick(environment_ids, env_weights)
+            # Managers and supervisors sit at the front of each environment's user list
+            author_id, _ = self._pick(users_by_env[env_id][:max(2, len(users_by_env[env_id]) // 5)])
+            # Forms mostly predate the submission window's busy recent end
+            created_at = self.now - timedelta(days=int(self.days * (1 - self.random.random() ** 2)), hours=12)
+            title = f"{self._pick(ASSETS)} {self._pick(FORM_KINDS)} #{n + 1}"
+            form_rows.append((form_id, title, 'Synthetic test form', author_id, env_id,
+                              self.random.random() < 0.3, False, created_at, created_at))
+
+            items = []
+            for order, (question_id, type_name) in enumerate(self._form_questions(questions, question_weights), 1):
+                form_question_rows.append((form_question_id, form_id, question_id, order,
+                                           False, created_at, created_at))
+                if type_name in TEXT_TYPES:
+                    answer_ids = [blank_answer_id]
+                else:
+                    answer_ids = self.random.sample(option_ids, self.random.randint(2, 5))
+                form_answers = []
+                for answer_id in answer_ids:
+                    form_answer_rows.append((form_answer_id, form_question_id, answer_id,
+                                             False, created_at, created_at))
+                    form_answers.append(form_answer_id)
+                    form_answer_id += 1
+                items.append((type_name, form_answers))
+                form_question_id += 1
+
+            forms.append({'id': form_id, 'environment_id': env_id, 'created_at': created_at,
+                          'age_days': (self.now - created_at).days, 'items': items})
+            form_id += 1
+
+        loader.load('forms', ('id', 'title', 'description', 'user_id', 'environment_id', 'is_public',
+                              'is_deleted', 'created_at', 'updated_at'), form_rows)
+        loader.load('form_questions', ('id', 'form_id', 'question_id', 'order_number',
+                                       'is_deleted', 'created_at', 'updated_at'), form_question_rows)
+        loader.load('form_answers', ('id', 'form_question_id', 'answer_id',
+                                     'is_deleted', 'created_at', 'updated_at'), form_answer_rows)
+        return forms
+
+    def _text_answer(self, type_name: str, submitted_at: datetime) -> str:
+        if type_name == 'date':
+            return (submitted_at - timedelta(days=self.random.randrange(60))).strftime('%d/%m/%Y')
+        if type_name == 'datetime':
+            return submitted_at.strftime('%d/%m/%Y %H:%M:%S')
+        return self._pick(TEXT_ANSWERS)
+
+    def create_submissions(self, loader: BulkLoader, forms: List[dict],
+                           users_by_env: Dict[int, List[Tuple[int, str]]]):
+        """Submissions, answers and attachment stubs, streamed to the loader in batches"""
+        total = len(forms) * self.scale['submissions_per_form']
+        counts = apportion(total, [self.random.paretovariate(FORM_POPULARITY_ALPHA) for _ in forms])
+        user_weights = {env_id: zipf_weights(len(users)) for env_id, users in users_by_env.items()}
+        option_weights = zipf_weights(5, 1.2)
+
+        next_ids = {table: loader.next_id(table) for table in
+                    ('form_submissions', 'answers_submitted', 'attachments')}
+        upload_folder = self.app.config.get('UPLOAD_FOLDER')
+        attachment_rate = self.scale['attachments']
+        submissions, answers, attachments = [], [], []
+        started = time.perf_counter()
+
+        def flush(final=False):
+            if not final and len(answers) < loader.batch_size:
+                return
+            # Parents first so foreign keys hold batch by batch
+            loader.load('form_submissions', ('id', 'form_id', 'environment_id', 'submitted_by', 'submitted_by_id',
+                                             'submitted_at', 'is_deleted', 'created_at', 'updated_at'), submissions)
+            loader.load('answers_submitted', ('id', 'form_answer_id', 'form_submission_id', 'text_answered',
+                                              'is_deleted', 'created_at', 'updated_at'), answers)
+            loader.load('attachments', ('id', 'form_submission_id', 'file_type', 'file_path', 'is_signature',
+                                        'is_deleted', 'created_at', 'updated_at'), attachments)
+            submissions.clear(), answers.clear(), attachments.clear()
+            done = loader.counts.get('answers_submitted', 0)
+            elapsed = time.perf_counter() - started
+            logger.info(f"Loaded {done} answers ({done / elapsed if elapsed else 0:.0f} rows/s)")
+
+        for form, count in zip(forms, counts):
+            env_users = users_by_env[form['environment_id']]
+            for _ in range(count):
+                submission_id = next_ids['form_submissions']
+                next_ids['form_submissions'] += 1
+                user_id, username = self._pick(env_users, user_weights[form['environment_id']])
+                submitted_at = max(self._timestamp(form['age_days']), form['created_at'])
+                submissions.append((submission_id, form['id'], form['environment_id'], username, user_id,
+                                    submitted_at, False, submitted_at, submitted_at))
+
+                for type_name, form_answers in form['items']:
+                    if type_name in TEXT_TYPES:
+                        form_answer_id, text_answered = form_answers[0], self._text_answer(type_name, submitted_at)
+                    else:
+                        form_answer_id = self._pick(form_answers, option_weights[:len(form_answers)])
+                        text_answered = None
+                    answers.append((next_ids['answers_submitted'], form_answer_id, submission_id, text_answered,
+                                    False, submitted_at, submitted_at))
+                    next_ids['answers_submitted'] += 1
+
+                stubs = int(attachment_rate) + (self.random.random() < attachment_rate % 1)
+                for n in range(stubs):
+                    file_type, extension = self._pick(ATTACHMENT_TYPES)
+                    is_signature = extension == 'png' and n == 0 and self.random.random() < 0.5
+                    file_path = os.path.join(username, f"td_{submission_id}_{n}.{extension}")
+                    attachments.append((next_ids['attachments'], submission_id, file_type, file_path,
+                                        is_signature, False, submitted_at, submitted_at))
+                    next_ids['attachments'] += 1
+                    if self.attachment_files and upload_folder:
+                        self._write_stub(os.path.join(upload_folder, file_path))
+
+                flush()
+        flush(final=True)
+
+    @staticmethod
+    def _write_stub(full_path: str):
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'wb') as handle:
+            handle.write(b'synthetic attachment stub\n')
 
     def create_test_data(self):
-        """Create all test data"""
+        """Create the whole dataset in one transaction"""
         try:
-            print("\n🚀 Creating project evaluation test data...")
-            
-            print("\n1️⃣  Creating question types...")
-            self.create_question_types()
-            print("✅ Question types created successfully")
-            
-            print("\n2️⃣  Creating project questions...")
-            self.create_project_questions()
-            print("✅ Questions created successfully")
-            
-            print("\n3️⃣  Creating answer options...")
-            self.create_project_answers()
-            print("✅ Answer options created successfully")
-            
-            print("\n4️⃣  Creating evaluation forms...")
-            self.create_project_forms()
-            print("✅ Forms created successfully")
-
-            print("\n5️⃣  Creating sample submissions...")
-            if self.create_sample_submissions():
-                print("✅ Sample submissions created successfully")
-            else:
-                print("❌ Error creating sample submissions")
-            
-            print("\n✅ Test data creation completed successfully!")
+            started = time.perf_counter()
+            self.echo(
+                "Generating: " + ', '.join(f"{key}={value}" for key, value in self.scale.items())
+            )
+            with db.engine.begin() as connection:
+                loader = BulkLoader(connection, self.batch_size)
+                roles, types = self._lookup(loader)
+                missing = [name for name in ('Site Manager', 'Supervisor', 'Technician') if name not in roles]
+                if missing or not types:
+                    return False, "Roles or question types missing; run 'flask database init' first"
+
+                environment_ids = self.create_environments(loader)
+                users_by_env = self.create_users(loader, environment_ids, roles)
+                questions, blank_answer_id, option_ids = self.create_question_bank(loader, types)
+                forms = self.create_forms(loader, users_by_env, questions, blank_answer_id, option_ids)
+                self.echo(f"Created {len(forms)} forms; loading submissions...")
+                self.create_submissions(loader, forms, users_by_env)
+                loader.reset_sequences()
+
+            elapsed = time.perf_counter() - started
+            for table, count in loader.counts.items():
+                self.echo(f"  {table}: {count}")
+            answers = loader.counts.get('answers_submitted', 0)
+            self.echo(f"Loaded in {elapsed:.1f}s ({answers / elapsed if elapsed else 0:.0f} answers/s). "
+                      f"Users log in with password '{TEST_PASSWORD}'.")
             return True, None
-            
+
         except Exception as e:
-            db.session.rollback()
             error_msg = f"Error creating test data: {str(e)}"
             logger.error(error_msg)
             return False, error_msg
 
+
 def create_test_data():
-    print("\n🔧 Project Evaluation Test Data Creation")
-    print("=====================================")
-    
-    try:
-        from app import create_app
-        app = create_app()
-        with app.app_context():
-            creator = TestDataCreator(app)
-            success, error = creator.create_test_data()
-            
-            if success:
-                print("\n🎉 Success! Test data has been created successfully.")
-            else:
-                print(f"\n❌ Error: {error}")
-                print("Please check the logs for more details.")
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {str(e)}")
-        print("Please check the logs for more details.")
+    from app import create_app
+    app = create_app()
+    with app.app_context():
+        success, error = TestDataCreator(app).create_test_data()
+        if not success:
+            print(f"\n❌ Error: {error}")
+
 
 if __name__ == "__main__":
-    create_test_data()
\ No newline at end of file
+    create_test_data()
@@ -1,15 +1,16 @@
 from config import Config
+from dotenv import load_dotenv
 import os
 
 def init_database_config():
     """Initialize database configuration with user prompts."""
-    config = Config()
+    load_dotenv()
     
     print("\n=== Database Configuration Setup ===")
     print("This script will help you configure the database connection.")
     
-    # Get database URL (this will prompt if not in environment)
-    db_url = config.SQLALCHEMY_DATABASE_URI
+    # Get database URL (prompt if not in environment)
+    db_url = os.environ.get('DATABASE_URL') or Config.prompt_database_uri()
     
     # Test connection
     print("\nTesting database connection...")
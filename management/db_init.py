@@ -1,5 +1,7 @@
 import logging
 import getpass
+import os
+from contextlib import contextmanager
 from app.models.permission import Permission
 from app.models.question_type import QuestionType
 from app.utils.helpers import validate_email
@@ -9,10 +11,52 @@ from app.models.user import User
 from app.models.role import Role
 from app.models.environment import Environment
 from datetime import datetime
+from flask_migrate import upgrade
 from sqlalchemy import text
 
 logger = logging.getLogger(__name__)
 
+# Arbitrary application-wide key for pg_advisory_lock
+INIT_LOCK_KEY = 7305_2024_0001
+
+
+@contextmanager
+def init_lock(engine):
+    """
+    Serialize database initialization across processes.
+
+    PostgreSQL uses a session advisory lock held on a dedicated connection;
+    file-based SQLite uses an exclusive lock on a sibling '.init.lock' file.
+    Other backends (and in-memory SQLite) run unlocked.
+    """
+    if engine.dialect.name == 'postgresql':
+        with engine.connect() as connection:
+            logger.info("Waiting for database initialization lock...")
+            connection.execute(text('SELECT pg_advisory_lock(:key)'), {'key': INIT_LOCK_KEY})
+            try:
+                yield
+            finally:
+                connection.execute(text('SELECT pg_advisory_unlock(:key)'), {'key': INIT_LOCK_KEY})
+                connection.commit()
+        return
+
+    database = engine.url.database if engine.dialect.name == 'sqlite' else None
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+    if not database or database == ':memory:' or fcntl is None:
+        yield
+        return
+
+    with open(f"{os.path.abspath(database)}.init.lock", 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
 class DatabaseInitializer:
     def ensure_database_exists(self):
         """Ensure database and required extensions exist."""
@@ -21,8 +65,9 @@ class DatabaseInitializer:
                 db.engine.connect()
                 
                 # Create extensions if they don't exist using SQLAlchemy text()
-                db.session.execute(text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"'))
-                db.session.commit()
+                if db.engine.dialect.name == 'postgresql':
+                    db.session.execute(text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"'))
+                    db.session.commit()
                 
                 return True, None
         except Exception as e:
@@ -152,7 +197,7 @@ class DatabaseInitializer:
 
         created_permissions = []
         for perm_name, description in permissions_config.items():
-            permission = Permission.query.filter_by(name=perm_name).first()
+            permission = Permission.get_all_with_deleted().filter_by(name=perm_name).first()
             if permission:
                 permission.description = description
                 permission.updated_at = datetime.utcnow()
@@ -301,7 +346,7 @@ class DatabaseInitializer:
 
         created_roles = []
         for role_name, details in roles_config.items():
-            role = Role.query.filter_by(name=role_name).first()
+            role = Role.get_all_with_deleted().filter_by(name=role_name).first()
             if role:
                 role.description = details['description']
                 role.is_super_user = details['is_super_user']
@@ -340,7 +385,7 @@ class DatabaseInitializer:
             
             created_types = []
             for type_name in default_types:
-                question_type = QuestionType.query.filter_by(type=type_name).first()
+                question_type = QuestionType.get_all_with_deleted().filter_by(type=type_name).first()
                 
                 if not question_type:
                     question_type = QuestionType(type=type_name)
@@ -367,7 +412,7 @@ class DatabaseInitializer:
 
     def init_admin_environment(self):
         """Initialize or update ADMIN environment."""
-        env = Environment.query.filter_by(name="ADMIN").first()
+        env = Environment.get_all_with_deleted().filter_by(name="ADMIN").first()
         if not env:
             env = Environment(
                 name="ADMIN",
@@ -383,7 +428,7 @@ class DatabaseInitializer:
 
     def init_admin_user(self, role, env, admin_credentials):
         """Initialize or update admin user with provided credentials."""
-        user = User.query.filter_by(username=admin_credentials['username']).first()
+        user = User.get_all_with_deleted().filter_by(username=admin_credentials['username']).first()
         
         if user:
             print(f"\n⚠️  Warning: User '{admin_credentials['username']}' already exists")
@@ -414,16 +459,25 @@ class DatabaseInitializer:
         return user
 
     def init_db(self, check_empty=True):
-        """Initialize the database with proper error handling and validation."""
+        """
+        Initialize the database with proper error handling and validation.
+
+        Applies the migrations first, then seeds roles, permissions,
+        question types and the admin user.
+
+        Runs under init_lock, so concurrent deploy steps wait for the first
+        one and then find the admin user already present.
+        """
         try:
             # First ensure database exists and is accessible
             success, error = self.ensure_database_exists()
             if not success:
                 return False, error
 
-            with self.app.app_context():
-                # Create all tables
-                db.create_all()
+            with self.app.app_context(), init_lock(db.engine):
+                # Alembic owns the schema: this builds an empty database and
+                # brings an existing one up to date
+                upgrade()
                 
                 if check_empty:
                     admin_role = Role.query.filter_by(is_super_user=True).first()
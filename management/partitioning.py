@@ -0,0 +1,339 @@
+"""
+Monthly range partitioning for the high-volume submission tables (PostgreSQL).
+
+Partitioning is opt-in: ``convert_table`` rebuilds an existing table as a
+partitioned parent, ``create_partitions`` adds months ahead of time and
+``detach_partition`` removes an old month from the parent without copying
+rows. Queries filtering on the partition key only scan matching months.
+
+Referential integrity: a partitioned table's primary key must include the
+partition key, so plain foreign keys on ``id`` (answers_submitted and
+attachments -> form_submissions) cannot point at it. ``convert_table``
+replaces each such foreign key with a pair of triggers:
+  - ``<child>_<column>_fk`` on the referencing table rejects inserts and
+    updates whose id is missing from the parent, locking the parent row
+    FOR KEY SHARE as a real foreign key would;
+  - ``<parent>_<child>_<column>_ref`` on the parent rejects deleting a row
+    that is still referenced (or cascades / sets NULL when the original
+    key said so).
+Detaching a partition bypasses row triggers, so ``detach_partition``
+refuses while rows in that month are still referenced. Row triggers on a
+partitioned child table need PostgreSQL 13+.
+"""
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import inspect
+from app import db
+from app.models.answer_submitted import AnswerSubmitted
+from app.models.form_submission import FormSubmission
+import logging
+
+logger = logging.getLogger(__name__)
+
+# table name -> (model, partition key column)
+PARTITIONED_TABLES = {
+    'form_submissions': (FormSubmission, 'submitted_at'),
+    'answers_submitted': (AnswerSubmitted, 'created_at'),
+}
+
+
+def _month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _add_months(value: date, months: int) -> date:
+    month_index = value.month - 1 + months
+    return date(value.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year}m{month.month:02d}"
+
+
+def _require_postgresql():
+    if db.engine.dialect.name != 'postgresql':
+        raise RuntimeError("Table partitioning requires PostgreSQL")
+
+
+def _validate_table(table: str):
+    if table not in PARTITIONED_TABLES:
+        raise ValueError(f"Unsupported table '{table}'. Choose from: {', '.join(PARTITIONED_TABLES)}")
+
+
+def _inbound_references(table: str) -> List[Tuple[str, str]]:
+    """(table, column) pairs whose model foreign keys point at table.id"""
+    return [
+        (fk.parent.table.name, fk.parent.name)
+        for other in db.metadata.sorted_tables
+        for fk in other.foreign_keys
+        if fk.column.table.name == table and fk.column.name == 'id'
+    ]
+
+
+def reference_trigger_sql(child: str, column: str, parent: str, ondelete: Optional[str] = None) -> List[str]:
+    """Statements that enforce child.column -> parent.id with a pair of triggers"""
+    check_fn, check_trigger = f"{child}_{column}_fk_check", f"{child}_{column}_fk"
+    action = (ondelete or 'NO ACTION').upper()
+    if action == 'CASCADE':
+        on_delete = f"DELETE FROM {child} WHERE {column} = OLD.id;"
+    elif action == 'SET NULL':
+        on_delete = f"UPDATE {child} SET {column} = NULL WHERE {column} = OLD.id;"
+    else:
+        on_delete = (
+            f"IF EXISTS (SELECT 1 FROM {child} WHERE {column} = OLD.id) THEN "
+            f"RAISE EXCEPTION 'delete on table \"{parent}\" violates reference from \"{child}\": id % is still referenced', "
+            f"OLD.id USING ERRCODE = 'foreign_key_violation'; END IF;"
+        )
+    ref_fn, ref_trigger = f"{parent}_{child}_{column}_ref_check", f"{parent}_{child}_{column}_ref"
+    return [
+        f"""
+        CREATE OR REPLACE FUNCTION {check_fn}() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.{column} IS NOT NULL
+               AND NOT EXISTS (SELECT 1 FROM {parent} WHERE id = NEW.{column} FOR KEY SHARE) THEN
+                RAISE EXCEPTION 'insert or update on table "{child}" violates reference to "{parent}": id % not found',
+                    NEW.{column} USING ERRCODE = 'foreign_key_violation';
+            END IF;
+            RETURN NEW;
+        END $$ LANGUAGE plpgsql
+        """,
+        f"DROP TRIGGER IF EXISTS {check_trigger} ON {child}",
+        f"CREATE TRIGGER {check_trigger} BEFORE INSERT OR UPDATE OF {column} ON {child} "
+        f"FOR EACH ROW EXECUTE FUNCTION {check_fn}()",
+        f"""
+        CREATE OR REPLACE FUNCTION {ref_fn}() RETURNS trigger AS $$
+        BEGIN
+            {on_delete}
+            RETURN OLD;
+        END $$ LANGUAGE plpgsql
+        """,
+        f"DROP TRIGGER IF EXISTS {ref_trigger} ON {parent}",
+        f"CREATE TRIGGER {ref_trigger} AFTER DELETE ON {parent} "
+        f"FOR EACH ROW EXECUTE FUNCTION {ref_fn}()",
+    ]
+
+
+def install_reference_triggers(child: str, column: str, parent: str, ondelete: Optional[str] = None):
+    """
+    Enforce child.column -> parent.id with triggers where a foreign key is
+    not possible. Safe to run again; functions and triggers are replaced.
+    """
+    for statement in reference_trigger_sql(child, column, parent, ondelete):
+        db.session.execute(db.text(statement))
+
+
+def partition_sql(table: str, month: date) -> str:
+    """CREATE TABLE statement for the partition holding month"""
+    return (
+        f"CREATE TABLE {partition_name(table, month)} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+    )
+
+
+def detach_sql(table: str, name: str, drop: bool = False) -> List[str]:
+    statements = [f"ALTER TABLE {table} DETACH PARTITION {name}"]
+    if drop:
+        statements.append(f"DROP TABLE {name}")
+    return statements
+
+
+def conversion_sql(table: str, key: str, inbound_fks: List[Tuple[str, str]],
+                   index_names: List[str], pk_name: Optional[str]) -> List[str]:
+    """
+    Statements that move table aside as <table>_legacy and create the empty
+    partitioned parent in its place. inbound_fks holds (table, constraint)
+    pairs of foreign keys that reference table.
+    """
+    legacy = f"{table}_legacy"
+    # Inbound foreign keys cannot target a key that excludes the partition column
+    statements = [f'ALTER TABLE {other} DROP CONSTRAINT "{fk_name}"' for other, fk_name in inbound_fks]
+    # Free the table, index and constraint names for the partitioned parent
+    statements.append(f"ALTER TABLE {table} RENAME TO {legacy}")
+    statements += [f'ALTER INDEX "{name}" RENAME TO "{name}_legacy"' for name in index_names]
+    if pk_name:
+        statements.append(f'ALTER TABLE {legacy} RENAME CONSTRAINT "{pk_name}" TO "{pk_name}_legacy"')
+    return statements + [
+        f"UPDATE {legacy} SET {key} = created_at WHERE {key} IS NULL",
+        f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE ({key})",
+        f"ALTER TABLE {table} ADD PRIMARY KEY (id, {key})",
+        f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id",
+    ]
+
+
+def is_partitioned(table: str) -> bool:
+    if db.engine.dialect.name != 'postgresql':
+        return False
+    return db.session.execute(
+        db.text("SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+                "WHERE c.relname = :table"),
+        {'table': table}
+    ).first() is not None
+
+
+def list_partitions(table: str) -> List[str]:
+    """Names of the partitions currently attached to table"""
+    _require_postgresql()
+    rows = db.session.execute(
+        db.text("SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table ORDER BY child.relname"),
+        {'table': table}
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def create_partitions(table: str, months_ahead: int = 3, start: Optional[date] = None) -> Tuple[List[str], Optional[str]]:
+    """
+    Create monthly partitions from start (default: current month) through
+    months_ahead months in the future. Existing partitions are skipped.
+
+    Returns:
+        tuple: (List of created partition names, Error message or None)
+    """
+    try:
+        _require_postgresql()
+        _validate_table(table)
+        if not is_partitioned(table):
+            return [], f"Table '{table}' is not partitioned. Run 'flask database partition {table}' first"
+
+        existing = set(list_partitions(table))
+        month = _month_start(start or date.today())
+        end = _add_months(_month_start(date.today()), months_ahead + 1)
+        created = []
+
+        while month < end:
+            name = partition_name(table, month)
+            if name not in existing:
+                db.session.execute(db.text(partition_sql(table, month)))
+                created.append(name)
+            month = _add_months(month, 1)
+
+        db.session.commit()
+        return created, None
+
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error creating partitions for {table}: {str(e)}")
+        return [], str(e)
+
+
+def detach_partition(table: str, month: date, drop: bool = False) -> Tuple[bool, Optional[str]]:
+    """
+    Detach one month from the partitioned table. The detached table keeps its
+    rows and can be archived or dropped independently.
+    """
+    try:
+        _require_postgresql()
+        _validate_table(table)
+        name = partition_name(table, _month_start(month))
+        if name not in list_partitions(table):
+            return False, f"Partition '{name}' not found"
+
+        # Row triggers do not fire for detached rows; keep references intact
+        for child, column in _inbound_references(table):
+            referenced = db.session.execute(db.text(
+                f"SELECT 1 FROM {child} c JOIN {name} p ON c.{column} = p.id LIMIT 1"
+            )).first()
+            if referenced:
+                return False, (f"Rows in '{name}' are still referenced by {child}.{column}; "
+                               f"detach or archive those rows first")
+
+        for statement in detach_sql(table, name, drop):
+            db.session.execute(db.text(statement))
+        db.session.commit()
+        return True, None
+
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error detaching partition {table}/{month}: {str(e)}")
+        return False, str(e)
+
+
+def convert_table(table: str, months_ahead: int = 3, keep_legacy: bool = False) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Rebuild an existing table as a RANGE-partitioned parent keyed by month.
+
+    The primary key becomes (id, partition key) as PostgreSQL requires, so
+    foreign keys that reference form_submissions.id (answers_submitted,
+    attachments) are replaced by reference triggers (see the module
+    docstring). Rows are copied inside a single transaction.
+
+    Returns:
+        tuple: (Summary dict or None, Error message or None)
+    """
+    try:
+        _require_postgresql()
+        _validate_table(table)
+        if is_partitioned(table):
+            return None, f"Table '{table}' is already partitioned"
+
+        model, key = PARTITIONED_TABLES[table]
+        legacy = f"{table}_legacy"
+
+        # Reflect through the session connection before any DDL runs
+        inspector = inspect(db.session.connection())
+        inbound_fks = [
+            (other, fk['name'], fk['constrained_columns'][0], (fk.get('options') or {}).get('ondelete'))
+            for other in inspector.get_table_names()
+            for fk in inspector.get_foreign_keys(other)
+            if fk['referred_table'] == table and fk.get('name')
+        ]
+        index_names = [index['name'] for index in inspector.get_indexes(table)]
+        pk_name = inspector.get_pk_constraint(table).get('name')
+
+        statements = conversion_sql(
+            table, key, [(other, fk_name) for other, fk_name, _, _ in inbound_fks], index_names, pk_name
+        )
+        for statement in statements:
+            db.session.execute(db.text(statement))
+
+        # Outbound foreign keys are supported from partitioned tables; ones
+        # pointing at another partitioned table become reference triggers
+        for fk in model.__table__.foreign_keys:
+            if is_partitioned(fk.column.table.name):
+                install_reference_triggers(table, fk.parent.name, fk.column.table.name, fk.ondelete)
+                continue
+            db.session.execute(db.text(
+                f"ALTER TABLE {table} ADD FOREIGN KEY ({fk.parent.name}) "
+                f"REFERENCES {fk.column.table.name} ({fk.column.name})"
+            ))
+
+        # One partition per month that already holds data, plus months ahead
+        first = db.session.execute(db.text(f"SELECT min({key}) FROM {legacy}")).scalar()
+        start = _month_start(first.date()) if first else _month_start(date.today())
+        month, end = start, _add_months(_month_start(date.today()), months_ahead + 1)
+        partitions = []
+        while month < end:
+            db.session.execute(db.text(partition_sql(table, month)))
+            partitions.append(partition_name(table, month))
+            month = _add_months(month, 1)
+        db.session.execute(db.text(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT"))
+
+        copied = db.session.execute(db.text(f"INSERT INTO {table} SELECT * FROM {legacy}")).rowcount
+
+        # Model indexes become partitioned indexes, created on every partition
+        connection = db.session.connection()
+        for index in model.__table__.indexes:
+            index.create(connection)
+
+        for other, _, column, ondelete in inbound_fks:
+            install_reference_triggers(other, column, table, ondelete)
+
+        if not keep_legacy:
+            db.session.execute(db.text(f"DROP TABLE {legacy}"))
+
+        db.session.commit()
+        return {
+            'table': table,
+            'partition_key': key,
+            'rows_copied': copied,
+            'partitions': partitions,
+            'replaced_foreign_keys': [f"{other}.{fk_name}" for other, fk_name, _, _ in inbound_fks],
+            'legacy_table': legacy if keep_legacy else None
+        }, None
+
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error partitioning {table}: {str(e)}")
+        return None, str(e)
@@ -0,0 +1,85 @@
+from sqlalchemy import select, func
+from app import db
+from app.models import Form, FormQuestion, FormSubmission
+from app.models.soft_delete_mixin import soft_delete_criteria
+from app.services.answer_submitted_service import AnswerSubmittedService
+from app.services.attachment_service import AttachmentService
+from app.services.form_service import FormService
+from app.services.form_submission_service import FormSubmissionService
+from app.utils.slow_query_log import explain_prefix
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _sample_id(model):
+    """Pick an existing id so plans reflect real data distribution"""
+    return db.session.scalar(select(func.min(model.id))) or 1
+
+
+def service_queries():
+    """
+    The queries the services run, keyed by a short label, built by the
+    services' own *_query functions with ids sampled from the database.
+    """
+    form_id = _sample_id(Form)
+    form_question_id = _sample_id(FormQuestion)
+    submission = db.session.get(FormSubmission, _sample_id(FormSubmission))
+    submission_id = submission.id if submission else 1
+    username = submission.submitted_by if submission else 'admin'
+    form = db.session.get(Form, form_id)
+    environment_id = form.environment_id if form and form.environment_id else 1
+    user_id = form.user_id if form else 1
+
+    return {
+        'FormService.get_forms_by_environment': FormService.forms_by_environment_query(environment_id),
+        'FormService.get_forms_by_creator': FormService.forms_by_creator_query(user_id),
+        'FormService._calculate_question_statistics': FormService.question_answers_query(form_question_id),
+        'FormService.get_user_submission_statistics': FormService.user_submissions_query(username),
+        'FormSubmissionService.get_all_submissions (form)': FormSubmissionService.submissions_query(
+            {'form_id': form_id}
+        ),
+        'FormSubmissionService.get_all_submissions (environment)': FormSubmissionService.submissions_query(
+            {'environment_id': environment_id}
+        ),
+        'AnswerSubmittedService.get_answers_by_submission': AnswerSubmittedService.answers_by_submission_query(
+            submission_id
+        ),
+        'AttachmentService.get_all_attachments': AttachmentService.attachments_query(
+            {'form_submission_id': submission_id}
+        ),
+    }
+
+
+def compile_statement(query, dialect) -> str:
+    """
+    SQL for a service Query or Select as the session would run it,
+    including the soft-delete criteria the ORM adds at execution time.
+    """
+    statement = getattr(query, 'statement', query).options(soft_delete_criteria())
+    return str(statement.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+
+
+def explain_service_queries(analyze: bool = False):
+    """
+    Run EXPLAIN for every service query.
+
+    Returns:
+        list: (label, compiled SQL, list of plan lines)
+    """
+    dialect = db.engine.dialect
+    prefix = explain_prefix(dialect.name, analyze)
+    results = []
+
+    for label, query in service_queries().items():
+        sql = compile_statement(query, dialect)
+        try:
+            rows = db.session.execute(db.text(prefix + sql)).fetchall()
+            plan = [' | '.join(str(col) for col in row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error explaining '{label}': {str(e)}")
+            db.session.rollback()
+            plan = [f"error: {str(e)}"]
+        results.append((label, sql, plan))
+
+    return results
@@ -0,0 +1,133 @@
+"""Initial schema
+
+Creates the tables as they stood before the first migration. Databases
+that were bootstrapped with db.create_all() already have them; existing
+tables are left alone so those databases can run `flask db upgrade` from
+the start.
+
+Revision ID: 1f0a7d3c9e52
+Revises:
+Create Date: 2026-10-18 21:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1f0a7d3c9e52'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _common_columns():
+    """TimestampMixin and SoftDeleteMixin columns"""
+    return [
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('is_deleted', sa.Boolean(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    ]
+
+
+# Parents before children
+TABLES = [
+    ('roles', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(length=50), nullable=False, unique=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('is_super_user', sa.Boolean(), nullable=False),
+    ]),
+    ('permissions', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(length=50), nullable=False, unique=True),
+        sa.Column('description', sa.Text(), nullable=True),
+    ]),
+    ('environments', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(length=50), nullable=False, unique=True),
+        sa.Column('description', sa.Text(), nullable=True),
+    ]),
+    ('question_types', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('type', sa.String(length=255), nullable=False),
+    ]),
+    ('answers', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('value', sa.Text(), nullable=True),
+        sa.Column('remarks', sa.Text(), nullable=True),
+    ]),
+    ('role_permissions', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('role_id', sa.Integer(), sa.ForeignKey('roles.id'), nullable=False),
+        sa.Column('permission_id', sa.Integer(), sa.ForeignKey('permissions.id'), nullable=False),
+        sa.UniqueConstraint('role_id', 'permission_id', name='uq_role_permission'),
+    ]),
+    ('users', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('first_name', sa.String(length=255), nullable=False),
+        sa.Column('last_name', sa.String(length=255), nullable=False),
+        sa.Column('email', sa.String(length=255), nullable=False),
+        sa.Column('contact_number', sa.String(length=100), nullable=True),
+        sa.Column('username', sa.String(length=50), nullable=False, unique=True),
+        sa.Column('password_hash', sa.String(length=255), nullable=False),
+        sa.Column('role_id', sa.Integer(), sa.ForeignKey('roles.id'), nullable=True),
+        sa.Column('environment_id', sa.Integer(), sa.ForeignKey('environments.id'), nullable=True),
+    ]),
+    ('questions', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('text', sa.String(length=255), nullable=False),
+        sa.Column('question_type_id', sa.Integer(), sa.ForeignKey('question_types.id'), nullable=False),
+        sa.Column('remarks', sa.Text(), nullable=True),
+    ]),
+    ('forms', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('is_public', sa.Boolean(), nullable=False),
+    ]),
+    ('form_questions', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('form_id', sa.Integer(), sa.ForeignKey('forms.id'), nullable=False),
+        sa.Column('question_id', sa.Integer(), sa.ForeignKey('questions.id'), nullable=False),
+        sa.Column('order_number', sa.Integer(), nullable=True),
+    ]),
+    ('form_answers', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('form_question_id', sa.Integer(), sa.ForeignKey('form_questions.id'), nullable=False),
+        sa.Column('answer_id', sa.Integer(), sa.ForeignKey('answers.id'), nullable=False),
+    ]),
+    ('form_submissions', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('form_id', sa.Integer(), sa.ForeignKey('forms.id'), nullable=False),
+        sa.Column('submitted_by', sa.String(length=50), nullable=False),
+        sa.Column('submitted_at', sa.DateTime(), nullable=True),
+    ]),
+    ('answers_submitted', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('form_answer_id', sa.Integer(), sa.ForeignKey('form_answers.id'), nullable=False),
+        sa.Column('form_submission_id', sa.Integer(), sa.ForeignKey('form_submissions.id'), nullable=False),
+        sa.Column('text_answered', sa.Text(), nullable=True),
+    ]),
+    ('attachments', lambda: [
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('form_submission_id', sa.Integer(), sa.ForeignKey('form_submissions.id'), nullable=False),
+        sa.Column('file_type', sa.String(length=50), nullable=False),
+        sa.Column('file_path', sa.String(length=255), nullable=False),
+        sa.Column('is_signature', sa.Boolean(), nullable=False),
+    ]),
+]
+
+
+def upgrade():
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    for table, columns in TABLES:
+        if table not in existing:
+            op.create_table(table, *columns(), *_common_columns())
+
+
+def downgrade():
+    for table, _ in reversed(TABLES):
+        op.drop_table(table)
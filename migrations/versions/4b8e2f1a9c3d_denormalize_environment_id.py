@@ -0,0 +1,82 @@
+"""Denormalize environment_id onto forms and form_submissions
+
+Environment scoping is the most common filter on both tables. Storing the
+environment directly turns environment-restricted listings into single-table
+index range scans instead of joins through users.
+
+Revision ID: 4b8e2f1a9c3d
+Revises: 1f0a7d3c9e52
+Create Date: 2026-10-18 21:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b8e2f1a9c3d'
+down_revision = '1f0a7d3c9e52'
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table, column):
+    inspector = sa.inspect(op.get_bind())
+    return column in [c['name'] for c in inspector.get_columns(table)]
+
+
+def _has_index(table, index):
+    inspector = sa.inspect(op.get_bind())
+    return index in [i['name'] for i in inspector.get_indexes(table)]
+
+
+def upgrade():
+    # Databases bootstrapped with db.create_all() may already have the columns
+    if not _has_column('forms', 'environment_id'):
+        with op.batch_alter_table('forms') as batch_op:
+            batch_op.add_column(sa.Column('environment_id', sa.Integer(), nullable=True))
+            batch_op.create_foreign_key(
+                'fk_forms_environment_id', 'environments', ['environment_id'], ['id']
+            )
+    if not _has_column('form_submissions', 'environment_id'):
+        with op.batch_alter_table('form_submissions') as batch_op:
+            batch_op.add_column(sa.Column('environment_id', sa.Integer(), nullable=True))
+            batch_op.create_foreign_key(
+                'fk_form_submissions_environment_id', 'environments', ['environment_id'], ['id']
+            )
+
+    # Backfill: forms inherit the creator's environment, submissions the form's
+    op.execute("""
+        UPDATE forms
+        SET environment_id = (
+            SELECT users.environment_id FROM users WHERE users.id = forms.user_id
+        )
+        WHERE environment_id IS NULL
+    """)
+    op.execute("""
+        UPDATE form_submissions
+        SET environment_id = (
+            SELECT forms.environment_id FROM forms WHERE forms.id = form_submissions.form_id
+        )
+        WHERE environment_id IS NULL
+    """)
+
+    if not _has_index('forms', 'ix_forms_environment_deleted_created'):
+        op.create_index(
+            'ix_forms_environment_deleted_created', 'forms',
+            ['environment_id', 'is_deleted', 'created_at']
+        )
+    if not _has_index('form_submissions', 'ix_form_submissions_environment_deleted_submitted'):
+        op.create_index(
+            'ix_form_submissions_environment_deleted_submitted', 'form_submissions',
+            ['environment_id', 'is_deleted', 'submitted_at']
+        )
+
+
+def downgrade():
+    op.drop_index('ix_form_submissions_environment_deleted_submitted', table_name='form_submissions')
+    op.drop_index('ix_forms_environment_deleted_created', table_name='forms')
+    with op.batch_alter_table('form_submissions') as batch_op:
+        batch_op.drop_column('environment_id')
+    with op.batch_alter_table('forms') as batch_op:
+        batch_op.drop_column('environment_id')
@@ -0,0 +1,72 @@
+"""Add submitted_by_id foreign key to form_submissions
+
+submitted_by holds a username string, so per-user lookups compared
+unindexed strings. The new integer FK is indexed together with the
+soft-delete flag and submission time; the username column stays for API
+compatibility.
+
+Revision ID: 7c1d9e3b5a20
+Revises: 4b8e2f1a9c3d
+Create Date: 2026-10-18 22:10:00.000000
+
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+logger = logging.getLogger('alembic.env')
+
+
+# revision identifiers, used by Alembic.
+revision = '7c1d9e3b5a20'
+down_revision = '4b8e2f1a9c3d'
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table, column):
+    inspector = sa.inspect(op.get_bind())
+    return column in [c['name'] for c in inspector.get_columns(table)]
+
+
+def _has_index(table, index):
+    inspector = sa.inspect(op.get_bind())
+    return index in [i['name'] for i in inspector.get_indexes(table)]
+
+
+def upgrade():
+    if not _has_column('form_submissions', 'submitted_by_id'):
+        with op.batch_alter_table('form_submissions') as batch_op:
+            batch_op.add_column(sa.Column('submitted_by_id', sa.Integer(), nullable=True))
+            batch_op.create_foreign_key(
+                'fk_form_submissions_submitted_by_id', 'users', ['submitted_by_id'], ['id']
+            )
+
+    # Usernames are unique, so each submission resolves to at most one user
+    op.execute("""
+        UPDATE form_submissions
+        SET submitted_by_id = (
+            SELECT users.id FROM users WHERE users.username = form_submissions.submitted_by
+        )
+        WHERE submitted_by_id IS NULL
+    """)
+    unmatched = op.get_bind().execute(sa.text(
+        "SELECT COUNT(*) FROM form_submissions WHERE submitted_by_id IS NULL"
+    )).scalar()
+    if unmatched:
+        # FormSubmission.submitted_by_user falls back to the username for these
+        logger.warning("%d form submissions have a username that matches no user; "
+                       "submitted_by_id stays NULL for them", unmatched)
+
+    if not _has_index('form_submissions', 'ix_form_submissions_submitter_deleted_submitted'):
+        op.create_index(
+            'ix_form_submissions_submitter_deleted_submitted', 'form_submissions',
+            ['submitted_by_id', 'is_deleted', 'submitted_at']
+        )
+
+
+def downgrade():
+    op.drop_index('ix_form_submissions_submitter_deleted_submitted', table_name='form_submissions')
+    with op.batch_alter_table('form_submissions') as batch_op:
+        batch_op.drop_column('submitted_by_id')
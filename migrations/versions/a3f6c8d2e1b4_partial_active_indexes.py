@@ -0,0 +1,52 @@
+"""Partial indexes on foreign keys for non-deleted rows
+
+Service queries filter a foreign key together with is_deleted = false.
+Indexing only live rows keeps the indexes small and lets the planner
+answer those filters without visiting deleted tuples. On backends without
+partial index support the predicate is ignored and a plain index is built.
+
+Revision ID: a3f6c8d2e1b4
+Revises: 7c1d9e3b5a20
+Create Date: 2026-10-18 22:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f6c8d2e1b4'
+down_revision = '7c1d9e3b5a20'
+branch_labels = None
+depends_on = None
+
+
+ACTIVE_INDEXES = [
+    ('ix_form_submissions_form_active', 'form_submissions', ['form_id', 'submitted_at']),
+    ('ix_answers_submitted_submission_active', 'answers_submitted', ['form_submission_id']),
+    ('ix_answers_submitted_form_answer_active', 'answers_submitted', ['form_answer_id']),
+    ('ix_form_answers_form_question_active', 'form_answers', ['form_question_id']),
+    ('ix_form_questions_form_active', 'form_questions', ['form_id', 'order_number']),
+    ('ix_attachments_submission_active', 'attachments', ['form_submission_id']),
+    ('ix_forms_user_active', 'forms', ['user_id', 'created_at']),
+]
+
+
+def _has_index(table, index):
+    inspector = sa.inspect(op.get_bind())
+    return index in [i['name'] for i in inspector.get_indexes(table)]
+
+
+def upgrade():
+    for name, table, columns in ACTIVE_INDEXES:
+        if not _has_index(table, name):
+            op.create_index(
+                name, table, columns,
+                postgresql_where=sa.text('is_deleted = false'),
+                sqlite_where=sa.text('is_deleted = 0')
+            )
+
+
+def downgrade():
+    for name, table, _ in reversed(ACTIVE_INDEXES):
+        op.drop_index(name, table_name=table)
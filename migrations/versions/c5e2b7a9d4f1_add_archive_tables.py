@@ -0,0 +1,55 @@
+"""Add archive tables for soft-deleted rows
+
+Each soft-delete table gets a <table>_archive mirror without foreign keys
+or defaults, plus archived_at. `flask database archive` moves rows that
+were soft-deleted long ago into them.
+
+Revision ID: c5e2b7a9d4f1
+Revises: a3f6c8d2e1b4
+Create Date: 2026-10-18 23:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5e2b7a9d4f1'
+down_revision = 'a3f6c8d2e1b4'
+branch_labels = None
+depends_on = None
+
+
+SOFT_DELETE_TABLES = [
+    'users', 'roles', 'permissions', 'role_permissions', 'environments',
+    'question_types', 'questions', 'answers', 'forms', 'form_questions',
+    'form_answers', 'form_submissions', 'answers_submitted', 'attachments',
+]
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    existing = set(inspector.get_table_names())
+
+    for table in SOFT_DELETE_TABLES:
+        archive = f'{table}_archive'
+        if archive in existing or table not in existing:
+            continue
+        columns = [
+            sa.Column(column['name'], column['type'], primary_key=column['name'] == 'id',
+                      autoincrement=False)
+            for column in inspector.get_columns(table)
+        ]
+        op.create_table(archive, *columns, sa.Column('archived_at', sa.DateTime(), nullable=False))
+        op.create_index(f'ix_{table}_archive_archived_at', archive, ['archived_at'])
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+    existing = set(inspector.get_table_names())
+
+    for table in reversed(SOFT_DELETE_TABLES):
+        archive = f'{table}_archive'
+        if archive in existing:
+            op.drop_index(f'ix_{table}_archive_archived_at', table_name=archive)
+            op.drop_table(archive)
@@ -1,6 +1,6 @@
 from flask_testing import TestCase
 from app import create_app, db
-from conftest import TestConfig
+from test.conftest import TestConfig
 
 class BaseTest(TestCase):
     """Base test class with common functionality."""
@@ -0,0 +1,37 @@
+"""Helpers for asserting how many SQL statements a request may run."""
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.utils.query_stats import QueryStats
+
+
+@contextmanager
+def count_queries(engine):
+    """Collect every statement the engine executes inside the block"""
+    stats = QueryStats()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        stats.record(statement, 0.0)
+
+    event.listen(engine, 'after_cursor_execute', _record)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, 'after_cursor_execute', _record)
+
+
+def assert_query_budget(client, engine, method: str, path: str, budget: int, **kwargs):
+    """
+    Make a test-client request and fail if it runs more than ``budget``
+    statements. The failure lists the most repeated statement shapes,
+    which is where an N+1 shows up.
+    """
+    with count_queries(engine) as stats:
+        response = client.open(path, method=method, **kwargs)
+    if stats.count > budget:
+        repeated = '\n'.join(f"  {count}x {shape[:200]}" for shape, count in stats.shapes.most_common(5))
+        raise AssertionError(
+            f"{method} {path} ran {stats.count} queries (budget {budget}); most repeated:\n{repeated}"
+        )
+    return response, stats
@@ -49,22 +49,22 @@ def test_update_question_type(app_context, session, sample_question_type):
     
     updated_type, error = QuestionTypeController.update_question_type(
         type_id,
-        'Updated Type'
+        'Updated_Type'
     )
     
     assert error is None
     assert updated_type is not None
-    assert updated_type.type == 'Updated Type'
+    assert updated_type.type == 'Updated_Type'
 
 def test_delete_question_type(app_context, session, sample_question_type):
     """Test deleting a question type."""
     session.refresh(sample_question_type)
     type_id = sample_question_type.id
     
-    success, error = QuestionTypeController.delete_question_type(type_id)
+    success, stats = QuestionTypeController.delete_question_type(type_id)
     
-    assert error is None
     assert success is True
+    assert stats == {'questions': 0, 'form_questions': 0, 'form_answers': 0, 'answers_submitted': 0}
     
     # Verify deletion
     deleted_type = QuestionTypeController.get_question_type(type_id)
@@ -0,0 +1,22 @@
+import pytest
+
+
+@pytest.mark.parametrize('query', [
+    'start_date=yesterday&end_date=2024-02-01',
+    'start_date=2024-01-01&end_date=2024-13-01',
+])
+def test_invalid_date_range_is_rejected(client, session, auth_headers, query):
+    response = client.get(f'/api/answers-submitted?{query}', headers=auth_headers)
+
+    assert response.status_code == 400
+    assert 'ISO format' in response.get_json()['error']
+
+
+def test_date_range_filter(client, session, auth_headers):
+    response = client.get('/api/answers-submitted?start_date=2024-01-01&end_date=2024-02-01T12:00',
+                          headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['filters_applied']['date_range'] == {'start': '2024-01-01', 'end': '2024-02-01T12:00'}
+    assert data['total_count'] == 0
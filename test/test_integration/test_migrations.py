@@ -0,0 +1,58 @@
+"""
+Migrations run in a subprocess: migrations/env.py calls logging.fileConfig,
+which would reconfigure logging for the rest of the test session.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine
+
+from app import db
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+def _flask(database_url, *args, input=None):
+    env = dict(os.environ, DATABASE_URL=database_url, FLASK_APP='wsgi.py',
+               METRICS_ENABLED='false', TRACING_ENABLED='false')
+    # A new session has no controlling terminal, so getpass reads the piped input
+    result = subprocess.run([sys.executable, '-m', 'flask', *args], cwd=ROOT, env=env, input=input,
+                            capture_output=True, text=True, timeout=300, start_new_session=True)
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+@pytest.mark.parametrize('bootstrap', [False, True], ids=['empty', 'create_all'])
+def test_upgrade_builds_the_model_schema(tmp_path, bootstrap):
+    database_url = f'sqlite:///{tmp_path / "migrations.db"}'
+    engine = create_engine(database_url)
+    if bootstrap:
+        # Databases created before migrations existed
+        db.metadata.create_all(engine)
+
+    _flask(database_url, 'db', 'upgrade')
+
+    with engine.connect() as connection:
+        context = MigrationContext.configure(connection)
+        assert context.get_current_revision() is not None
+        assert compare_metadata(context, db.metadata) == []
+    engine.dispose()
+
+
+def test_database_init_applies_migrations(tmp_path):
+    database_url = f'sqlite:///{tmp_path / "init.db"}'
+    answers = 'admin1\nadmin@example.com\nAd\nMin\nSecretpw1!\nSecretpw1!\n'
+
+    _flask(database_url, 'database', 'init', input=answers)
+
+    engine = create_engine(database_url)
+    with engine.connect() as connection:
+        context = MigrationContext.configure(connection)
+        assert context.get_current_revision() is not None
+        assert compare_metadata(context, db.metadata) == []
+        assert connection.exec_driver_sql("SELECT username FROM users").scalars().all() == ['admin1']
+    engine.dispose()
@@ -0,0 +1,143 @@
+"""
+The generated DDL is checked on every backend. The end-to-end test needs
+PostgreSQL (TEST_DATABASE_URL=ephemeral-postgres or a postgresql:// URL)
+and is skipped otherwise; its DDL is rolled back with the test transaction.
+"""
+from datetime import date
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.models import Attachment, Environment, Form, FormSubmission, Role, User
+from management import partitioning
+
+
+def _normalized(statement):
+    return ' '.join(statement.split())
+
+
+def test_conversion_sql_renames_the_table_and_builds_a_partitioned_parent():
+    statements = partitioning.conversion_sql(
+        'form_submissions', 'submitted_at',
+        inbound_fks=[('attachments', 'attachments_form_submission_id_fkey')],
+        index_names=['ix_form_submissions_form_active'], pk_name='form_submissions_pkey'
+    )
+
+    assert statements == [
+        'ALTER TABLE attachments DROP CONSTRAINT "attachments_form_submission_id_fkey"',
+        'ALTER TABLE form_submissions RENAME TO form_submissions_legacy',
+        'ALTER INDEX "ix_form_submissions_form_active" RENAME TO "ix_form_submissions_form_active_legacy"',
+        'ALTER TABLE form_submissions_legacy RENAME CONSTRAINT "form_submissions_pkey" TO "form_submissions_pkey_legacy"',
+        'UPDATE form_submissions_legacy SET submitted_at = created_at WHERE submitted_at IS NULL',
+        'CREATE TABLE form_submissions (LIKE form_submissions_legacy INCLUDING DEFAULTS) '
+        'PARTITION BY RANGE (submitted_at)',
+        'ALTER TABLE form_submissions ADD PRIMARY KEY (id, submitted_at)',
+        'ALTER SEQUENCE form_submissions_id_seq OWNED BY form_submissions.id',
+    ]
+
+
+@pytest.mark.parametrize('month, bounds', [
+    (date(2026, 3, 1), "FROM ('2026-03-01') TO ('2026-04-01')"),
+    (date(2026, 12, 1), "FROM ('2026-12-01') TO ('2027-01-01')"),
+])
+def test_partition_sql_covers_one_month(month, bounds):
+    name = partitioning.partition_name('answers_submitted', month)
+
+    assert partitioning.partition_sql('answers_submitted', month) == (
+        f"CREATE TABLE {name} PARTITION OF answers_submitted FOR VALUES {bounds}"
+    )
+
+
+def test_detach_sql_drops_only_on_request():
+    assert partitioning.detach_sql('form_submissions', 'form_submissions_y2026m01') == [
+        'ALTER TABLE form_submissions DETACH PARTITION form_submissions_y2026m01'
+    ]
+    assert partitioning.detach_sql('form_submissions', 'form_submissions_y2026m01', drop=True)[-1] == (
+        'DROP TABLE form_submissions_y2026m01'
+    )
+
+
+@pytest.mark.parametrize('ondelete, action', [
+    (None, "RAISE EXCEPTION 'delete on table \"form_submissions\" violates reference"),
+    ('CASCADE', 'DELETE FROM attachments WHERE form_submission_id = OLD.id;'),
+    ('set null', 'UPDATE attachments SET form_submission_id = NULL WHERE form_submission_id = OLD.id;'),
+])
+def test_reference_trigger_sql(ondelete, action):
+    statements = [_normalized(s) for s in partitioning.reference_trigger_sql(
+        'attachments', 'form_submission_id', 'form_submissions', ondelete
+    )]
+    check_fn, ref_fn = statements[0], statements[3]
+
+    assert 'FROM form_submissions WHERE id = NEW.form_submission_id FOR KEY SHARE' in check_fn
+    assert "ERRCODE = 'foreign_key_violation'" in check_fn
+    assert statements[2] == (
+        'CREATE TRIGGER attachments_form_submission_id_fk BEFORE INSERT OR UPDATE OF form_submission_id '
+        'ON attachments FOR EACH ROW EXECUTE FUNCTION attachments_form_submission_id_fk_check()'
+    )
+    assert action in ref_fn
+    assert statements[5] == (
+        'CREATE TRIGGER form_submissions_attachments_form_submission_id_ref AFTER DELETE ON form_submissions '
+        'FOR EACH ROW EXECUTE FUNCTION form_submissions_attachments_form_submission_id_ref_check()'
+    )
+
+
+def test_inbound_references_come_from_the_models(app_context):
+    assert set(partitioning._inbound_references('form_submissions')) == {
+        ('answers_submitted', 'form_submission_id'), ('attachments', 'form_submission_id')
+    }
+
+
+@pytest.fixture
+def pg_session(request, app):
+    with app.app_context():
+        if db.engine.dialect.name != 'postgresql':
+            pytest.skip('needs PostgreSQL (TEST_DATABASE_URL)')
+    return request.getfixturevalue('session')
+
+
+def test_convert_table_on_postgresql(pg_session):
+    environment = Environment(name='Plant A')
+    role = Role(name='Technician', description='Technician', is_super_user=False)
+    pg_session.add_all([environment, role])
+    pg_session.flush()
+    user = User(first_name='Tech', last_name='Test', email='tech@test.local', username='tech',
+                password_hash='x', role_id=role.id, environment_id=environment.id)
+    pg_session.add(user)
+    pg_session.flush()
+    form = Form(title='Daily check', user_id=user.id, environment_id=environment.id)
+    pg_session.add(form)
+    pg_session.flush()
+    submission = FormSubmission(form_id=form.id, submitted_by='tech', submitted_by_id=user.id)
+    pg_session.add(submission)
+    pg_session.flush()
+    pg_session.add(Attachment(form_submission_id=submission.id, file_type='pdf', file_path='report.pdf'))
+    pg_session.commit()
+    submission_id = submission.id
+
+    summary, error = partitioning.convert_table('form_submissions', months_ahead=1)
+
+    assert error is None
+    assert partitioning.is_partitioned('form_submissions')
+    assert summary['rows_copied'] == 1
+    assert {name.split('.')[0] for name in summary['replaced_foreign_keys']} == {'answers_submitted', 'attachments'}
+
+    # The reference triggers stand in for the dropped foreign keys
+    with pytest.raises(IntegrityError), pg_session.begin_nested():
+        pg_session.add(Attachment(form_submission_id=999999, file_type='pdf', file_path='orphan.pdf'))
+        pg_session.flush()
+    with pytest.raises(IntegrityError), pg_session.begin_nested():
+        pg_session.execute(db.text('DELETE FROM form_submissions WHERE id = :id'), {'id': submission_id})
+
+    detached, error = partitioning.detach_partition('form_submissions', date.today())
+    assert detached is False
+    assert 'still referenced by attachments.form_submission_id' in error
+
+    # convert_table created this month and the next; the rest are new
+    created, error = partitioning.create_partitions('form_submissions', months_ahead=3)
+    this_month = partitioning._month_start(date.today())
+    assert error is None
+    assert created == [
+        partitioning.partition_name('form_submissions', partitioning._add_months(this_month, months))
+        for months in (2, 3)
+    ]
@@ -0,0 +1,193 @@
+"""
+Query budgets for the main API endpoints.
+
+Every endpoint below runs against the same fixture (FORM_COUNT forms with
+QUESTIONS_PER_FORM questions and SUBMISSIONS_PER_FORM submissions each)
+and must stay within its statement budget. The same requests also run
+against a fixture with SMALL_FORM_COUNT forms and must issue exactly as
+many statements there: a lazy load added inside a to_dict loop makes the
+count grow with the data and fails here instead of in production.
+"""
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app import create_app, db
+from app.models import (
+    Answer, AnswerSubmitted, Attachment, Environment, Form, FormAnswer, FormQuestion,
+    FormSubmission, Question, QuestionType, Role, User
+)
+from test.query_budget import assert_query_budget, count_queries
+
+FORM_COUNT = 50
+SMALL_FORM_COUNT = 10
+QUESTIONS_PER_FORM = 5
+SUBMISSIONS_PER_FORM = 2
+QUESTION_TYPES = ('text', 'multiple_choices', 'checkbox', 'date')
+
+
+class BudgetConfig:
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    JWT_SECRET_KEY = 'query-budget-test-secret-0123456789'
+    SECRET_KEY = 'query-budget-test'
+    METRICS_ENABLED = False
+    PROFILING_ENABLED = False
+    SLOW_QUERY_MS = 0
+
+
+def _seed(form_count):
+    environments = [Environment(name='Plant A'), Environment(name='Plant B')]
+    roles = {name: Role(name=name, description=name, is_super_user=name == 'Admin')
+             for name in ('Admin', 'Site Manager', 'Supervisor', 'Technician')}
+    db.session.add_all(environments + list(roles.values()))
+    db.session.flush()
+
+    users = {}
+    for env in environments:
+        for role in roles:
+            username = f"{role.lower().replace(' ', '_')}_{env.id}"
+            users[username] = User(first_name=role, last_name=env.name, email=f'{username}@test.local',
+                                   username=username, password_hash='x', role_id=roles[role].id,
+                                   environment_id=env.id)
+    db.session.add_all(users.values())
+    types = [QuestionType(type=name) for name in QUESTION_TYPES]
+    options = [Answer(value=value) for value in ('Pass', 'Fail', 'N/A')]
+    blank = Answer(value=None)
+    db.session.add_all(types + options + [blank])
+    db.session.flush()
+
+    for n in range(form_count):
+        env = environments[n % 2]
+        form = Form(title=f'Form {n}', description='Budget fixture', user_id=users[f'supervisor_{env.id}'].id,
+                    environment_id=env.id, is_public=n % 3 == 0)
+        db.session.add(form)
+        db.session.flush()
+
+        form_answers = []
+        for q in range(QUESTIONS_PER_FORM):
+            question_type = types[q % len(types)]
+            question = Question(text=f'Form {n} question {q}', question_type_id=question_type.id)
+            db.session.add(question)
+            db.session.flush()
+            form_question = FormQuestion(form_id=form.id, question_id=question.id, order_number=q + 1)
+            db.session.add(form_question)
+            db.session.flush()
+            choices = options if question_type.type in ('multiple_choices', 'checkbox') else [blank]
+            answers = [FormAnswer(form_question_id=form_question.id, answer_id=answer.id) for answer in choices]
+            db.session.add_all(answers)
+            form_answers.append((question_type.type, answers[0]))
+        db.session.flush()
+
+        for s in range(SUBMISSIONS_PER_FORM):
+            technician = users[f'technician_{env.id}']
+            submission = FormSubmission(form_id=form.id, environment_id=env.id,
+                                        submitted_by=technician.username, submitted_by_id=technician.id)
+            db.session.add(submission)
+            db.session.flush()
+            db.session.add_all([
+                AnswerSubmitted(form_answer_id=form_answer.id, form_submission_id=submission.id,
+                                text_answered='01/01/2024' if type_name == 'date' else (
+                                    'Reading ok' if type_name == 'text' else None))
+                for type_name, form_answer in form_answers
+            ])
+            db.session.add(Attachment(form_submission_id=submission.id, file_type='image/png',
+                                      file_path=f'{technician.username}/sig_{submission.id}.png',
+                                      is_signature=True))
+    db.session.commit()
+
+
+def _budget_app(form_count):
+    app = create_app(BudgetConfig)
+    with app.app_context():
+        db.create_all()
+        _seed(form_count)
+    # No context stays pushed: each request gets its own session and identity map,
+    # so counts do not depend on which requests ran before
+    return app
+
+
+@pytest.fixture(scope='module')
+def budget_app():
+    app = _budget_app(FORM_COUNT)
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture(scope='module')
+def small_budget_app():
+    app = _budget_app(SMALL_FORM_COUNT)
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture(scope='module')
+def tokens(budget_app):
+    with budget_app.app_context():
+        return {user.username: create_access_token(identity=user.username) for user in User.query.all()}
+
+
+# (user, method, path, max statements). Authentication costs 2-3 of each.
+BUDGETS = [
+    ('admin_1', 'GET', '/api/forms', 6),
+    ('supervisor_1', 'GET', '/api/forms', 6),
+    ('technician_1', 'GET', '/api/forms/public', 3),
+    ('admin_1', 'GET', '/api/forms/1', 6),
+    ('admin_1', 'GET', '/api/forms/environment/1', 6),
+    ('admin_1', 'GET', '/api/form-submissions', 4),
+    ('supervisor_1', 'GET', '/api/form-submissions', 4),
+    ('admin_1', 'GET', '/api/form-submissions/1', 4),
+    ('admin_1', 'GET', '/api/users', 5),
+    ('admin_1', 'GET', '/api/users/1', 1),
+    ('admin_1', 'GET', '/api/users/current', 5),
+    ('admin_1', 'GET', '/api/environments', 4),
+    ('admin_1', 'GET', '/api/environments/1', 4),
+    ('admin_1', 'GET', '/api/roles', 4),
+    ('admin_1', 'GET', '/api/question-types', 4),
+    ('admin_1', 'GET', '/api/questions', 4),
+    ('admin_1', 'GET', '/api/answers', 4),
+    ('admin_1', 'GET', '/api/answers-submitted', 4),
+    ('admin_1', 'GET', '/api/answers-submitted/submission/1', 5),
+    ('admin_1', 'GET', '/api/attachments', 4),
+    ('admin_1', 'GET', '/api/attachments/submission/1', 5),
+    ('admin_1', 'GET', '/api/form-questions', 5),
+    ('admin_1', 'GET', '/api/form-questions/form/1', 5),
+    ('admin_1', 'GET', '/api/form-answers', 4),
+]
+IDS = [f'{method} {path} as {user}' for user, method, path, _ in BUDGETS]
+
+
+@pytest.mark.parametrize('username,method,path,budget', BUDGETS, ids=IDS)
+def test_endpoint_query_budget(budget_app, tokens, username, method, path, budget):
+    with budget_app.app_context():
+        engine = db.engine
+    response, _ = assert_query_budget(
+        budget_app.test_client(), engine, method, path, budget,
+        headers={'Authorization': f'Bearer {tokens[username]}'}
+    )
+    assert response.status_code == 200, response.get_data(as_text=True)[:200]
+
+
+def _count(app, tokens, username, method, path):
+    with app.app_context():
+        engine = db.engine
+    with count_queries(engine) as stats:
+        response = app.test_client().open(
+            path, method=method, headers={'Authorization': f'Bearer {tokens[username]}'}
+        )
+    assert response.status_code == 200, response.get_data(as_text=True)[:200]
+    return stats
+
+
+@pytest.mark.parametrize('username,method,path,budget', BUDGETS, ids=IDS)
+def test_query_count_does_not_grow_with_data(budget_app, small_budget_app, tokens, username, method, path, budget):
+    large = _count(budget_app, tokens, username, method, path)
+    small = _count(small_budget_app, tokens, username, method, path)
+
+    repeated = '\n'.join(f"  {count}x {shape[:200]}" for shape, count in large.shapes.most_common(3))
+    assert large.count == small.count, (
+        f"{method} {path} ran {small.count} queries for {SMALL_FORM_COUNT} forms and {large.count} "
+        f"for {FORM_COUNT}; most repeated:\n{repeated}"
+    )
@@ -0,0 +1,34 @@
+from sqlalchemy import event
+
+from app.services.form_submission_service import FormSubmissionService
+from management.query_plans import compile_statement, explain_service_queries
+
+
+def test_every_service_query_gets_a_plan(session):
+    results = explain_service_queries()
+
+    assert len(results) == 8
+    for label, sql, plan in results:
+        assert plan, label
+        assert not any(line.startswith('error:') for line in plan), (label, plan)
+
+
+def test_compiled_sql_matches_what_the_service_runs(session):
+    query = FormSubmissionService.submissions_query({'form_id': 1, 'submitted_by': 'tech'})
+    executed = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    connection = session.connection()
+    event.listen(connection, 'before_cursor_execute', capture)
+    try:
+        query.all()
+    finally:
+        event.remove(connection, 'before_cursor_execute', capture)
+
+    # Same FROM/WHERE/ORDER BY, with the parameters rendered inline; only
+    # the column labels of the select list differ
+    compiled = compile_statement(query, connection.dialect)
+    body = compiled[compiled.index('\nFROM '):]
+    assert body.replace("'tech'", '?').replace('= 1', '= ?') == executed[-1][executed[-1].index('\nFROM '):]
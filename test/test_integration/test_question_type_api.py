@@ -6,13 +6,13 @@ def test_create_question_type_api(app_context, client, session, auth_headers):
     """Test question type creation via API."""
     response = client.post(
         '/api/question_types',
-        json={'type': 'Multiple Choice'},
+        json={'type': 'Multiple_Choice'},
         headers=auth_headers
     )
     
     assert response.status_code == 201
     data = json.loads(response.data)
-    assert data['question_type']['type'] == 'Multiple Choice'
+    assert data['question_type']['type'] == 'Multiple_Choice'
     assert 'id' in data['question_type']
 
 def test_get_all_question_types_api(app_context, client, session, sample_question_type, auth_headers):
@@ -26,7 +26,8 @@ def test_get_all_question_types_api(app_context, client, session, sample_questio
 
 @pytest.mark.parametrize("invalid_data,expected_error", [
     ({}, "Type is required"),
-    ({'type': ''}, "Type name cannot be empty"),
+    ({'type': ''}, "Type must be a non-empty string without spaces"),
+    ({'type': 'Multiple Choice'}, "Type must be a non-empty string without spaces"),
     ({'type': 'A' * 256}, "Type name cannot exceed 255 characters"),
     ({'type': '<script>alert("xss")</script>'}, "Type name contains invalid characters"),
 ])
@@ -58,13 +59,13 @@ def test_update_question_type_api(app_context, client, session, sample_question_
     """Test updating question type via API."""
     response = client.put(
         f'/api/question_types/{sample_question_type.id}',
-        json={'type': 'Updated Type'},
+        json={'type': 'Updated_Type'},
         headers=auth_headers
     )
     
     assert response.status_code == 200
     data = json.loads(response.data)
-    assert data['question_type']['type'] == 'Updated Type'
+    assert data['question_type']['type'] == 'Updated_Type'
 
 def test_delete_question_type_api(app_context, client, session, sample_question_type, auth_headers):
     """Test deleting question type via API."""
@@ -75,8 +76,10 @@ def test_delete_question_type_api(app_context, client, session, sample_question_
     
     assert response.status_code == 200
     
-    # Verify deletion
-    assert session.get(QuestionType, sample_question_type.id) is None
+    # Verify the soft delete
+    assert QuestionType.query.filter_by(id=sample_question_type.id).first() is None
+    session.refresh(sample_question_type)
+    assert sample_question_type.is_deleted is True
 
 def test_get_nonexistent_question_type_api(app_context, client, session, auth_headers):
     """Test getting non-existent question type via API."""
@@ -90,7 +93,7 @@ def test_update_nonexistent_question_type_api(app_context, client, session, auth
     """Test updating non-existent question type via API."""
     response = client.put(
         '/api/question_types/999',
-        json={'type': 'Updated Type'},
+        json={'type': 'Updated_Type'},
         headers=auth_headers
     )
     
@@ -0,0 +1,118 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+from werkzeug.security import generate_password_hash
+
+from app.models import (
+    Answer, AnswerSubmitted, Environment, Form, FormAnswer, FormQuestion, FormSubmission,
+    Question, QuestionType, Role, User
+)
+from app.services.auth_service import AuthService
+from app.services.question_type_service import QuestionTypeService
+
+
+@pytest.fixture
+def plant(session):
+    """Two environments, one of them deleted, with a live and a deleted user in the live one"""
+    live, closed = Environment(name='Plant A'), Environment(name='Plant B')
+    role = Role(name='Technician', description='Technician', is_super_user=False)
+    session.add_all([live, closed, role])
+    session.flush()
+    users = {
+        name: User(first_name=name, last_name='Test', email=f'{name}@test.local', username=name,
+                   password_hash=generate_password_hash('secret'), role_id=role.id, environment_id=live.id)
+        for name in ('active', 'removed')
+    }
+    session.add_all(users.values())
+    closed.soft_delete()
+    users['removed'].soft_delete()
+    session.commit()
+    return live, closed, users
+
+
+@pytest.fixture
+def form_tree(session, plant):
+    """A form with one live and one deleted question, each with one option and one submitted answer"""
+    live, _, users = plant
+    question_type = QuestionType(type='gauge')
+    option = Answer(value='OK')
+    session.add_all([question_type, option])
+    session.flush()
+    form = Form(title='Daily check', user_id=users['active'].id, environment_id=live.id)
+    questions = [Question(text=f'Question {n}', question_type_id=question_type.id) for n in range(2)]
+    session.add_all([form, *questions])
+    session.flush()
+    submission = FormSubmission(form_id=form.id, environment_id=live.id, submitted_by='active',
+                                submitted_by_id=users['active'].id)
+    form_questions = [FormQuestion(form_id=form.id, question_id=q.id, order_number=n)
+                      for n, q in enumerate(questions)]
+    session.add_all([submission, *form_questions])
+    session.flush()
+    form_answers = [FormAnswer(form_question_id=fq.id, answer_id=option.id) for fq in form_questions]
+    session.add_all(form_answers)
+    session.flush()
+    session.add_all([AnswerSubmitted(form_answer_id=fa.id, form_submission_id=submission.id) for fa in form_answers])
+    form_questions[1].soft_delete()
+    session.commit()
+    return form, question_type, questions, form_questions
+
+
+def test_queries_exclude_soft_deleted_rows(session, plant):
+    assert [env.name for env in Environment.query.all()] == ['Plant A']
+    assert [user.username for user in session.scalars(select(User))] == ['active']
+
+
+def test_include_deleted_opts_out(session, plant):
+    assert Environment.get_all_with_deleted().count() == 2
+    assert [env.name for env in Environment.get_deleted()] == ['Plant B']
+    names = session.scalars(select(User.username).execution_options(include_deleted=True)).all()
+    assert sorted(names) == ['active', 'removed']
+
+
+def test_relationship_loads_exclude_soft_deleted_rows(session, plant, form_tree):
+    live, _, _ = plant
+    form = form_tree[0]
+    session.expire_all()
+
+    assert [user.username for user in live.users] == ['active']
+    assert len(form.form_questions) == 1
+
+    session.expunge_all()
+    eager = Form.query.options(joinedload(Form.form_questions)).filter_by(id=form.id).one()
+    assert [fq.order_number for fq in eager.form_questions] == [0]
+
+
+def test_joins_exclude_soft_deleted_targets(session, plant):
+    _, closed, users = plant
+    users['active'].environment_id = closed.id
+    session.commit()
+
+    assert User.query.join(Environment, User.environment_id == Environment.id).count() == 0
+
+
+def test_expired_soft_deleted_instance_can_be_refreshed(session, plant):
+    _, closed, _ = plant
+    session.expire(closed)
+    assert closed.name == 'Plant B'
+
+
+def test_soft_deleted_user_cannot_log_in(session, plant):
+    assert AuthService.authenticate_user('active', 'secret') is not None
+    assert AuthService.authenticate_user('removed', 'secret') is None
+    assert AuthService.get_current_user('removed') is None
+
+
+def test_question_type_delete_cascades_through_deleted_questions(session, form_tree):
+    _, question_type, questions, form_questions = form_tree
+    for question in questions:
+        question.soft_delete()
+    session.commit()
+
+    success, stats = QuestionTypeService.delete_question_type(question_type.id)
+
+    assert success is True
+    # Only the form question still active under the deleted questions is cascaded
+    assert stats == {'questions': 0, 'form_questions': 1, 'form_answers': 1, 'answers_submitted': 1}
+    assert FormQuestion.query.filter(FormQuestion.id.in_([fq.id for fq in form_questions])).count() == 0
+    # The form question deleted earlier was not cascaded then, so its answer stays
+    assert AnswerSubmitted.query.count() == 1
@@ -0,0 +1,154 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app import db
+from app.models import (
+    ARCHIVE_TABLES, Answer, Environment, Form, FormAnswer, FormQuestion, Question, QuestionType,
+    Role, User
+)
+from app.services.archive_service import ArchiveService
+from app.services.base_service import BaseService
+
+LONG_AGO = datetime.utcnow() - timedelta(days=200)
+
+
+def _delete(*instances, when=LONG_AGO):
+    for instance in instances:
+        instance.soft_delete()
+        instance.deleted_at = when
+
+
+def _archived_ids(table_name):
+    archive = ARCHIVE_TABLES[table_name]
+    return set(db.session.scalars(select(archive.c.id)))
+
+
+def _hot_ids(model):
+    return set(db.session.scalars(select(model.id).execution_options(include_deleted=True)))
+
+
+@pytest.fixture
+def form_with_question(session):
+    """A form with one question, created by a technician"""
+    environment = Environment(name='Plant A')
+    role = Role(name='Technician', description='Technician', is_super_user=False)
+    question_type = QuestionType(type='gauge')
+    session.add_all([environment, role, question_type])
+    session.flush()
+    user = User(first_name='Tech', last_name='Test', email='tech@test.local', username='tech',
+                password_hash='x', role_id=role.id, environment_id=environment.id)
+    question = Question(text='Pressure', question_type_id=question_type.id)
+    session.add_all([user, question])
+    session.flush()
+    form = Form(title='Daily check', user_id=user.id, environment_id=environment.id)
+    session.add(form)
+    session.flush()
+    form_question = FormQuestion(form_id=form.id, question_id=question.id, order_number=1)
+    session.add(form_question)
+    session.commit()
+    return form, form_question
+
+
+def test_archive_table_moves_old_rows_in_batches(session):
+    answers = [Answer(value=f'Option {n}') for n in range(5)]
+    recent = Answer(value='Deleted yesterday')
+    live = Answer(value='Live')
+    session.add_all([*answers, recent, live])
+    session.flush()
+    _delete(*answers)
+    _delete(recent, when=datetime.utcnow() - timedelta(days=1))
+    session.commit()
+    old_ids = [answer.id for answer in answers]
+    kept_ids = {recent.id, live.id}
+    batches = []
+
+    moved, error = ArchiveService.archive_table(
+        'answers', older_than_days=90, batch_size=2,
+        progress=lambda table, count, last_id: batches.append((count, last_id))
+    )
+
+    assert error is None
+    assert moved == 5
+    assert [count for count, _ in batches] == [2, 4, 5]
+    assert batches[-1][1] == old_ids[-1]
+    assert _archived_ids('answers') == set(old_ids)
+    assert _hot_ids(Answer) == kept_ids
+
+
+def test_archive_table_dry_run_moves_nothing(session):
+    answer = Answer(value='Old')
+    session.add(answer)
+    session.flush()
+    _delete(answer)
+    session.commit()
+
+    moved, error = ArchiveService.archive_table('answers', dry_run=True)
+
+    assert (moved, error) == (1, None)
+    assert _archived_ids('answers') == set()
+    assert answer.id in _hot_ids(Answer)
+
+
+def test_archive_table_skips_rows_referenced_by_hot_rows(session, form_with_question):
+    _, form_question = form_with_question
+    referenced, unreferenced = Answer(value='Referenced'), Answer(value='Unreferenced')
+    session.add_all([referenced, unreferenced])
+    session.flush()
+    # The form answer is deleted too, but it is still in the hot table
+    form_answer = FormAnswer(form_question_id=form_question.id, answer_id=referenced.id)
+    session.add(form_answer)
+    session.flush()
+    _delete(referenced, unreferenced, form_answer)
+    session.commit()
+    referenced_id, unreferenced_id = referenced.id, unreferenced.id
+
+    moved, error = ArchiveService.archive_table('answers')
+
+    assert (moved, error) == (1, None)
+    assert _archived_ids('answers') == {unreferenced_id}
+    assert referenced_id in _hot_ids(Answer)
+
+
+def test_archive_all_moves_children_before_parents(session, form_with_question):
+    form, form_question = form_with_question
+    _delete(form, form_question)
+    session.commit()
+
+    results, error = ArchiveService.archive_all(older_than_days=90)
+
+    assert error is None
+    assert results['form_questions'] == 1
+    assert results['forms'] == 1
+    assert ArchiveService.archive_order().index('form_questions') < ArchiveService.archive_order().index('forms')
+
+
+def test_restore_brings_back_archived_parents(session, form_with_question):
+    form, form_question = form_with_question
+    form_id, form_question_id = form.id, form_question.id
+    _delete(form, form_question)
+    session.commit()
+    ArchiveService.archive_all(older_than_days=90)
+    session.expunge_all()
+
+    restored = BaseService(FormQuestion).restore(form_question_id)
+
+    assert restored is not None
+    assert restored.is_deleted is False
+    assert _archived_ids('form_questions') == set()
+    assert _archived_ids('forms') == set()
+    # The parent is only brought back to satisfy the foreign key; it stays deleted
+    parent = db.session.get(Form, form_id, execution_options={'include_deleted': True})
+    assert parent.is_deleted is True
+    assert parent.deleted_at is not None
+
+
+def test_restore_prefers_hot_table_and_reports_missing_rows(session, form_with_question):
+    form, _ = form_with_question
+    _delete(form, when=datetime.utcnow())
+    session.commit()
+
+    assert BaseService(Form).restore(form.id).is_deleted is False
+    assert BaseService(Form).restore(999999) is None
+    assert ArchiveService.restore(Form, 999999) == (None, 'Form 999999 not found in archive')
@@ -0,0 +1,44 @@
+import pytest
+
+from app.models import Environment, Form, FormSubmission, Role, User
+from app.services.form_service import FormService
+from app.services.form_submission_service import FormSubmissionService
+
+
+@pytest.fixture
+def form(session):
+    """A form owned by a technician named 'tech'"""
+    environment = Environment(name='Plant A')
+    role = Role(name='Technician', description='Technician', is_super_user=False)
+    session.add_all([environment, role])
+    session.flush()
+    user = User(first_name='Tech', last_name='Test', email='tech@test.local', username='tech',
+                password_hash='x', role_id=role.id, environment_id=environment.id)
+    session.add(user)
+    session.flush()
+    form = Form(title='Daily check', user_id=user.id, environment_id=environment.id)
+    session.add(form)
+    session.commit()
+    return form
+
+
+def test_create_submission_links_the_submitter(form):
+    submission, error = FormSubmissionService.create_submission(form.id, 'tech')
+
+    assert error is None
+    assert submission.submitted_by_id == form.user_id
+
+
+def test_unmatched_username_is_still_found(session, form):
+    # The username matched no user, e.g. rows backfilled by the submitted_by_id migration
+    submission, _ = FormSubmissionService.create_submission(form.id, 'former.employee')
+    FormSubmissionService.create_submission(form.id, 'tech')
+    assert submission.submitted_by_id is None
+
+    found = FormSubmissionService.get_all_submissions({'submitted_by': 'former.employee'})
+    assert [s.id for s in found] == [submission.id]
+    assert FormService.get_user_submission_statistics('former.employee')['total_submissions'] == 1
+    assert FormService.get_user_submission_statistics('tech')['total_submissions'] == 1
+    assert session.query(FormSubmission).filter(
+        FormSubmission.submitted_by_user('nobody')
+    ).count() == 0
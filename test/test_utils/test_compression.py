@@ -0,0 +1,76 @@
+import gzip
+import io
+
+import brotli
+import pytest
+from flask import Flask, Response, jsonify, send_file
+
+from app.utils.compression import init_compression
+
+PAYLOAD = [{'id': n, 'question': 'Is the guard in place?', 'answer': 'Yes'} for n in range(200)]
+
+
+@pytest.fixture
+def compression_client():
+    app = Flask(__name__)
+    init_compression(app)
+
+    @app.route('/forms')
+    def forms():
+        return jsonify(PAYLOAD)
+
+    @app.route('/small')
+    def small():
+        return jsonify({'status': 'ok'})
+
+    @app.route('/stream')
+    def stream():
+        return Response((f'{row}\n' for row in PAYLOAD), mimetype='text/plain')
+
+    @app.route('/download')
+    def download():
+        return send_file(io.BytesIO(b'{}' * 1000), mimetype='application/json', as_attachment=True,
+                         download_name='form.json')
+
+    return app.test_client()
+
+
+@pytest.mark.parametrize('accept,expected', [
+    ('gzip, deflate, br', 'br'),
+    ('gzip', 'gzip'),
+    ('br;q=0.5, gzip', 'gzip'),
+    ('*', 'br'),
+    ('identity', None),
+    ('', None),
+])
+def test_negotiates_encoding(compression_client, accept, expected):
+    response = compression_client.get('/forms', headers={'Accept-Encoding': accept})
+
+    assert response.headers.get('Content-Encoding') == expected
+    assert 'Accept-Encoding' in response.headers['Vary']
+    body = response.get_data()
+    if expected == 'br':
+        body = brotli.decompress(body)
+    elif expected == 'gzip':
+        body = gzip.decompress(body)
+    assert body == compression_client.get('/forms').get_data()
+
+
+def test_small_response_is_not_compressed(compression_client):
+    response = compression_client.get('/small', headers={'Accept-Encoding': 'br, gzip'})
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_streamed_response_is_compressed_per_chunk(compression_client):
+    response = compression_client.get('/stream', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Length' not in response.headers
+    assert gzip.decompress(response.get_data()).decode().count('\n') == len(PAYLOAD)
+
+
+def test_file_download_is_left_alone(compression_client):
+    response = compression_client.get('/download', headers={'Accept-Encoding': 'br, gzip'})
+
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_data() == b'{}' * 1000
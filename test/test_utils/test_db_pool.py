@@ -0,0 +1,56 @@
+import time
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.utils import db_pool
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f'sqlite:///{tmp_path / "pool.db"}', poolclass=db_pool.InstrumentedQueuePool,
+        pool_size=1, max_overflow=0, pool_timeout=0.2
+    )
+    db_pool.wait_stats.reset()
+    yield engine
+    engine.dispose()
+    db_pool.wait_stats.reset()
+
+
+def test_slow_connects_are_not_counted_as_waiting(engine):
+    @event.listens_for(engine, 'do_connect')
+    def slow_connect(dialect, connection_record, cargs, cparams):
+        time.sleep(0.3)
+
+    with engine.connect() as connection:
+        connection.execute(text('SELECT 1'))
+
+    wait = db_pool.wait_stats.snapshot()
+    assert wait['checkouts'] == 1
+    assert wait['max_wait_ms'] < 100
+
+
+def test_exhausted_pool_records_timeouts(engine):
+    with engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    wait = db_pool.wait_stats.snapshot()
+    assert wait['checkouts'] == 2
+    assert wait['timeouts'] == 1
+    assert wait['max_wait_ms'] >= 200
+
+
+def test_pool_status_reports_configured_limits(engine):
+    with engine.connect():
+        status = db_pool.pool_status(engine)
+
+    assert status['pool_class'] == 'InstrumentedQueuePool'
+    assert (status['size'], status['checked_out'], status['overflow']) == (1, 1, 0)
+    assert status['max_overflow'] == 0
+    assert status['wait']['checkouts'] == 1
+
+    engine.pool = engine.pool.recreate()
+    assert db_pool.pool_status(engine)['max_overflow'] == 0
@@ -0,0 +1,118 @@
+"""
+Replica routing against two SQLite files standing in for the primary and
+the replica. Each holds one environment named after its role, so the
+probe route shows which database served the request.
+"""
+import pytest
+from flask import jsonify
+
+from app import create_app, db
+from app.models import Environment
+from app.utils import db_routing
+from test.conftest import TestConfig
+
+
+@pytest.fixture
+def routing_app(tmp_path, monkeypatch):
+    primary, replica = tmp_path / 'primary.db', tmp_path / 'replica.db'
+    config = type('RoutingTestConfig', (TestConfig,), {
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{primary}',
+        'SQLALCHEMY_ENGINE_OPTIONS': {},
+        'SQLALCHEMY_BINDS': {'replica': f'sqlite:///{replica}'},
+        'REPLICA_READ_YOUR_WRITES_SECONDS': 5.0,
+        'REPLICA_MAX_LAG_SECONDS': 5.0,
+    })
+    # init_app registers a metadata per bind on the shared db; drop ours afterwards
+    known_binds = set(db.metadatas)
+    app = create_app(config)
+    monkeypatch.setattr(db_routing.lag_monitor, 'lag_seconds', lambda engine, interval: 0.0)
+
+    @app.route('/_probe', methods=['GET', 'POST'])
+    def probe():
+        served_by = Environment.query.order_by(Environment.id).first().name
+        return jsonify({'served_by': served_by})
+
+    @app.route('/_write', methods=['POST'])
+    def write():
+        db.session.add(Environment(name='Written'))
+        db.session.commit()
+        return jsonify({'ok': True}), 201
+
+    with app.app_context():
+        for bind_key, name in ((None, 'primary'), ('replica', 'replica')):
+            engine = db.engines[bind_key]
+            db.metadata.create_all(engine)
+            with engine.begin() as connection:
+                connection.execute(Environment.__table__.insert().values(name=name))
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+    for bind_key in set(db.metadatas) - known_binds:
+        del db.metadatas[bind_key]
+
+
+def _served_by(client, method='get', **kwargs):
+    return getattr(client, method)('/_probe', **kwargs).get_json()['served_by']
+
+
+def test_reads_go_to_replica_and_writes_to_primary(routing_app):
+    client = routing_app.test_client()
+
+    assert _served_by(client) == 'replica'
+    assert _served_by(client, 'post') == 'primary'
+
+
+def test_write_goes_to_primary_and_pins_client_to_it(routing_app):
+    client = routing_app.test_client()
+    response = client.post('/_write')
+
+    assert response.status_code == 201
+    token = response.headers[db_routing.LAST_WRITE_HEADER]
+    with routing_app.app_context():
+        names = {engine_key: [row.name for row in db.session.execute(
+            Environment.__table__.select(), bind_arguments={'bind': db.engines[engine_key]}
+        )] for engine_key in (None, 'replica')}
+    assert 'Written' in names[None]
+    assert 'Written' not in names['replica']
+
+    # The cookie keeps this client on the primary; a header does the same for others
+    assert _served_by(client) == 'primary'
+    assert _served_by(routing_app.test_client()) == 'replica'
+    assert _served_by(routing_app.test_client(), headers={db_routing.LAST_WRITE_HEADER: token}) == 'primary'
+
+
+def test_read_your_writes_window_expires(routing_app, monkeypatch):
+    client = routing_app.test_client()
+    client.post('/_write')
+    assert _served_by(client) == 'primary'
+
+    real_time = db_routing.time.time
+    monkeypatch.setattr('itsdangerous.timed.time.time', lambda: real_time() + 10)
+    assert _served_by(client) == 'replica'
+
+
+def test_forged_last_write_token_is_ignored(routing_app):
+    client = routing_app.test_client()
+
+    assert _served_by(client, headers={db_routing.LAST_WRITE_HEADER: 'forged'}) == 'replica'
+
+
+@pytest.mark.parametrize('lag', [30.0, None])
+def test_lagging_or_unmeasured_replica_falls_back_to_primary(routing_app, monkeypatch, lag):
+    monkeypatch.setattr(db_routing.lag_monitor, 'lag_seconds', lambda engine, interval: lag)
+
+    assert _served_by(routing_app.test_client()) == 'primary'
+
+
+def test_lag_monitor_caches_measurements(routing_app):
+    monitor = db_routing.ReplicaLagMonitor()
+    with routing_app.app_context():
+        engine = db.engines['replica']
+        assert monitor.lag_seconds(engine, interval=60) == 0.0
+        monitor._lag = 42.0
+        assert monitor.lag_seconds(engine, interval=60) == 42.0
+        assert monitor.lag_seconds(engine, interval=0) == 0.0
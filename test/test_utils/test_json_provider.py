@@ -0,0 +1,59 @@
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from app.utils.json_provider import OrjsonProvider
+
+
+@dataclass
+class Reading:
+    value: float
+    unit: str
+
+
+PAYLOAD = {
+    'title': 'Daily inspection',
+    'id': 7,
+    'created_at': datetime(2024, 1, 15, 9, 30, 5),
+    'due': date(2024, 2, 1),
+    'cost': Decimal('12.50'),
+    'token': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'reading': Reading(3.5, 'bar'),
+    'questions': [{'text': 'Guard in place?', 'order': n, 'remarks': None, 'ok': n % 2 == 0} for n in range(3)],
+}
+# The stdlib sorts int keys numerically; the provider falls back to it here
+BY_HOUR = {'by_hour': {9: 4, 10: 1, 2: 7}}
+
+
+@pytest.fixture
+def providers():
+    app = Flask(__name__)
+    return DefaultJSONProvider(app), OrjsonProvider(app), app
+
+
+def test_dumps_matches_default_provider(providers):
+    default, fast, _ = providers
+    for payload in (PAYLOAD, BY_HOUR):
+        for kwargs in ({}, {'separators': (',', ':')}, {'indent': 2}):
+            assert fast.dumps(payload, **kwargs) == default.dumps(payload, **kwargs)
+    assert fast.dumps({'id': 1}, separators=(',', ':')) == '{"id":1}'
+
+
+def test_response_body_matches_default_provider(providers):
+    default, fast, app = providers
+    with app.app_context():
+        for payload in (PAYLOAD, BY_HOUR):
+            assert fast.response(payload).get_data() == default.response(payload).get_data()
+        assert fast.response(PAYLOAD).mimetype == 'application/json'
+
+
+def test_loads(providers):
+    _, fast, _ = providers
+    assert fast.loads(b'{"a": [1, 2.5, null, "x"]}') == {'a': [1, 2.5, None, 'x']}
+    with pytest.raises(ValueError):
+        fast.loads('{not json')
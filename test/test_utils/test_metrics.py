@@ -0,0 +1,104 @@
+import json
+import os
+import threading
+
+import pytest
+from flask import Flask
+
+from app.utils import metrics
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """A private registry, so the app's own series stay untouched"""
+    counter = metrics.Counter('jobs_total', 'Jobs.', ('queue',))
+    gauge = metrics.Gauge('jobs_running', 'Running jobs.')
+    histogram = metrics.Histogram('job_seconds', 'Job time.', buckets=(1.0, 5.0))
+    monkeypatch.setattr(metrics, 'REGISTRY', [counter, gauge, histogram])
+    return counter, gauge, histogram
+
+
+def _run_in_threads(target, count=4):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def _write_worker_file(directory, pid, data):
+    with open(os.path.join(directory, f'metrics_{pid}.json'), 'w') as fh:
+        json.dump(data, fh)
+
+
+def test_exited_thread_shards_are_folded(registry):
+    counter, _, histogram = registry
+
+    def work():
+        counter.inc('mail')
+        histogram.observe(2.0)
+
+    _run_in_threads(work)
+
+    assert counter.values() == {('mail',): 4.0}
+    assert histogram.values() == {(): [[0, 4, 0], 8.0]}
+    assert counter._shards == [] and histogram._shards == []
+
+    _run_in_threads(work)
+    assert counter.values() == {('mail',): 8.0}
+
+
+def test_collect_merges_other_workers(registry, tmp_path):
+    counter, gauge, histogram = registry
+    counter.inc('mail', amount=2)
+    gauge.inc()
+    histogram.observe(0.5)
+    _write_worker_file(tmp_path, 4242, {
+        'jobs_total': [[['mail'], 3.0], [['sms'], 1.0]],
+        'jobs_running': [[[], 2.0]],
+        'job_seconds': [[[], [[0, 1, 0], 3.0]]],
+    })
+
+    values = metrics.collect(str(tmp_path))
+
+    assert values['jobs_total'] == {('mail',): 5.0, ('sms',): 1.0}
+    assert values['jobs_running'] == {(): 3.0}
+    assert values['job_seconds'] == {(): [[1, 1, 0], 3.5]}
+
+
+def test_own_flushed_file_is_not_counted_twice(registry, tmp_path):
+    counter, _, _ = registry
+    counter.inc('mail')
+
+    metrics.flush(str(tmp_path))
+
+    assert os.path.exists(tmp_path / f'metrics_{os.getpid()}.json')
+    assert metrics.collect(str(tmp_path))['jobs_total'] == {('mail',): 1.0}
+
+
+def test_dead_worker_counters_persist_and_gauges_drop(registry, tmp_path):
+    for pid, jobs in ((4242, 3.0), (4343, 2.0)):
+        _write_worker_file(tmp_path, pid, {
+            'jobs_total': [[['mail'], jobs]],
+            'jobs_running': [[[], 1.0]],
+            'job_seconds': [[[], [[1, 0, 0], 0.5]]],
+        })
+    before = metrics.collect(str(tmp_path))
+
+    metrics.mark_process_dead(4242, str(tmp_path))
+    metrics.mark_process_dead(4343, str(tmp_path))
+    after = metrics.collect(str(tmp_path))
+
+    assert not (tmp_path / 'metrics_4242.json').exists()
+    assert (tmp_path / metrics.DEAD_FILE).exists()
+    assert after['jobs_total'] == before['jobs_total'] == {('mail',): 5.0}
+    assert after['job_seconds'] == before['job_seconds'] == {(): [[2, 0, 0], 1.0]}
+    assert before['jobs_running'] == {(): 2.0}
+    assert after['jobs_running'] == {}
+
+
+def test_metrics_are_off_by_default():
+    app = Flask(__name__)
+    metrics.init_metrics(app)
+
+    assert app.config['METRICS_ENABLED'] is False
@@ -0,0 +1,129 @@
+import json
+import os
+import threading
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+
+from app.utils import tracing
+from app.utils.metrics import TRACES_DROPPED_SPANS
+
+TRACE_ID = '4bf92f3577b34da6a3ce929d0e0e4736'
+PARENT_ID = '00f067aa0ba902b7'
+
+
+def _trace(spans=2):
+    trace = tracing.Trace()
+    root = tracing.Span(trace, 'GET /', 'http', None, {})
+    for _ in range(spans - 1):
+        tracing.Span(trace, 'child', 'service', root, {}).finish()
+    root.finish()
+    return trace
+
+
+class BlockingExporter(tracing.SpanExporter):
+    """Records batches; exports wait until released"""
+
+    def __init__(self, expected=0, **options):
+        super().__init__(**options)
+        self.expected = expected
+        self.batches = []
+        self.release = threading.Event()
+        self.exported = threading.Event()
+
+    def export(self, traces):
+        self.release.wait(5)
+        self.batches.append(traces)
+        if sum(len(batch) for batch in self.batches) >= self.expected:
+            self.exported.set()
+
+
+def test_full_queue_drops_and_counts_spans():
+    exporter = BlockingExporter(queue_size=2)
+    # Pretend the worker already runs in this process, so nothing drains the queue
+    exporter._pid = os.getpid()
+    dropped_before = TRACES_DROPPED_SPANS.values().get((), 0.0)
+
+    assert [exporter.submit(_trace()) for _ in range(2)] == [True, True]
+    assert exporter.submit(_trace(spans=3)) is False
+    assert exporter.submit(_trace(spans=2)) is False
+
+    assert exporter.dropped_spans == 5
+    assert TRACES_DROPPED_SPANS.values()[()] - dropped_before == 5
+    assert exporter._queue.qsize() == 2
+
+
+def test_exporter_sends_batches():
+    exporter = BlockingExporter(expected=25, queue_size=100, batch_size=10, batch_delay=0.5)
+    for _ in range(25):
+        exporter.submit(_trace())
+    exporter.release.set()
+
+    assert exporter.exported.wait(5)
+    assert sum(len(batch) for batch in exporter.batches) == 25
+    assert all(len(batch) <= 10 for batch in exporter.batches)
+    assert len(exporter.batches) < 25
+
+
+def test_jsonl_and_otlp_export_whole_batches(tmp_path):
+    traces = [_trace(), _trace(spans=3)]
+
+    jsonl = tracing.JsonlExporter(str(tmp_path / 'traces.jsonl'))
+    jsonl.export(traces)
+    lines = [json.loads(line) for line in (tmp_path / 'traces.jsonl').read_text().splitlines()]
+    assert [line['trace_id'] for line in lines] == [traces[0].trace_id] * 2 + [traces[1].trace_id] * 3
+
+    payload = tracing.OtlpHttpExporter('http://collector', 'api').payload(traces)
+    spans = payload['resourceSpans'][0]['scopeSpans'][0]['spans']
+    assert [s['traceId'] for s in spans] == [span['trace_id'] for span in lines]
+
+
+@pytest.mark.parametrize('header, expected', [
+    (f'00-{TRACE_ID}-{PARENT_ID}-01', (TRACE_ID, PARENT_ID, True)),
+    (f'00-{TRACE_ID}-{PARENT_ID}-00', (TRACE_ID, PARENT_ID, False)),
+    (f'00-{"0" * 32}-{PARENT_ID}-01', (None, None, None)),
+    (f'00-{TRACE_ID.upper()}-{PARENT_ID}-01', (None, None, None)),
+    (f'00-{TRACE_ID}-{PARENT_ID}-zz', (None, None, None)),
+    (None, (None, None, None)),
+])
+def test_parse_traceparent(header, expected):
+    assert tracing._parse_traceparent(header) == expected
+
+
+@pytest.fixture
+def traced_app(tmp_path):
+    def make(**config):
+        app = Flask(__name__)
+        app.config.update(TRACING_ENABLED=True, TRACING_JSONL_PATH=str(tmp_path / 'traces.jsonl'), **config)
+
+        @app.route('/ping')
+        def ping():
+            return 'pong'
+
+        tracing.init_tracing(app, SimpleNamespace(engines={}))
+        return app.test_client()
+    return make
+
+
+def test_client_sampled_flag_does_not_bypass_sample_rate(traced_app):
+    client = traced_app(TRACING_SAMPLE_RATE=0.0)
+    headers = {'traceparent': f'00-{TRACE_ID}-{PARENT_ID}-01'}
+
+    assert 'X-Trace-Id' not in client.get('/ping', headers=headers).headers
+
+
+def test_trusted_parent_decides_sampling(traced_app):
+    client = traced_app(TRACING_SAMPLE_RATE=0.0, TRACING_TRUST_PARENT=True)
+
+    sampled = client.get('/ping', headers={'traceparent': f'00-{TRACE_ID}-{PARENT_ID}-01'})
+    assert sampled.headers['X-Trace-Id'] == TRACE_ID
+    unsampled = client.get('/ping', headers={'traceparent': f'00-{TRACE_ID}-{PARENT_ID}-00'})
+    assert 'X-Trace-Id' not in unsampled.headers
+
+
+def test_sampled_request_continues_the_incoming_trace(traced_app):
+    client = traced_app(TRACING_SAMPLE_RATE=1.0)
+
+    response = client.get('/ping', headers={'traceparent': f'00-{TRACE_ID}-{PARENT_ID}-00'})
+    assert response.headers['X-Trace-Id'] == TRACE_ID